@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import queue
 import threading
+import time
+from bisect import bisect_left
 from collections.abc import Callable
 from dataclasses import dataclass, field, replace
 from datetime import datetime
@@ -11,18 +13,29 @@ from pathlib import Path
 from typing import TypedDict
 
 from .assets import ResolvedAssets, resolve_assets
-from .audio import AudioPlayer
+from .audio import AdaptiveBufferPolicy, AudioPlayer, NullAudioPlayer
 from .backends import BackendSelectionError, select_backend
 from .config import AppConfig, load_config
-from .controller import ControllerEvent, PlaybackController
-from .errors import classify_exception, to_user_message
-from .export import save_speech_to_mp3
-from .monitoring import HealthStatus, MetricsStore, start_health_server
+from .controller import ControllerEvent, PlaybackController, PlaybackState, _accepts_keyword
+from .document import PAGE_SEPARATOR, DocumentModel
+from .errors import KookieError, classify_exception, to_user_message
+from .events import EventDispatcher
+from .export import (
+    ExportCancelledError,
+    partition_pages,
+    partition_sentences,
+    save_speech_segmented,
+    save_speech_to_mp3,
+)
+from .jobs import ExportJob, ExportJobContext, ExportJobQueue, ExportJobState
+from .monitoring import HealthStatus, MetricsStore, SynthesisService, start_health_server
+from .network import network_probe_for
 from .pdf_import import PdfImportResult, extract_pdf_content
 from .preload import preload_assets
 from .telemetry import LocalTelemetry
-from .text_processing import normalize_text
-from .update_checker import UpdateInfo, check_for_update
+from .text_processing import normalize_text, normalized_offsets, split_sentences
+from .tracing import DEFAULT_TRACE_CAPACITY, tracer
+from .update_checker import UpdateCheck, UpdateCheckCache, UpdateInfo, run_update_check
 
 
 class StartupPrompt(TypedDict):
@@ -32,6 +45,16 @@ class StartupPrompt(TypedDict):
     actions: tuple[str, ...]
 
 
+# Runtime fields whose changes are published to ``AppRuntime.subscribe`` listeners.
+_OBSERVED_FIELDS = frozenset(
+    {"text", "status_message", "voice_status", "backend_status", "selected_voice", "document", "update_info"}
+)
+UPDATE_CACHE_FILENAME = "update_check.json"
+# Lower bound on the background update-check interval, whatever the configuration says.
+MIN_UPDATE_CHECK_INTERVAL_SECONDS = 60.0
+_UNSET = object()
+
+
 @dataclass(slots=True)
 class AppRuntime:
     config: AppConfig
@@ -43,25 +66,69 @@ class AppRuntime:
     voice_status: str = "Voice: Missing"
     backend_status: str = "Backend: Unknown"
     selected_voice: str = "af_sarah"
+    document: DocumentModel | None = None
+    update_info: UpdateInfo | None = None
+    _document_text: str = field(default="", init=False, repr=False)
     _mp3_save_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
-    _mp3_save_thread: threading.Thread | None = field(default=None, init=False, repr=False)
     _mp3_save_results: queue.Queue[tuple[Path | None, Exception | None]] = field(
         default_factory=queue.Queue,
         init=False,
         repr=False,
     )
-    _is_saving_mp3: bool = field(default=False, init=False, repr=False)
+    _mp3_saves_pending: int = field(default=0, init=False, repr=False)
+    _export_jobs: ExportJobQueue | None = field(default=None, init=False, repr=False)
     _pdf_load_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
     _pdf_load_thread: threading.Thread | None = field(default=None, init=False, repr=False)
-    _pdf_load_results: queue.Queue[tuple[str | None, Path | None, bool, Exception | None]] = field(
+    _pdf_load_results: queue.Queue[tuple[PdfImportResult | None, Path | None, Exception | None]] = field(
         default_factory=queue.Queue,
         init=False,
         repr=False,
     )
     _is_loading_pdf: bool = field(default=False, init=False, repr=False)
+    _pdf_stream_pages: list[str] = field(default_factory=list, init=False, repr=False)
+    _pdf_stream_polled: int = field(default=0, init=False, repr=False)
     telemetry: LocalTelemetry | None = field(default=None, repr=False)
     metrics: MetricsStore = field(default_factory=MetricsStore, repr=False)
     _health_server: object | None = field(default=None, init=False, repr=False)
+    _change_listeners: list[Callable[[str], None]] = field(default_factory=list, init=False, repr=False)
+    _update_thread: threading.Thread | None = field(default=None, init=False, repr=False)
+    _event_dispatcher: EventDispatcher[ControllerEvent] | None = field(default=None, init=False, repr=False)
+    _update_stop: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name not in _OBSERVED_FIELDS:
+            object.__setattr__(self, name, value)
+            return
+        previous = getattr(self, name, _UNSET)
+        object.__setattr__(self, name, value)
+        if previous is _UNSET:
+            return
+        changed = previous != value if isinstance(value, str) else previous is not value
+        if changed:
+            self._notify_change(name)
+
+    def subscribe(self, listener: Callable[[str], None]) -> Callable[[], None]:
+        """Call ``listener(topic)`` whenever observable state changes; returns an unsubscribe function.
+
+        Listeners may run on worker threads and must hand off to their own thread before touching UI state.
+        """
+        self._change_listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            if listener in self._change_listeners:
+                self._change_listeners.remove(listener)
+
+        return _unsubscribe
+
+    def _notify_change(self, topic: str) -> None:
+        listeners = getattr(self, "_change_listeners", None)
+        if not listeners:
+            return
+        for listener in tuple(listeners):
+            try:
+                listener(topic)
+            except Exception:
+                pass
 
     @property
     def status_bar_items(self) -> list[str]:
@@ -77,6 +144,10 @@ class AppRuntime:
 
     def set_text(self, value: str) -> None:
         self.text = normalize_text(value)
+        if self.document is not None and self.text != self._document_text:
+            # Edits invalidate the page index; fall back to whole-text processing.
+            self.document = None
+            self._document_text = ""
 
     def play(self) -> bool:
         if not self.text:
@@ -84,18 +155,72 @@ class AppRuntime:
             self.metrics.increment("play_rejected_empty_text")
             return False
 
-        started = self.controller.start(self.text, voice=self.selected_voice)
+        # Play during playback queues a restart from the top without waiting for the old session to wind down;
+        # sentences already synthesized are replayed, not redone.
+        restarting = self.controller.state not in {PlaybackState.IDLE, PlaybackState.ERROR}
+        started = self.controller.restart(self.text, voice=self.selected_voice)
         if not started:
             self.status_message = "Playback is already running."
             self.metrics.increment("play_rejected")
             if self.telemetry is not None:
                 self.telemetry.record("play_rejected", {"reason": "already_running"})
             return False
+        if restarting:
+            self.metrics.increment("play_restarted")
         self.metrics.increment("play_started")
         if self.telemetry is not None:
             self.telemetry.record("play_started", {"voice": self.selected_voice, "text_len": len(self.text)})
         return started
 
+    def play_page(self, page_number: int) -> bool:
+        if self.document is None or not self.document.has_page(page_number):
+            self.status_message = f"Page {page_number} is not available."
+            return False
+
+        page_start, _page_end = self.document.page_span(page_number)
+        # ``text`` is the normalized buffer, so page offsets into the buffer are mapped onto it first.
+        source_text: str | None = None
+        text_offset = page_start
+        if self.text == normalize_text(self.document.buffer):
+            text_offset = bisect_left(normalized_offsets(self.document.buffer), page_start)
+            source_text = self.text[text_offset:]
+        started = self.controller.start_sentences(
+            self.document.sentences_from_page(page_number),
+            voice=self.selected_voice,
+            source_text=source_text,
+            text_offset=text_offset,
+        )
+        if not started:
+            self.status_message = "Playback is already running."
+            self.metrics.increment("play_rejected")
+            return False
+        self.metrics.increment("play_started")
+        if self.telemetry is not None:
+            self.telemetry.record("play_started", {"voice": self.selected_voice, "page": page_number})
+        return True
+
+    def play_from_offset(self, offset: int) -> bool:
+        """Play the document from a character offset, e.g. the cursor of the virtualized document view."""
+        start = min(max(0, int(offset)), len(self.text))
+        remaining = self.text[start:]
+        if not remaining.strip():
+            self.status_message = "Nothing to play after the cursor."
+            self.metrics.increment("play_rejected_empty_text")
+            return False
+
+        restarting = self.controller.state not in {PlaybackState.IDLE, PlaybackState.ERROR}
+        started = self.controller.restart(remaining, voice=self.selected_voice, text_offset=start)
+        if not started:
+            self.status_message = "Playback is already running."
+            self.metrics.increment("play_rejected")
+            return False
+        if restarting:
+            self.metrics.increment("play_restarted")
+        self.metrics.increment("play_started")
+        if self.telemetry is not None:
+            self.telemetry.record("play_started", {"voice": self.selected_voice, "offset": start})
+        return True
+
     def stop(self) -> bool:
         stopped = self.controller.stop()
         if stopped:
@@ -104,19 +229,25 @@ class AppRuntime:
             self.telemetry.record("play_stopped", {"stopped": stopped})
         return stopped
 
-    def save_mp3(self, output_path: Path | None = None) -> Path | None:
+    def save_mp3(
+        self,
+        output_path: Path | None = None,
+        *,
+        page_range: tuple[int, int] | None = None,
+    ) -> Path | None:
         if not self.text:
             self.status_message = "Enter text in the text area."
             return None
 
         selected_output = output_path or _default_mp3_output_path()
         try:
-            saved_path = save_speech_to_mp3(
+            saved_path = self._write_mp3(
                 backend=self.backend,
                 text=self.text,
                 voice=self.selected_voice,
                 sample_rate=self.config.sample_rate,
                 output_path=selected_output,
+                pages=self._export_pages(page_range),
             )
         except Exception as exc:
             error = classify_exception(exc)
@@ -138,56 +269,85 @@ class AppRuntime:
     @property
     def is_saving_mp3(self) -> bool:
         with self._mp3_save_lock:
-            return self._is_saving_mp3
+            return self._mp3_saves_pending > 0
 
-    def start_mp3_save(self, output_path: Path | None = None) -> bool:
-        if not self.text:
+    def start_mp3_save(
+        self,
+        output_path: Path | None = None,
+        *,
+        page_range: tuple[int, int] | None = None,
+    ) -> bool:
+        return self.queue_export(output_path, page_range=page_range) is not None
+
+    def queue_export(
+        self,
+        output_path: Path | None = None,
+        *,
+        text: str | None = None,
+        page_range: tuple[int, int] | None = None,
+    ) -> str | None:
+        """Queue an MP3 export and return its job id; results arrive through ``poll_mp3_save``."""
+        selected_text = self.text if text is None else normalize_text(text)
+        if not selected_text:
             self.status_message = "Enter text in the text area."
-            return False
+            return None
 
         selected_output = output_path or _default_mp3_output_path()
+        try:
+            pages = self._export_pages(page_range, whole_document=text is None)
+        except ValueError as exc:
+            self.status_message = f"Unable to save MP3: {exc}"
+            return None
 
-        with self._mp3_save_lock:
-            if self._is_saving_mp3:
-                self.status_message = "MP3 save is already in progress."
-                return False
+        backend = self.backend
+        voice = self.selected_voice
+        sample_rate = self.config.sample_rate
 
-            self._clear_mp3_save_results()
-            self._is_saving_mp3 = True
-            self.status_message = "Saving MP3..."
-            save_thread = threading.Thread(
-                target=self._run_mp3_save_worker,
-                kwargs={
-                    "backend": self.backend,
-                    "text": self.text,
-                    "voice": self.selected_voice,
-                    "sample_rate": self.config.sample_rate,
-                    "output_path": selected_output,
-                },
-                daemon=True,
-                name="kookie-save-mp3",
+        def _work(context: ExportJobContext) -> Path:
+            started = time.perf_counter()
+            saved = self._write_mp3(
+                backend=backend,
+                text=selected_text,
+                voice=voice,
+                sample_rate=sample_rate,
+                output_path=selected_output,
+                pages=pages,
+                progress_callback=context.report_progress,
+                cancel_event=context.cancel_event,
             )
-            self._mp3_save_thread = save_thread
+            self.metrics.observe("export_duration_seconds", time.perf_counter() - started)
+            return saved
 
-        save_thread.start()
-        return True
+        with self._mp3_save_lock:
+            self._mp3_saves_pending += 1
+        jobs = self._job_queue()
+        job_id = jobs.submit(_work, output_path=selected_output)
+        queued = jobs.waiting_count
+        self.status_message = f"Saving MP3... ({queued} queued)" if queued else "Saving MP3..."
+        return job_id
+
+    def export_jobs(self) -> list[ExportJob]:
+        return self._job_queue().jobs()
+
+    def cancel_export(self, job_id: str) -> bool:
+        return self._job_queue().cancel(job_id)
 
     def poll_mp3_save(self) -> None:
-        latest_result: tuple[Path | None, Exception | None] | None = None
         while True:
             try:
-                latest_result = self._mp3_save_results.get_nowait()
+                saved_path, error = self._mp3_save_results.get_nowait()
             except queue.Empty:
-                break
-
-        if latest_result is None:
-            return
+                return
 
-        saved_path, error = latest_result
+            with self._mp3_save_lock:
+                self._mp3_saves_pending = max(0, self._mp3_saves_pending - 1)
+            self._report_mp3_save(saved_path, error)
 
-        with self._mp3_save_lock:
-            self._is_saving_mp3 = False
-            self._mp3_save_thread = None
+    def _report_mp3_save(self, saved_path: Path | None, error: Exception | None) -> None:
+        if isinstance(error, ExportCancelledError):
+            self.status_message = "MP3 save cancelled."
+            self.metrics.increment("save_mp3_cancelled")
+            return
 
         if error is not None:
             categorized = classify_exception(error)
@@ -220,7 +380,9 @@ class AppRuntime:
                 self.status_message = f"Loading PDF page {current} of {total}..."
 
             # We enable OCR fallback by default for user PDF imports now.
+            started = time.perf_counter()
             result = loader(pdf_path, use_ocr_fallback=True, progress_callback=_progress)
+            self._observe_pdf_rate(result, time.perf_counter() - started)
             text = result.text
         except Exception as exc:
             error = classify_exception(exc)
@@ -233,7 +395,7 @@ class AppRuntime:
                 )
             return None
 
-        self.set_text(text)
+        self._apply_document(result)
         if result.used_ocr:
             self.status_message = f"Loaded PDF (with OCR): {pdf_path.name}"
         else:
@@ -257,6 +419,7 @@ class AppRuntime:
         pdf_path: Path,
         *,
         loader: Callable[..., PdfImportResult] = extract_pdf_content,
+        stream_playback: bool = False,
     ) -> bool:
         with self._pdf_load_lock:
             if self._is_loading_pdf:
@@ -265,12 +428,19 @@ class AppRuntime:
 
             self._clear_pdf_load_results()
             self._is_loading_pdf = True
+            self._pdf_stream_pages = []
+            self._pdf_stream_polled = 0
+            # Streaming only takes over the controller when nothing else is playing.
+            streaming = stream_playback and self.controller.start_stream(voice=self.selected_voice)
+            if streaming:
+                self.metrics.increment("play_started")
             self.status_message = f"Loading PDF: {pdf_path.name}..."
             load_thread = threading.Thread(
                 target=self._run_pdf_load_worker,
                 kwargs={
                     "pdf_path": pdf_path,
                     "loader": loader,
+                    "streaming": streaming,
                 },
                 daemon=True,
                 name="kookie-load-pdf",
@@ -281,7 +451,7 @@ class AppRuntime:
         return True
 
     def poll_pdf_load(self) -> tuple[str | None, Path | None]:
-        latest_result: tuple[str | None, Path | None, bool, Exception | None] | None = None
+        latest_result: tuple[PdfImportResult | None, Path | None, Exception | None] | None = None
         while True:
             try:
                 latest_result = self._pdf_load_results.get_nowait()
@@ -291,7 +461,7 @@ class AppRuntime:
         if latest_result is None:
             return None, None
 
-        text, path, used_ocr, error = latest_result
+        result, path, error = latest_result
 
         with self._pdf_load_lock:
             self._is_loading_pdf = False
@@ -308,9 +478,9 @@ class AppRuntime:
                 )
             return None, None
 
-        if text is not None and path is not None:
-            self.set_text(text)
-            if used_ocr:
+        if result is not None and path is not None:
+            self._apply_document(result)
+            if result.used_ocr:
                 self.status_message = f"Loaded PDF (with OCR): {path.name}"
             else:
                 self.status_message = f"Loaded PDF: {path.name}"
@@ -318,12 +488,20 @@ class AppRuntime:
             if self.telemetry is not None:
                 self.telemetry.record(
                     "pdf_loaded", 
-                    {"path": str(path), "text_len": len(self.text), "ocr": used_ocr}
+                    {"path": str(path), "text_len": len(self.text), "ocr": result.used_ocr}
                 )
-            return text, path
+            return result.text, path
 
         return None, None
 
+    def poll_pdf_stream(self) -> str | None:
+        """Return the text extracted so far when new pages arrived since the last poll."""
+        with self._pdf_load_lock:
+            if len(self._pdf_stream_pages) == self._pdf_stream_polled:
+                return None
+            self._pdf_stream_polled = len(self._pdf_stream_pages)
+            return PAGE_SEPARATOR.join(self._pdf_stream_pages)
+
     def _clear_pdf_load_results(self) -> None:
         while True:
             try:
@@ -336,19 +514,41 @@ class AppRuntime:
         *,
         pdf_path: Path,
         loader: Callable[..., PdfImportResult],
+        streaming: bool = False,
     ) -> None:
         try:
             def _progress(current: int, total: int) -> None:
                 # Direct assignment is safe from background thread for this simple string
                 self.status_message = f"Loading PDF page {current} of {total}..."
 
-            result = loader(pdf_path, use_ocr_fallback=True, progress_callback=_progress)
-            self._pdf_load_results.put((result.text, pdf_path, result.used_ocr, None))
+            def _on_page(_page_number: int, page_text: str) -> None:
+                with self._pdf_load_lock:
+                    self._pdf_stream_pages.append(page_text)
+                self._notify_change("pdf_stream")
+                if streaming:
+                    self.controller.feed_text(page_text)
+
+            started = time.perf_counter()
+            options: dict[str, object] = {"use_ocr_fallback": True, "progress_callback": _progress}
+            if _accepts_keyword(loader, "page_callback"):
+                options["page_callback"] = _on_page
+            result = loader(pdf_path, **options)
+            self._observe_pdf_rate(result, time.perf_counter() - started)
+            if streaming and not self._pdf_stream_pages:
+                # Whole-document OCR fallbacks produce text without per-page callbacks.
+                self.controller.feed_text(result.text)
+            self._pdf_load_results.put((result, pdf_path, None))
         except Exception as exc:
-            self._pdf_load_results.put((None, pdf_path, False, exc))
+            self._pdf_load_results.put((None, pdf_path, exc))
+        finally:
+            if streaming:
+                self.controller.finish_stream()
+            self._notify_change("pdf_load")
 
     def wait_until_idle(self, timeout: float = 5.0) -> None:
         self.controller.wait_until_idle(timeout=timeout)
+        if self._event_dispatcher is not None:
+            self._event_dispatcher.flush(timeout=timeout)
 
     def shutdown(self) -> None:
         try:
@@ -357,6 +557,16 @@ class AppRuntime:
         except Exception:
             pass
 
+        self._update_stop.set()
+        if self._event_dispatcher is not None:
+            self._event_dispatcher.close(timeout=0.2)
+        export_jobs = self._export_jobs
+        if export_jobs is not None:
+            export_jobs.shutdown(cancel_pending=True)
+
+        if self.telemetry is not None:
+            self.telemetry.close()
+
         server = self._health_server
         if server is None:
             return
@@ -394,6 +604,16 @@ class AppRuntime:
     def playback_progress(self) -> dict[str, int]:
         return self.controller.progress
 
+    @property
+    def playback_highlight(self) -> tuple[int, int] | None:
+        """Span of ``text`` being spoken right now, or None when nothing is playing."""
+        if self.controller.state not in {PlaybackState.PLAYING, PlaybackState.PAUSED}:
+            return None
+        spoken = self.controller.spoken_sentence
+        if spoken is None or spoken.text_end <= spoken.text_start:
+            return None
+        return spoken.text_start, spoken.text_end
+
     def set_voice(self, voice: str) -> str:
         selected = voice.strip() if isinstance(voice, str) else ""
         if not selected:
@@ -416,35 +636,93 @@ class AppRuntime:
     def check_for_updates(
         self,
         *,
-        checker: Callable[..., UpdateInfo | None] = check_for_update,
+        checker: Callable[..., UpdateCheck | UpdateInfo | None] = run_update_check,
     ) -> UpdateInfo | None:
         if not getattr(self.config, "update_check_enabled", True):
             return None
 
         try:
-            info = checker(
-                current_version=_current_app_version(),
-                repo=self.config.update_repo,
-            )
+            info = self._query_updates(checker)
         except Exception as exc:
-            categorized = classify_exception(exc)
+            categorized = self._record_update_check_failure(exc)
             self.status_message = f"Unable to check for updates: {to_user_message(categorized)}"
-            self.metrics.increment("update_check_failed")
-            if self.telemetry is not None:
-                self.telemetry.record(
-                    "update_check_failed",
-                    {"error_code": categorized.code.value, "category": categorized.category.value},
-                )
             return None
 
         if info is None:
             return None
-
         self.status_message = f"Update available: {info.version} ({info.url})"
-        if self.telemetry is not None:
+        return info
+
+    def _query_updates(self, checker: Callable[..., UpdateCheck | UpdateInfo | None]) -> UpdateInfo | None:
+        """Run ``checker`` and publish its answer in ``update_info``.
+
+        ``checker`` returns an ``UpdateCheck``, or a bare ``UpdateInfo``/None for a check that ran. A skipped
+        check (offline) keeps the last published update.
+        """
+        result = checker(
+            current_version=_current_app_version(),
+            repo=self.config.update_repo,
+            network_probe=network_probe_for(self.config),
+            cache_path=_update_cache_path(self.config),
+        )
+        if isinstance(result, UpdateCheck):
+            if result.skipped:
+                return None
+            info = result.info
+        else:
+            info = result
+        self.update_info = info
+        if info is not None and self.telemetry is not None:
             self.telemetry.record("update_available", {"version": info.version, "url": info.url})
         return info
 
+    def _record_update_check_failure(self, exc: Exception) -> KookieError:
+        categorized = classify_exception(exc)
+        self.metrics.increment("update_check_failed")
+        if self.telemetry is not None:
+            self.telemetry.record(
+                "update_check_failed",
+                {"error_code": categorized.code.value, "category": categorized.category.value},
+            )
+        return categorized
+
+    def start_update_checks(
+        self, *, checker: Callable[..., UpdateCheck | UpdateInfo | None] = run_update_check
+    ) -> None:
+        """Publish the cached update right away, then re-check on a background thread once per interval."""
+        if not getattr(self.config, "update_check_enabled", True) or self._update_thread is not None:
+            return
+        cache = UpdateCheckCache.load(_update_cache_path(self.config))
+        cached = cache.update_for(_current_app_version())
+        if cached is not None:
+            self.update_info = cached
+            if self.status_message == "Ready":
+                self.status_message = f"Update available: {cached.version} ({cached.url})"
+
+        interval = max(
+            MIN_UPDATE_CHECK_INTERVAL_SECONDS,
+            float(getattr(self.config, "update_check_interval_hours", 24.0)) * 3600.0,
+        )
+        first_wait = 0.0 if cache.checked_at is None else cache.checked_at + interval - time.time()
+        self._update_thread = threading.Thread(
+            target=self._run_update_checks,
+            args=(checker, interval, min(interval, max(0.0, first_wait))),
+            daemon=True,
+            name="kookie-update-check",
+        )
+        self._update_thread.start()
+
+    def _run_update_checks(
+        self, checker: Callable[..., UpdateCheck | UpdateInfo | None], interval: float, wait: float
+    ) -> None:
+        # Only ``update_info`` is published from here; the status line belongs to what the user is doing.
+        while not self._update_stop.wait(wait):
+            wait = interval
+            try:
+                self._query_updates(checker)
+            except Exception as exc:
+                self._record_update_check_failure(exc)
+
     def health_status(self) -> HealthStatus:
         return HealthStatus(
             status="ok" if self.assets.ready else "degraded",
@@ -453,14 +731,22 @@ class AppRuntime:
             details={
                 "state": self.controller.state.value,
                 "metrics": self.metrics.snapshot(),
+                "underruns": _underrun_snapshot(self.controller.audio_player),
             },
         )
 
+    def export_trace(self, output_path: Path) -> Path:
+        """Write recorded spans as Chrome trace-event JSON (load in chrome://tracing or Perfetto)."""
+        return tracer.export_chrome_trace(output_path)
+
     @property
     def backend_name(self) -> str:
         return getattr(self.backend, "name", self.backend.__class__.__name__.lower())
 
     def on_controller_event(self, event: ControllerEvent) -> None:
+        self._notify_change("playback")
+        if event.kind == "progress":
+            return
         if event.kind == "error":
             error = classify_exception(RuntimeError(event.message))
             self.status_message = f"Speech generation failed: {to_user_message(error)}"
@@ -481,14 +767,7 @@ class AppRuntime:
         elif event.state.value == "stopping":
             self.status_message = "Stopping"
 
-    def _clear_mp3_save_results(self) -> None:
-        while True:
-            try:
-                self._mp3_save_results.get_nowait()
-            except queue.Empty:
-                return
-
-    def _run_mp3_save_worker(
+    def _write_mp3(
         self,
         *,
         backend: object,
@@ -496,20 +775,81 @@ class AppRuntime:
         voice: str,
         sample_rate: int,
         output_path: Path,
-    ) -> None:
-        try:
-            saved_path = save_speech_to_mp3(
+        pages: list[list[str]] | None,
+        progress_callback: Callable[[str, int], None] | None = None,
+        cancel_event: threading.Event | None = None,
+    ) -> Path:
+        segment_minutes = float(getattr(self.config, "export_segment_minutes", 0.0))
+        if segment_minutes <= 0:
+            sentences = [sentence for page in pages for sentence in page] if pages is not None else None
+            return save_speech_to_mp3(
                 backend=backend,
                 text=text,
                 voice=voice,
                 sample_rate=sample_rate,
                 output_path=output_path,
+                sentences=sentences,
+                progress_callback=progress_callback,
+                cancel_event=cancel_event,
             )
-        except Exception as exc:
-            self._mp3_save_results.put((None, exc))
-            return
 
-        self._mp3_save_results.put((saved_path, None))
+        if pages is not None:
+            segments = partition_pages(pages, segment_minutes=segment_minutes)
+        else:
+            segments = partition_sentences(split_sentences(normalize_text(text)), segment_minutes=segment_minutes)
+        return save_speech_segmented(
+            backend=backend,
+            segments=segments,
+            voice=voice,
+            sample_rate=sample_rate,
+            output_path=output_path,
+            max_workers=int(getattr(self.config, "export_workers", 0)) or None,
+            progress_callback=progress_callback,
+            cancel_event=cancel_event,
+        )
+
+    def _export_pages(
+        self, page_range: tuple[int, int] | None, *, whole_document: bool = True
+    ) -> list[list[str]] | None:
+        """Sentences to export grouped by page, or None when the text has no pages."""
+        if page_range is not None:
+            if self.document is None:
+                raise ValueError("Page ranges require a loaded PDF.")
+            return self.document.page_sentences(*page_range)
+        if whole_document and self.document is not None and self.text == normalize_text(self.document.buffer):
+            return self.document.page_sentences()
+        return None
+
+    def _apply_document(self, result: PdfImportResult) -> None:
+        self.set_text(result.text)
+        self.document = result.document
+        self._document_text = self.text if result.document is not None else ""
+
+    def _observe_pdf_rate(self, result: PdfImportResult, elapsed: float) -> None:
+        pages = len(result.pages_loaded) or (result.document.page_count if result.document is not None else 0)
+        if pages and elapsed > 0:
+            self.metrics.observe("pdf_pages_per_second", pages / elapsed)
+
+    def _job_queue(self) -> ExportJobQueue:
+        with self._mp3_save_lock:
+            if self._export_jobs is None:
+                self._export_jobs = ExportJobQueue(
+                    max_concurrency=_export_concurrency(self.config, self.backend),
+                    on_change=self._on_export_job_change,
+                )
+            return self._export_jobs
+
+    def _on_export_job_change(self, job: ExportJob) -> None:
+        export_jobs = self._export_jobs
+        if export_jobs is not None:
+            self.metrics.set_gauge("export_jobs_pending", export_jobs.pending_count)
+        if job.state is ExportJobState.COMPLETED:
+            self._mp3_save_results.put((job.result_path, None))
+        elif job.state is ExportJobState.FAILED:
+            self._mp3_save_results.put((None, job.error))
+        elif job.state is ExportJobState.CANCELLED:
+            self._mp3_save_results.put((None, ExportCancelledError(f"Export {job.job_id} cancelled")))
+        self._notify_change("export")
 
 
 def create_app(
@@ -517,6 +857,8 @@ def create_app(
     *,
     ensure_download: bool = True,
     audio_player: AudioPlayer | None = None,
+    serve_http: bool = True,
+    headless: bool = False,
 ) -> AppRuntime:
     cfg = config or load_config()
     assets = resolve_assets(cfg, ensure_download=ensure_download)
@@ -528,7 +870,14 @@ def create_app(
         cfg = replace(cfg, backend_mode="mock")
         backend = select_backend(cfg, assets)
 
-    selected_audio_player = audio_player or AudioPlayer(sample_rate=cfg.sample_rate)
+    tracer.configure(
+        enabled=bool(getattr(cfg, "trace_enabled", False)),
+        capacity=int(getattr(cfg, "trace_capacity", DEFAULT_TRACE_CAPACITY)),
+    )
+    # Headless front ends (batch export, kookie-serve) never play audio, so they get no output device.
+    player_type = NullAudioPlayer if headless else AudioPlayer
+    selected_audio_player = audio_player or player_type(sample_rate=cfg.sample_rate)
+    metrics = MetricsStore()
 
     runtime_holder: dict[str, AppRuntime] = {}
 
@@ -537,11 +886,21 @@ def create_app(
         if runtime is not None:
             runtime.on_controller_event(event)
 
+    # Synthesis and audio threads only enqueue; status, listeners and telemetry run on the dispatcher thread.
+    dispatcher = EventDispatcher(
+        on_event,
+        coalesce_key=_controller_event_key,
+        droppable=_controller_event_droppable,
+        name="kookie-controller-events",
+    )
     controller = PlaybackController(
         backend=backend,
         audio_player=selected_audio_player,
-        on_event=on_event,
+        on_event=dispatcher.emit,
         queue_timeout=cfg.audio_queue_timeout,
+        metrics=metrics,
+        buffer_policy=_buffer_policy(cfg),
+        reuse_cache_seconds=float(getattr(cfg, "playback_reuse_cache_seconds", 300.0)),
     )
 
     runtime = AppRuntime(
@@ -556,15 +915,23 @@ def create_app(
         telemetry=LocalTelemetry(
             enabled=bool(getattr(cfg, "telemetry_enabled", False)),
             output_path=Path(getattr(cfg, "telemetry_file", cfg.asset_dir / "telemetry.jsonl")).expanduser(),
+            max_bytes=int(getattr(cfg, "telemetry_max_bytes", 5_000_000)),
+            backup_count=int(getattr(cfg, "telemetry_backup_count", 3)),
+            compress_rotated=bool(getattr(cfg, "telemetry_compress", False)),
         ),
+        metrics=metrics,
     )
+    runtime._event_dispatcher = dispatcher
     runtime_holder["runtime"] = runtime
-    if getattr(cfg, "health_check_enabled", False):
+    synthesis_service = _synthesis_service(cfg, backend)
+    # Front ends with their own listener (kookie-serve) pass serve_http=False so the ports do not clash.
+    if serve_http and (getattr(cfg, "health_check_enabled", False) or synthesis_service is not None):
         runtime._health_server = start_health_server(
             host=cfg.health_check_host,
             port=cfg.health_check_port,
             health_provider=runtime.health_status,
             metrics_store=runtime.metrics,
+            synthesis_service=synthesis_service,
         )
     return runtime
 
@@ -588,6 +955,9 @@ def run() -> None:
             }
 
         runtime = create_app(runtime_config, ensure_download=False)
+        start_update_checks = getattr(runtime, "start_update_checks", None)
+        if callable(start_update_checks):
+            start_update_checks()
         try:
             action = run_kivy_ui(runtime, startup_prompt=startup_prompt)
         finally:
@@ -622,11 +992,59 @@ def _backend_status(backend_name: str) -> str:
     return f"Backend: {display}"
 
 
+def _export_concurrency(config: AppConfig, backend: object) -> int:
+    requested = max(1, int(getattr(config, "export_max_jobs", 1)))
+    # Each running export holds a backend session; never queue more work on it than it can serve.
+    sessions = max(1, int(getattr(backend, "max_concurrent_sessions", 1)))
+    return min(requested, sessions)
+
+
+def _controller_event_key(event: ControllerEvent) -> tuple[str, PlaybackState] | None:
+    # Errors are always delivered; repeated progress or state events collapse into the latest one.
+    return None if event.kind == "error" else (event.kind, event.state)
+
+
+def _controller_event_droppable(event: ControllerEvent) -> bool:
+    # Only progress is superseded by the next update; a lost state change could leave the UI showing "Playing".
+    return event.kind == "progress"
+
+
+def _underrun_snapshot(audio_player: object) -> dict[str, object]:
+    stats = getattr(audio_player, "underruns", None)
+    snapshot = getattr(stats, "snapshot", None)
+    return snapshot() if callable(snapshot) else {}
+
+
+def _buffer_policy(config: AppConfig) -> AdaptiveBufferPolicy | None:
+    max_seconds = float(getattr(config, "audio_prebuffer_max_seconds", 0.0))
+    if max_seconds <= 0:
+        return None
+    return AdaptiveBufferPolicy(max_seconds=max_seconds)
+
+
+def _synthesis_service(config: AppConfig, backend: object) -> SynthesisService | None:
+    if not getattr(config, "synthesis_api_enabled", False):
+        return None
+    sessions = max(1, int(getattr(backend, "max_concurrent_sessions", 1)))
+    requested = int(getattr(config, "synthesis_max_concurrent", 0))
+    return SynthesisService(
+        backend,
+        sample_rate=config.sample_rate,
+        default_voice=config.default_voice,
+        max_concurrent=min(requested, sessions) if requested > 0 else sessions,
+        max_queued=int(getattr(config, "synthesis_max_queued", 8)),
+    )
+
+
 def _default_mp3_output_path() -> Path:
     stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     return Path.home() / "Downloads" / f"kookie-{stamp}.mp3"
 
 
+def _update_cache_path(config: AppConfig) -> Path:
+    return config.asset_dir.expanduser() / UPDATE_CACHE_FILENAME
+
+
 def _current_app_version() -> str:
     try:
         return package_version("kookie")
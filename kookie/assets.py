@@ -3,15 +3,45 @@ from __future__ import annotations
 import hashlib
 import json
 import os
-from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import asdict, dataclass, field
+import re
+import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, replace
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
+from urllib.parse import urlsplit
+from urllib.request import Request, url2pathname
 from urllib.request import urlopen as _stdlib_urlopen
 
 from .config import AppConfig
-from .retry import RetryPolicy, retry_call
+from .file_utils import apply_default_permissions
+from .network import NetworkProbe, network_probe_for
+from .retry import RetryPolicy, retry_within_budget
+
+try:  # pragma: no cover - platform specific
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - platform specific
+    import msvcrt
+except ImportError:  # pragma: no cover - POSIX
+    msvcrt = None  # type: ignore[assignment]
+
+HASH_BLOCK_SIZE = 1024 * 1024
+DOWNLOAD_LOCK_POLL_SECONDS = 0.1
+DEFAULT_DOWNLOAD_CONNECTIONS = 4
+MIN_DOWNLOAD_SEGMENT_BYTES = 8 * 1024 * 1024
+MIRROR_PROBE_TIMEOUT_SECONDS = 3.0
+THROUGHPUT_WINDOW_SECONDS = 5.0
+# Floor for an attempt timeout cut short by the retry budget; a zero socket timeout would mean non-blocking.
+_MIN_ATTEMPT_TIMEOUT_SECONDS = 0.1
 
 
 @dataclass(frozen=True, slots=True)
@@ -21,6 +51,31 @@ class AssetSpec:
     url: str
     sha256: str | None = None
     version: str | None = None
+    mirrors: tuple[str, ...] = ()
+
+    @property
+    def sources(self) -> list[str]:
+        """Mirror URLs in configured order, followed by the primary ``url``."""
+        ordered = [_mirror_url(entry, self.filename) for entry in self.mirrors if entry.strip()]
+        ordered.append(self.url)
+        return list(dict.fromkeys(ordered))
+
+
+@dataclass(frozen=True, slots=True)
+class AssetDigest:
+    """A verified SHA-256 together with the file identity it was computed for."""
+
+    sha256: str
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @classmethod
+    def for_stat(cls, sha256: str, stat: os.stat_result) -> AssetDigest:
+        return cls(sha256=sha256.lower(), size=stat.st_size, mtime_ns=stat.st_mtime_ns, inode=stat.st_ino)
+
+    def matches(self, stat: os.stat_result) -> bool:
+        return (self.size, self.mtime_ns, self.inode) == (stat.st_size, stat.st_mtime_ns, stat.st_ino)
 
 
 @dataclass(slots=True)
@@ -28,6 +83,7 @@ class AssetManifest:
     model_version: str | None = None
     voices_version: str | None = None
     updated_at: str | None = None
+    digests: dict[str, AssetDigest] = field(default_factory=dict)
 
 
 @dataclass(slots=True)
@@ -55,6 +111,14 @@ def resolve_assets(
     target_dir.mkdir(parents=True, exist_ok=True)
 
     specs = _specs_from_config(config)
+    if downloader is None:
+        downloader = partial(
+            download_asset,
+            connections=int(getattr(config, "download_connections", 1)),
+            min_bytes_per_second=float(getattr(config, "download_min_bytes_per_second", 0)),
+            retry_policy=RetryPolicy(deadline_seconds=getattr(config, "network_retry_budget_seconds", None)),
+            network_probe=network_probe_for(config),
+        )
     manifest_path = target_dir / getattr(config, "asset_manifest_filename", "asset_manifest.json")
     manifest = _load_manifest(manifest_path)
     errors: list[str] = []
@@ -62,13 +126,23 @@ def resolve_assets(
     model_path = _existing_path(target_dir / specs[0].filename)
     voices_path = _existing_path(target_dir / specs[1].filename)
     downloaded = False
-
-    if model_path is not None and specs[0].sha256 and not _verify_existing_checksum(model_path, specs[0].sha256):
-        errors.append(f"model verification failed: checksum mismatch for {model_path.name}")
-        model_path = None
-    if voices_path is not None and specs[1].sha256 and not _verify_existing_checksum(voices_path, specs[1].sha256):
-        errors.append(f"voices verification failed: checksum mismatch for {voices_path.name}")
-        voices_path = None
+    cached_digests = manifest.digests if manifest is not None else {}
+    digests: dict[str, AssetDigest] = {}
+
+    if model_path is not None and specs[0].sha256:
+        digest = _verified_digest(model_path, specs[0].sha256, cached_digests.get(specs[0].filename))
+        if digest is None:
+            errors.append(f"model verification failed: checksum mismatch for {model_path.name}")
+            model_path = None
+        else:
+            digests[specs[0].filename] = digest
+    if voices_path is not None and specs[1].sha256:
+        digest = _verified_digest(voices_path, specs[1].sha256, cached_digests.get(specs[1].filename))
+        if digest is None:
+            errors.append(f"voices verification failed: checksum mismatch for {voices_path.name}")
+            voices_path = None
+        else:
+            digests[specs[1].filename] = digest
 
     require_checksums = bool(getattr(config, "require_asset_checksums", False))
     if require_checksums:
@@ -141,14 +215,20 @@ def resolve_assets(
     verified = bool(ready and (not require_checksums or all(spec.sha256 for spec in specs)))
 
     if ready:
-        _save_manifest(
-            manifest_path,
-            AssetManifest(
-                model_version=specs[0].version,
-                voices_version=specs[1].version,
-                updated_at=datetime.now(UTC).isoformat(),
-            ),
+        # Files replaced by a download this run are re-verified (and cached) on the next startup.
+        if downloaded:
+            digests = {
+                name: digest for name, digest in digests.items() if _digest_still_valid(target_dir / name, digest)
+            }
+        updated = AssetManifest(
+            model_version=specs[0].version,
+            voices_version=specs[1].version,
+            updated_at=manifest.updated_at if manifest is not None else None,
+            digests=digests,
         )
+        if updated != manifest:
+            updated.updated_at = datetime.now(UTC).isoformat()
+            _save_manifest(manifest_path, updated)
 
     return ResolvedAssets(
         model_path=model_path,
@@ -169,48 +249,555 @@ def download_asset(
     progress_callback: Callable[[int, int | None], None] | None = None,
     retry_policy: RetryPolicy | None = None,
     chunk_size: int = 64 * 1024,
+    lock_timeout: float | None = None,
+    connections: int = DEFAULT_DOWNLOAD_CONNECTIONS,
+    min_segment_bytes: int = MIN_DOWNLOAD_SEGMENT_BYTES,
+    min_bytes_per_second: float = 0.0,
+    network_probe: NetworkProbe | None = None,
 ) -> Path:
+    """Download ``spec`` into ``target_dir``.
+
+    When the server answers with ``Accept-Ranges: bytes`` and the file is large enough, it is fetched as up to
+    ``connections`` parallel byte ranges of at least ``min_segment_bytes``; otherwise as a single stream.
+
+    With mirrors configured, sources are probed concurrently and tried fastest first. A source whose
+    throughput drops below ``min_bytes_per_second`` is abandoned for the next one (never the last one),
+    which resumes the remaining byte ranges if it serves the same file.
+
+    While ``network_probe`` reaches none of the remote sources' hosts, only local (``file:``) sources are
+    tried, and a failed request is retried only if a fresh probe still reaches that source's host.
+
+    Downloads of the same file are serialized across processes with an advisory lock. A process that waited
+    on the lock while another one replaced the file reuses that (checksum-verified) result instead of
+    downloading again.
+    """
+    sources = spec.sources
+    remote = [source for source in sources if not _is_local(source)]
+    if network_probe is not None and remote:
+        # Only when no remote source (or its proxy) answers; a LAN mirror is enough to go ahead.
+        if not network_probe.is_online(remote):
+            sources = [source for source in sources if _is_local(source)]
+            if not sources:
+                raise AssetDownloadError(f"network unavailable; skipped downloading {spec.name}")
+
     target_dir.mkdir(parents=True, exist_ok=True)
     final_path = target_dir / spec.filename
-    temp_path = target_dir / f"{spec.filename}.tmp"
+    identity_before = _file_identity(final_path)
+
+    with download_lock(target_dir, spec.filename, timeout=lock_timeout):
+        reused = _reuse_concurrent_download(spec, final_path, identity_before, progress_callback)
+        if reused is not None:
+            return reused
+        _remove_stale_temp_files(target_dir, spec.filename)
+        if len(sources) > 1:
+            sources = probe_sources(sources, timeout=min(timeout, MIRROR_PROBE_TIMEOUT_SECONDS), urlopen=urlopen)
+        transfer = _Transfer(
+            timeout=timeout,
+            urlopen=urlopen,
+            progress_callback=progress_callback,
+            retry_policy=retry_policy or RetryPolicy(),
+            chunk_size=chunk_size,
+            connections=connections,
+            min_segment_bytes=min_segment_bytes,
+            min_bytes_per_second=min_bytes_per_second,
+            network_probe=network_probe,
+        )
+        return _download_locked(spec, target_dir, sources or [spec.url], transfer)
 
-    _remove_if_exists(temp_path)
 
+@contextmanager
+def download_lock(target_dir: Path, filename: str, *, timeout: float | None = None) -> Iterator[Path]:
+    """Hold an exclusive advisory lock on ``{filename}.lock`` in ``target_dir``."""
+    target_dir.mkdir(parents=True, exist_ok=True)
+    lock_path = target_dir / f"{filename}.lock"
+    deadline = None if timeout is None else time.monotonic() + max(0.0, timeout)
+    with lock_path.open("a+b") as handle:
+        while not _try_lock(handle):
+            if deadline is not None and time.monotonic() >= deadline:
+                raise AssetDownloadError(f"timed out waiting for another download of {filename}")
+            time.sleep(DOWNLOAD_LOCK_POLL_SECONDS)
+        try:
+            yield lock_path
+        finally:
+            _unlock(handle)
+
+
+def _try_lock(handle) -> bool:
+    if fcntl is not None:
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+    if msvcrt is not None:  # pragma: no cover - Windows
+        try:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+    return True  # pragma: no cover - no locking primitive available
+
+
+def _unlock(handle) -> None:
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    elif msvcrt is not None:  # pragma: no cover - Windows
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _file_identity(path: Path) -> tuple[int, int, int] | None:
     try:
-        def _fetch_payload() -> bytes:
-            with urlopen(spec.url, timeout=timeout) as response:  # type: ignore[call-arg]
-                total = _content_length(response)
-                downloaded = 0
-                chunks: list[bytes] = []
-                while True:
-                    chunk = response.read(chunk_size)
-                    if not chunk:
-                        break
-                    chunks.append(chunk)
-                    downloaded += len(chunk)
-                    if progress_callback is not None:
-                        progress_callback(downloaded, total)
-                if progress_callback is not None and downloaded == 0:
-                    progress_callback(0, total)
-                return b"".join(chunks)
-
-        payload = retry_call(_fetch_payload, policy=retry_policy or RetryPolicy())
-
-        digest = hashlib.sha256(payload).hexdigest()
-        if spec.sha256 and digest.lower() != spec.sha256.lower():
-            raise AssetDownloadError(
-                f"checksum mismatch for {spec.name}: expected {spec.sha256}, got {digest}"
-            )
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+def _reuse_concurrent_download(
+    spec: AssetSpec,
+    final_path: Path,
+    identity_before: tuple[int, int, int] | None,
+    progress_callback: Callable[[int, int | None], None] | None,
+) -> Path | None:
+    identity = _file_identity(final_path)
+    if identity is None or identity == identity_before:
+        return None
+    if spec.sha256 and _verified_digest(final_path, spec.sha256) is None:
+        return None
+    if progress_callback is not None:
+        progress_callback(identity[0], identity[0])
+    return final_path
+
+
+def _remove_stale_temp_files(target_dir: Path, filename: str) -> None:
+    # Only called under the download lock, so no other process is writing these.
+    for stale in target_dir.glob(f"{filename}.*.tmp"):
+        _remove_if_exists(stale)
+    _remove_if_exists(target_dir / f"{filename}.tmp")
 
-        temp_path.write_bytes(payload)
-        os.replace(temp_path, final_path)
-        return final_path
-    except AssetDownloadError:
-        _remove_if_exists(temp_path)
+
+def probe_sources(
+    sources: Sequence[str],
+    *,
+    timeout: float,
+    urlopen: Callable[..., object] = _stdlib_urlopen,
+) -> list[str]:
+    """Order reachable sources by time to first byte, probing them concurrently.
+
+    Local ``file://`` sources count as instant. Unreachable sources are dropped; ties keep the configured order.
+    """
+
+    def _probe(source: str) -> float | None:
+        if _is_local(source):
+            return 0.0 if _path_from_file_url(source).is_file() else None
+        started = time.perf_counter()
+        try:
+            with urlopen(Request(source, headers={"Range": "bytes=0-0"}), timeout=timeout) as response:  # type: ignore[call-arg]
+                response.read(1)  # type: ignore[attr-defined]
+        except Exception:
+            return None
+        return time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=max(1, len(sources)), thread_name_prefix="kookie-probe") as executor:
+        latencies = list(executor.map(_probe, sources))
+    ranked = sorted(
+        (latency, position, source)
+        for position, (source, latency) in enumerate(zip(sources, latencies, strict=True))
+        if latency is not None
+    )
+    return [source for _latency, _position, source in ranked]
+
+
+class ThroughputCollapsedError(AssetDownloadError):
+    """A source slowed below the configured floor; the download should continue from another mirror."""
+
+
+class _ThroughputGuard:
+    """Raises once the aggregate transfer rate over ``window_seconds`` drops below the floor."""
+
+    def __init__(
+        self,
+        min_bytes_per_second: float,
+        *,
+        window_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_bytes_per_second = max(0.0, float(min_bytes_per_second))
+        self.window_seconds = THROUGHPUT_WINDOW_SECONDS if window_seconds is None else window_seconds
+        self._clock = clock
+        self._started = clock()
+        self._samples: deque[tuple[float, int]] = deque()
+        self._window_bytes = 0
+        self._lock = threading.Lock()
+
+    def record(self, count: int) -> None:
+        if self.min_bytes_per_second <= 0:
+            return
+        now = self._clock()
+        with self._lock:
+            self._samples.append((now, count))
+            self._window_bytes += count
+            while self._samples and self._samples[0][0] < now - self.window_seconds:
+                self._window_bytes -= self._samples.popleft()[1]
+            if now - self._started < self.window_seconds:
+                return
+            rate = self._window_bytes / self.window_seconds
+        if rate < self.min_bytes_per_second:
+            raise ThroughputCollapsedError(f"throughput fell to {rate:.0f} B/s")
+
+
+@dataclass(frozen=True, slots=True)
+class _Transfer:
+    timeout: float
+    urlopen: Callable[..., object]
+    progress_callback: Callable[[int, int | None], None] | None
+    retry_policy: RetryPolicy
+    chunk_size: int
+    connections: int
+    min_segment_bytes: int
+    min_bytes_per_second: float
+    network_probe: NetworkProbe | None = None
+
+
+@dataclass(slots=True)
+class _PartialDownload:
+    """Byte ranges of the temp file still missing, so another source can pick up where one stopped."""
+
+    path: Path
+    total: int | None = None
+    remaining: list[tuple[int, int]] = field(default_factory=list)
+    # Strong validator of the file the ranges belong to, sent as ``If-Range`` when resuming.
+    etag: str | None = None
+    source: str | None = None
+
+    def completed_bytes(self) -> int:
+        if self.total is None:
+            return 0
+        return self.total - sum(end - start + 1 for start, end in self.remaining)
+
+
+def _download_locked(spec: AssetSpec, target_dir: Path, sources: Sequence[str], transfer: _Transfer) -> Path:
+    final_path = target_dir / spec.filename
+    handle, temp_name = tempfile.mkstemp(dir=target_dir, prefix=f"{spec.filename}.", suffix=".tmp")
+    os.close(handle)
+    partial_download = _PartialDownload(path=Path(temp_name))
+    failures: list[str] = []
+
+    try:
+        for position, source in enumerate(sources):
+            # The last candidate has nowhere to fall back to, so a slow link is left to finish.
+            source_transfer = transfer if position < len(sources) - 1 else replace(transfer, min_bytes_per_second=0.0)
+            try:
+                digest = retry_within_budget(
+                    lambda remaining, source=source, source_transfer=source_transfer: _fetch_from(
+                        source, partial_download, _within_budget(source_transfer, remaining), checksum=spec.sha256
+                    ),
+                    policy=transfer.retry_policy,
+                    should_retry=partial(
+                        _retryable_download_error,
+                        network_probe=None if _is_local(source) else transfer.network_probe,
+                        urls=(source,),
+                    ),
+                )
+            except ThroughputCollapsedError as exc:
+                failures.append(f"{source}: {exc}")
+                continue
+            except Exception as exc:
+                failures.append(f"{source}: {exc}")
+                partial_download.remaining = []
+                continue
+            if spec.sha256 and digest.lower() != spec.sha256.lower():
+                mismatch = f"checksum mismatch for {spec.name}: expected {spec.sha256}, got {digest}"
+                failures.append(mismatch if len(sources) == 1 else f"{source}: {mismatch}")
+                partial_download.remaining = []
+                continue
+            apply_default_permissions(partial_download.path)
+            os.replace(partial_download.path, final_path)
+            return final_path
+    finally:
+        _remove_if_exists(partial_download.path)
+
+    if len(failures) == 1 and failures[0].startswith("checksum mismatch"):
+        raise AssetDownloadError(failures[0])
+    raise AssetDownloadError(f"failed to download {spec.name}: {'; '.join(failures)}")
+
+
+def _fetch_from(
+    source: str,
+    partial_download: _PartialDownload,
+    transfer: _Transfer,
+    *,
+    checksum: str | None = None,
+) -> str:
+    guard = _ThroughputGuard(transfer.min_bytes_per_second)
+    if partial_download.remaining and partial_download.total:
+        if _can_resume_from(source, partial_download, transfer, checksum=checksum):
+            try:
+                return _download_ranges(
+                    source, None, partial_download, list(partial_download.remaining), transfer, guard
+                )
+            except _RangeNotSupported:
+                pass
+        partial_download.remaining = []
+
+    with transfer.urlopen(source, timeout=transfer.timeout) as response:  # type: ignore[call-arg]
+        total = _content_length(response)
+        partial_download.total = total
+        partial_download.etag = _strong_etag(response)
+        partial_download.source = source
+        segments = (
+            _segment_plan(total, transfer.connections, transfer.min_segment_bytes) if _accepts_ranges(response) else []
+        )
+        if len(segments) < 2:
+            return _stream_to_file(response, partial_download, transfer, guard)
+        try:
+            return _download_ranges(source, response, partial_download, segments, transfer, guard)
+        except _RangeNotSupported:
+            partial_download.remaining = []
+    # The server advertised ranges but ignored them; start over as a single stream.
+    with transfer.urlopen(source, timeout=transfer.timeout) as response:  # type: ignore[call-arg]
+        partial_download.total = _content_length(response)
+        partial_download.etag = _strong_etag(response)
+        partial_download.source = source
+        return _stream_to_file(response, partial_download, transfer, guard)
+
+
+def _can_resume_from(
+    source: str,
+    partial_download: _PartialDownload,
+    transfer: _Transfer,
+    *,
+    checksum: str | None,
+) -> bool:
+    """Whether the missing ranges may be filled from ``source``.
+
+    Another source must serve a file of the same size, and either the same strong ETag or an asset with a
+    checksum that verifies the spliced result.
+    """
+    if source == partial_download.source:
+        return True
+    try:
+        request = Request(source, headers={"Range": "bytes=0-0"})
+        with transfer.urlopen(request, timeout=transfer.timeout) as response:  # type: ignore[call-arg]
+            served = _content_range(response) if getattr(response, "status", None) == 206 else None
+            etag = _strong_etag(response)
+    except Exception:
+        return False
+    if served is None or served[2] != partial_download.total:
+        return False
+    if not checksum and (etag is None or etag != partial_download.etag):
+        return False
+    partial_download.etag = etag
+    partial_download.source = source
+    return True
+
+
+def _within_budget(transfer: _Transfer, remaining: float | None) -> _Transfer:
+    """``transfer`` with its timeout capped to the ``remaining`` seconds of the retry budget."""
+    if remaining is None or remaining >= transfer.timeout:
+        return transfer
+    return replace(transfer, timeout=max(_MIN_ATTEMPT_TIMEOUT_SECONDS, remaining))
+
+
+class _RangeNotSupported(Exception):
+    """A ranged request came back without ``206 Partial Content`` for exactly the requested bytes."""
+
+
+class _DownloadAborted(AssetDownloadError):
+    """A range stopped because another range of the same download failed."""
+
+
+def _accepts_ranges(response: object) -> bool:
+    headers = getattr(response, "headers", None)
+    if headers is None or not hasattr(os, "pwrite"):
+        return False
+    return str(headers.get("Accept-Ranges") or "").strip().lower() == "bytes"
+
+
+def _segment_plan(total: int | None, connections: int, min_segment_bytes: int) -> list[tuple[int, int]]:
+    """Split ``total`` bytes into inclusive ``(start, end)`` ranges no smaller than ``min_segment_bytes``."""
+    if total is None or total <= 0:
+        return []
+    count = max(1, min(int(connections), total // max(1, int(min_segment_bytes))))
+    size = -(-total // count)
+    return [(start, min(total, start + size) - 1) for start in range(0, total, size)]
+
+
+def _stream_to_file(
+    response: object,
+    partial_download: _PartialDownload,
+    transfer: _Transfer,
+    guard: _ThroughputGuard,
+) -> str:
+    hasher = hashlib.sha256()
+    total = partial_download.total
+    downloaded = 0
+    try:
+        with partial_download.path.open("wb") as fh:
+            while chunk := response.read(transfer.chunk_size):  # type: ignore[attr-defined]
+                fh.write(chunk)
+                hasher.update(chunk)
+                downloaded += len(chunk)
+                if transfer.progress_callback is not None:
+                    transfer.progress_callback(downloaded, total)
+                guard.record(len(chunk))
+    except Exception:
+        partial_download.remaining = [(downloaded, total - 1)] if total and downloaded < total else []
         raise
-    except Exception as exc:  # pragma: no cover - depends on system/network state
-        _remove_if_exists(temp_path)
-        raise AssetDownloadError(f"failed to download {spec.name}: {exc}") from exc
+    partial_download.remaining = []
+    if transfer.progress_callback is not None and downloaded == 0:
+        transfer.progress_callback(0, total)
+    return hasher.hexdigest()
+
+
+def _download_ranges(
+    url: str,
+    first_response: object | None,
+    partial_download: _PartialDownload,
+    segments: list[tuple[int, int]],
+    transfer: _Transfer,
+    guard: _ThroughputGuard,
+) -> str:
+    """Fetch byte ranges in parallel, ``pwrite``-ing each at its offset in a preallocated file.
+
+    An already-open ``first_response`` supplies the first range, so splitting costs no extra round trip.
+    Ranges that fail are retried from the byte where they stopped.
+    """
+    total = int(partial_download.total or segments[-1][1] + 1)
+    base = total - sum(end - start + 1 for start, end in segments)
+    written = [0] * len(segments)
+    abort = threading.Event()
+    fd = os.open(partial_download.path, os.O_RDWR)
+    try:
+        os.ftruncate(fd, total)
+
+        def _copy(index: int, response: object) -> None:
+            start, end = segments[index]
+            offset = start + written[index]
+            while offset <= end:
+                if abort.is_set():
+                    raise _DownloadAborted("download aborted after another range failed")
+                chunk = response.read(min(transfer.chunk_size, end - offset + 1))  # type: ignore[attr-defined]
+                if not chunk:
+                    raise AssetDownloadError(f"connection closed at byte {offset} of range {start}-{end}")
+                view = memoryview(chunk)
+                while view:
+                    count = os.pwrite(fd, view, offset)
+                    view = view[count:]
+                    offset += count
+                written[index] = offset - start
+                guard.record(len(chunk))
+
+        def _fetch_range(index: int, remaining: float | None) -> None:
+            start, end = segments[index]
+            headers = {"Range": f"bytes={start + written[index]}-{end}"}
+            if partial_download.etag:
+                # A changed file then comes back whole (200) instead of splicing bytes of two versions.
+                headers["If-Range"] = partial_download.etag
+            request = Request(url, headers=headers)
+            timeout = _within_budget(transfer, remaining).timeout
+            with transfer.urlopen(request, timeout=timeout) as response:  # type: ignore[call-arg]
+                if getattr(response, "status", None) != 206:
+                    raise _RangeNotSupported(url)
+                served = _content_range(response)
+                if served is None or served[:2] != (start + written[index], end) or served[2] not in (None, total):
+                    raise _RangeNotSupported(url)
+                _copy(index, response)
+
+        def _retry_range(index: int) -> None:
+            retry_within_budget(
+                partial(_fetch_range, index),
+                policy=transfer.retry_policy,
+                should_retry=partial(_retryable_range_error, network_probe=transfer.network_probe, urls=(url,)),
+            )
+
+        def _first_range(index: int) -> None:
+            try:
+                _copy(index, first_response)
+            except Exception:
+                if abort.is_set():
+                    raise
+                _retry_range(index)
+
+        # Leaving the executor joins every worker, so none can touch ``fd`` after it is closed.
+        with ThreadPoolExecutor(max_workers=len(segments), thread_name_prefix="kookie-download") as executor:
+            futures = [executor.submit(_first_range if first_response is not None else _retry_range, 0)]
+            futures.extend(executor.submit(_retry_range, index) for index in range(1, len(segments)))
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_EXCEPTION)
+                if transfer.progress_callback is not None:
+                    transfer.progress_callback(base + sum(written), total)
+                if any(future.exception() is not None for future in done):
+                    abort.set()
+                    break
+    finally:
+        os.close(fd)
+        partial_download.remaining = [
+            (start + written[index], end)
+            for index, (start, end) in enumerate(segments)
+            if start + written[index] <= end
+        ]
+
+    failures = [future.exception() for future in futures if future.done() and future.exception() is not None]
+    if failures:
+        # Range errors win so the caller falls back to a single stream; collapse errors so it switches source.
+        for preferred in (_RangeNotSupported, ThroughputCollapsedError):
+            for exc in failures:
+                if isinstance(exc, preferred):
+                    raise exc
+        raise next((exc for exc in failures if not isinstance(exc, _DownloadAborted)), failures[0])
+    return _sha256_file(partial_download.path)
+
+
+def _retryable_range_error(
+    exc: Exception,
+    *,
+    network_probe: NetworkProbe | None = None,
+    urls: Sequence[str] = (),
+) -> bool:
+    if isinstance(exc, (_RangeNotSupported, _DownloadAborted)):
+        return False
+    return _retryable_download_error(exc, network_probe=network_probe, urls=urls)
+
+
+def _retryable_download_error(
+    exc: Exception,
+    *,
+    network_probe: NetworkProbe | None = None,
+    urls: Sequence[str] = (),
+) -> bool:
+    if isinstance(exc, ThroughputCollapsedError):
+        return False
+    if network_probe is not None and isinstance(exc, OSError):
+        network_probe.invalidate()
+        return network_probe.is_online(urls)
+    return True
+
+
+def _is_local(source: str) -> bool:
+    return source.startswith("file:")
+
+
+def _path_from_file_url(url: str) -> Path:
+    return Path(url2pathname(urlsplit(url).path))
+
+
+def _mirror_url(entry: str, filename: str) -> str:
+    """Turn a mirror entry (URL, ``file://`` URL or local directory) into a URL for ``filename``."""
+    cleaned = entry.strip()
+    if "://" not in cleaned:
+        path = Path(cleaned).expanduser()
+        if path.is_dir() or cleaned.endswith(("/", os.sep)):
+            path = path / filename
+        return path.resolve().as_uri()
+    if cleaned.endswith("/"):
+        return cleaned + filename
+    if _is_local(cleaned) and _path_from_file_url(cleaned).is_dir():
+        return cleaned + "/" + filename
+    return cleaned
 
 
 def _specs_from_config(config: AppConfig) -> tuple[AssetSpec, AssetSpec]:
@@ -221,6 +808,7 @@ def _specs_from_config(config: AppConfig) -> tuple[AssetSpec, AssetSpec]:
             url=config.model_url,
             sha256=config.model_sha256,
             version=_guess_version(config.model_url),
+            mirrors=tuple(getattr(config, "model_mirrors", ())),
         ),
         AssetSpec(
             name="voices",
@@ -228,6 +816,7 @@ def _specs_from_config(config: AppConfig) -> tuple[AssetSpec, AssetSpec]:
             url=config.voices_url,
             sha256=config.voices_sha256,
             version=_guess_version(config.voices_url),
+            mirrors=tuple(getattr(config, "voices_mirrors", ())),
         ),
     )
 
@@ -266,6 +855,26 @@ def _remove_if_exists(path: Path) -> None:
         return
 
 
+_CONTENT_RANGE = re.compile(r"^\s*bytes\s+(\d+)-(\d+)/(\d+|\*)\s*$", re.IGNORECASE)
+
+
+def _content_range(response: object) -> tuple[int, int, int | None] | None:
+    """``(start, end, total)`` of a ``206`` response's ``Content-Range``; ``total`` is None when unknown."""
+    headers = getattr(response, "headers", None)
+    match = _CONTENT_RANGE.match(str(headers.get("Content-Range") or "")) if headers is not None else None
+    if match is None:
+        return None
+    start, end, total = match.groups()
+    return int(start), int(end), None if total == "*" else int(total)
+
+
+def _strong_etag(response: object) -> str | None:
+    # Weak validators are not allowed in If-Range.
+    headers = getattr(response, "headers", None)
+    etag = str(headers.get("ETag") or "").strip() if headers is not None else ""
+    return etag if etag and not etag.startswith("W/") else None
+
+
 def _content_length(response: object) -> int | None:
     headers = getattr(response, "headers", None)
     if headers is None:
@@ -301,15 +910,38 @@ def _load_manifest(path: Path) -> AssetManifest | None:
         model_version=_clean_text(payload.get("model_version")),
         voices_version=_clean_text(payload.get("voices_version")),
         updated_at=_clean_text(payload.get("updated_at")),
+        digests=_parse_digests(payload.get("digests")),
     )
 
 
+def _parse_digests(value: object) -> dict[str, AssetDigest]:
+    if not isinstance(value, dict):
+        return {}
+    digests: dict[str, AssetDigest] = {}
+    for name, entry in value.items():
+        if not isinstance(entry, dict):
+            continue
+        try:
+            digests[str(name)] = AssetDigest(
+                sha256=str(entry["sha256"]).lower(),
+                size=int(entry["size"]),
+                mtime_ns=int(entry["mtime_ns"]),
+                inode=int(entry["inode"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+    return digests
+
+
 def _save_manifest(path: Path, manifest: AssetManifest) -> None:
-    tmp_path = path.with_name(f"{path.name}.tmp")
     payload = asdict(manifest)
     path.parent.mkdir(parents=True, exist_ok=True)
+    handle, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    os.close(handle)
+    tmp_path = Path(tmp_name)
     try:
         tmp_path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        apply_default_permissions(tmp_path)
         os.replace(tmp_path, path)
     finally:
         _remove_if_exists(tmp_path)
@@ -322,10 +954,32 @@ def _clean_text(value: object) -> str | None:
     return cleaned or None
 
 
-def _verify_existing_checksum(path: Path, expected_sha256: str) -> bool:
+def _verified_digest(path: Path, expected_sha256: str, cached: AssetDigest | None = None) -> AssetDigest | None:
+    """Return the digest of ``path`` if it matches ``expected_sha256``, re-hashing only when the file changed."""
+    expected = expected_sha256.lower()
     try:
-        payload = path.read_bytes()
+        before = path.stat()
+        if cached is not None and cached.sha256 == expected and cached.matches(before):
+            return cached
+        digest = _sha256_file(path)
+    except OSError:
+        return None
+    if digest != expected:
+        return None
+    # Keyed on the identity from before hashing, so a file rewritten mid-hash is re-hashed next time.
+    return AssetDigest.for_stat(digest, before)
+
+
+def _digest_still_valid(path: Path, digest: AssetDigest) -> bool:
+    try:
+        return digest.matches(path.stat())
     except OSError:
         return False
-    digest = hashlib.sha256(payload).hexdigest()
-    return digest.lower() == expected_sha256.lower()
+
+
+def _sha256_file(path: Path, block_size: int = HASH_BLOCK_SIZE) -> str:
+    hasher = hashlib.sha256()
+    with path.open("rb") as fh:
+        while block := fh.read(block_size):
+            hasher.update(block)
+    return hasher.hexdigest()
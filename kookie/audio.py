@@ -3,15 +3,100 @@ from __future__ import annotations
 import queue
 import threading
 import time
+from collections import deque
 from collections.abc import Callable
+from dataclasses import dataclass, field
 
 import numpy as np
 
+from .tracing import span
+
+# Audio handed to the device per write; stop and pause take effect between writes.
+WRITE_BLOCK_SECONDS = 0.05
+MIN_WRITE_BLOCK_FRAMES = 256
+
+
+@dataclass(slots=True)
+class UnderrunStats:
+    """Dry spells where the output device waited on synthesis after playback had started."""
+
+    count: int = 0
+    starved_seconds: float = 0.0
+    last_started_at: float | None = None
+    recent: deque[float] = field(default_factory=lambda: deque(maxlen=32))
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def record_start(self, at: float | None = None) -> None:
+        started = time.time() if at is None else at
+        with self._lock:
+            self.count += 1
+            self.last_started_at = started
+            self.recent.append(started)
+
+    def record_end(self, seconds: float) -> None:
+        with self._lock:
+            self.starved_seconds += max(0.0, seconds)
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "count": self.count,
+                "starved_seconds": round(self.starved_seconds, 3),
+                "last_started_at": self.last_started_at,
+                "recent": list(self.recent),
+            }
+
+
+@dataclass(slots=True)
+class AdaptiveBufferPolicy:
+    """Chooses how much audio to buffer before (re)starting playback.
+
+    When synthesis runs slower than real time (realtime factor ``r`` < 1), playing ``T`` seconds without a
+    stall needs ``T * (1 - r)`` seconds buffered up front. ``T`` is the remaining audio estimate, bounded by
+    ``horizon_seconds``. Each underrun also grows the target by ``underrun_growth_seconds``.
+    """
+
+    min_seconds: float = 0.0
+    max_seconds: float = 8.0
+    horizon_seconds: float = 30.0
+    underrun_growth_seconds: float = 0.5
+    smoothing: float = 0.3
+    realtime_factor: float | None = None
+    underrun_boost_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def record_synthesis(self, audio_seconds: float, wall_seconds: float) -> None:
+        if audio_seconds <= 0 or wall_seconds <= 0:
+            return
+        sample = audio_seconds / wall_seconds
+        with self._lock:
+            if self.realtime_factor is None:
+                self.realtime_factor = sample
+            else:
+                self.realtime_factor += self.smoothing * (sample - self.realtime_factor)
+
+    def record_underrun(self) -> None:
+        with self._lock:
+            boosted = self.underrun_boost_seconds + self.underrun_growth_seconds
+            self.underrun_boost_seconds = min(self.max_seconds, boosted)
+
+    def target_seconds(self, remaining_audio_seconds: float | None = None) -> float:
+        with self._lock:
+            factor = self.realtime_factor
+            boost = self.underrun_boost_seconds
+        if self.max_seconds <= 0:
+            return 0.0
+        horizon = self.horizon_seconds if remaining_audio_seconds is None else remaining_audio_seconds
+        horizon = min(self.horizon_seconds, max(0.0, horizon))
+        deficit = horizon * (1.0 - factor) if factor is not None and factor < 1.0 else 0.0
+        return min(self.max_seconds, max(self.min_seconds, deficit + boost))
+
 
 class AudioPlayer:
     def __init__(self, sample_rate: int = 24_000, stream_factory: Callable[..., object] | None = None):
         self.sample_rate = sample_rate
         self._stream_factory = stream_factory or self._default_stream_factory
+        self.underruns = UnderrunStats()
 
     def play_from_queue(
         self,
@@ -21,48 +106,113 @@ class AudioPlayer:
         volume_getter: Callable[[], float] | None = None,
         on_progress: Callable[[int], None] | None = None,
         consume_seek_samples: Callable[[], int] | None = None,
+        on_underrun: Callable[[], None] | None = None,
+        prebuffer_samples: Callable[[], int] | None = None,
     ) -> None:
         pending_seek_samples = 0
+        buffered: deque[np.ndarray] = deque()
+        buffered_samples = 0
+        ended = False
+        # Buffer up to the prebuffer target before the first write and again after each underrun, but never
+        # wait longer than the audio being buffered would take to play.
+        filling = True
+        fill_started = time.monotonic()
+        has_played = False
+        starved_at: float | None = None
+        block_frames = max(MIN_WRITE_BLOCK_FRAMES, int(self.sample_rate * WRITE_BLOCK_SECONDS))
         with self._stream_factory(sample_rate=self.sample_rate, channels=1, dtype="float32") as stream:
             while True:
                 if stop_event.is_set():
+                    _abort(stream)
                     return
                 if pause_event is not None and pause_event.is_set():
                     time.sleep(0.01)
                     continue
 
-                try:
-                    chunk = audio_queue.get(timeout=0.1)
-                except queue.Empty:
-                    continue
-
-                if chunk is None:
-                    return
-                if stop_event.is_set():
-                    return
+                if filling and not ended and buffered:
+                    target = max(0, int(prebuffer_samples())) if prebuffer_samples is not None else 0
+                    waited = time.monotonic() - fill_started
+                    if buffered_samples < target and waited < target / self.sample_rate:
+                        if self._fill(audio_queue, buffered) is None:
+                            ended = True
+                        buffered_samples = sum(int(item.size) for item in buffered)
+                        continue
 
-                data = np.asarray(chunk, dtype=np.float32).reshape(-1)
-                if data.size == 0:
+                if not buffered:
+                    if ended:
+                        return
+                    try:
+                        with span("audio_queue_get", "queue"):
+                            chunk = audio_queue.get(timeout=0.1)
+                    except queue.Empty:
+                        if has_played and starved_at is None:
+                            starved_at = time.monotonic()
+                            self.underruns.record_start()
+                            if on_underrun is not None:
+                                on_underrun()
+                            filling = True
+                            fill_started = starved_at
+                        continue
+                    if chunk is None:
+                        return
+                    data = np.asarray(chunk, dtype=np.float32).reshape(-1)
+                    if data.size:
+                        buffered.append(data)
+                        buffered_samples += int(data.size)
                     continue
 
-                if consume_seek_samples is not None:
-                    pending_seek_samples += max(0, int(consume_seek_samples()))
+                data = buffered.popleft()
+                buffered_samples -= int(data.size)
+                filling = False
 
-                if pending_seek_samples > 0:
-                    if data.size <= pending_seek_samples:
-                        pending_seek_samples -= data.size
+                # Write in short blocks so stop, pause, seek and volume changes apply mid-sentence.
+                position = 0
+                while position < data.size:
+                    if stop_event.is_set():
+                        _abort(stream)
+                        return
+                    if pause_event is not None and pause_event.is_set():
+                        time.sleep(0.01)
                         continue
-                    data = data[pending_seek_samples:]
-                    pending_seek_samples = 0
 
-                if volume_getter is not None:
-                    volume = float(volume_getter())
-                    volume = min(1.0, max(0.0, volume))
-                    data = data * volume
+                    if consume_seek_samples is not None:
+                        pending_seek_samples += max(0, int(consume_seek_samples()))
+                    if pending_seek_samples > 0:
+                        skipped = min(pending_seek_samples, int(data.size) - position)
+                        position += skipped
+                        pending_seek_samples -= skipped
+                        continue
+
+                    block = data[position : position + block_frames]
+                    position += int(block.size)
+                    if volume_getter is not None:
+                        volume = float(volume_getter())
+                        volume = min(1.0, max(0.0, volume))
+                        block = block * volume
 
-                stream.write(data)
-                if on_progress is not None:
-                    on_progress(int(data.size))
+                    if starved_at is not None:
+                        self.underruns.record_end(time.monotonic() - starved_at)
+                        starved_at = None
+                    with span("stream_write", "audio"):
+                        stream.write(block)
+                    has_played = True
+                    if on_progress is not None:
+                        on_progress(int(block.size))
+
+    @staticmethod
+    def _fill(audio_queue: queue.Queue[object], buffered: deque[np.ndarray]) -> bool | None:
+        """Pull one chunk into ``buffered``; returns None once the end sentinel arrives."""
+        try:
+            with span("audio_queue_get", "queue"):
+                chunk = audio_queue.get(timeout=0.1)
+        except queue.Empty:
+            return False
+        if chunk is None:
+            return None
+        data = np.asarray(chunk, dtype=np.float32).reshape(-1)
+        if data.size:
+            buffered.append(data)
+        return True
 
     @staticmethod
     def _default_stream_factory(**kwargs):
@@ -73,3 +223,26 @@ class AudioPlayer:
             channels=kwargs["channels"],
             dtype=kwargs["dtype"],
         )
+
+
+class NullAudioPlayer:
+    """Player for headless front ends: consumes the audio queue without opening an output device."""
+
+    def __init__(self, sample_rate: int = 24_000):
+        self.sample_rate = sample_rate
+        self.underruns = UnderrunStats()
+
+    def play_from_queue(self, audio_queue: queue.Queue[object], stop_event: threading.Event, **_kwargs) -> None:
+        while not stop_event.is_set():
+            try:
+                if audio_queue.get(timeout=0.1) is None:
+                    return
+            except queue.Empty:
+                continue
+
+
+def _abort(stream: object) -> None:
+    """Drop audio the device still holds, so a stop is not followed by a drained tail."""
+    abort = getattr(stream, "abort", None)
+    if callable(abort):
+        abort()
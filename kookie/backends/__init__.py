@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 from importlib.util import find_spec
 
 from ..assets import ResolvedAssets
@@ -19,7 +20,9 @@ def select_backend(
     dependency_probe=None,
 ):
     dependency_probe = dependency_probe or _kokoro_dependencies_available
-    kokoro_factory = kokoro_factory or _default_kokoro_factory
+    kokoro_factory = kokoro_factory or partial(
+        _default_kokoro_factory, sessions=max(1, int(getattr(config, "backend_sessions", 1)))
+    )
 
     mode = config.backend_mode
     if mode == "mock":
@@ -47,10 +50,10 @@ def _kokoro_dependencies_available() -> bool:
     return find_spec("kokoro_onnx") is not None and find_spec("onnxruntime") is not None
 
 
-def _default_kokoro_factory(model_path, voices_path):
+def _default_kokoro_factory(model_path, voices_path, *, sessions: int = 1):
     from .kokoro import KokoroSpeechBackend
 
-    return KokoroSpeechBackend(model_path=model_path, voices_path=voices_path)
+    return KokoroSpeechBackend(model_path=model_path, voices_path=voices_path, sessions=sessions)
 
 
 __all__ = [
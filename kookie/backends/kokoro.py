@@ -1,31 +1,115 @@
 from __future__ import annotations
 
 import os
+import queue
 import sys
-from collections.abc import Iterable, Iterator
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 import numpy as np
 
+from ..tracing import span
+
 
 class KokoroSpeechBackend:
     name = "kokoro"
+    max_concurrent_sessions = 1
 
-    def __init__(self, model_path: str | Path, voices_path: str | Path):
+    def __init__(self, model_path: str | Path, voices_path: str | Path, *, sessions: int = 1):
         self.model_path = Path(model_path)
         self.voices_path = Path(voices_path)
         self._configure_espeak_env()
         self._engine = self._create_engine()
         self._voice_cache: list[str] | None = None
-
-    def synthesize_sentences(self, sentences: Iterable[str], voice: str, speed: float = 1.0) -> Iterator[np.ndarray]:
+        # One engine, and so one ONNX session, per concurrent caller; each sentence checks one out.
+        self.max_concurrent_sessions = max(1, int(sessions))
+        engines = [self._engine, *(self._create_engine() for _ in range(self.max_concurrent_sessions - 1))]
+        self._pool: queue.Queue[tuple[object, _CancellableSession | None]] = queue.Queue()
+        for engine in engines:
+            self._pool.put((engine, _install_cancellable_session(engine)))
+        self._run_options_factory = _run_options_factory()
+        self._inflight: dict[int, tuple[threading.Event, object]] = {}
+        self._inflight_lock = threading.Lock()
+
+    def synthesize_sentences(
+        self,
+        sentences: Iterable[str],
+        voice: str,
+        speed: float = 1.0,
+        cancel_event: threading.Event | None = None,
+    ) -> Iterator[np.ndarray]:
+        """Yield audio per sentence; once ``cancel_event`` is set (see ``cancel``), stop without raising."""
         self.validate_voice(voice)
         bounded_speed = min(2.0, max(0.5, float(speed)))
         for sentence in sentences:
-            result = self._engine.create(sentence, voice=voice, speed=bounded_speed, lang="en-us")
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            try:
+                with self._checkout() as (engine, session), self._cancellable(cancel_event, session):
+                    phonemize = getattr(getattr(engine, "tokenizer", None), "phonemize", None)
+                    if callable(phonemize):
+                        # Phonemize separately so traces can tell espeak time apart from ONNX inference.
+                        with span("phonemize", "backend"):
+                            phonemes = phonemize(sentence, "en-us")
+                        with span("onnx_inference", "backend"):
+                            result = engine.create(
+                                phonemes, voice=voice, speed=bounded_speed, lang="en-us", is_phonemes=True
+                            )
+                    else:
+                        with span("onnx_inference", "backend"):
+                            result = engine.create(sentence, voice=voice, speed=bounded_speed, lang="en-us")
+            except Exception:
+                # A terminated run raises from onnxruntime; that is the cancellation, not a failure.
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+                raise
             audio = _extract_audio(result)
             yield np.asarray(audio, dtype=np.float32).reshape(-1)
 
+    def cancel(self, cancel_event: threading.Event | None = None) -> int:
+        """Terminate in-flight inference started for ``cancel_event`` (all of it when None).
+
+        The onnxruntime run aborts within milliseconds instead of finishing the sentence, freeing the session.
+        Returns the number of runs signalled.
+        """
+        with self._inflight_lock:
+            targets = [
+                options for event, options in self._inflight.values() if cancel_event is None or event is cancel_event
+            ]
+        for options in targets:
+            options.terminate = True  # type: ignore[attr-defined]
+        return len(targets)
+
+    @contextmanager
+    def _checkout(self) -> Iterator[tuple[object, _CancellableSession | None]]:
+        item = self._pool.get()
+        try:
+            yield item
+        finally:
+            self._pool.put(item)
+
+    @contextmanager
+    def _cancellable(
+        self, cancel_event: threading.Event | None, session: _CancellableSession | None
+    ) -> Iterator[None]:
+        if cancel_event is None or session is None or self._run_options_factory is None:
+            yield
+            return
+        options = self._run_options_factory()
+        key = id(options)
+        with self._inflight_lock:
+            self._inflight[key] = (cancel_event, options)
+        if cancel_event.is_set():
+            options.terminate = True
+        try:
+            with session.bind(options):
+                yield
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
     def list_voices(self) -> list[str]:
         if self._voice_cache is not None:
             return list(self._voice_cache)
@@ -80,6 +164,52 @@ class KokoroSpeechBackend:
             os.environ["ESPEAK_DATA_PATH"] = str(candidate_data)
 
 
+class _CancellableSession:
+    """onnxruntime session proxy that runs with the ``RunOptions`` bound to the calling thread.
+
+    ``kokoro_onnx`` calls ``sess.run`` without run options; binding them per thread lets another thread set
+    ``terminate`` on exactly one in-flight inference.
+    """
+
+    def __init__(self, session: object):
+        self._session = session
+        self._local = threading.local()
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._session, name)
+
+    @contextmanager
+    def bind(self, run_options: object) -> Iterator[None]:
+        self._local.run_options = run_options
+        try:
+            yield
+        finally:
+            self._local.run_options = None
+
+    def run(self, output_names, input_feed, run_options=None):
+        options = run_options if run_options is not None else getattr(self._local, "run_options", None)
+        return self._session.run(output_names, input_feed, options)  # type: ignore[attr-defined]
+
+
+def _install_cancellable_session(engine: object) -> _CancellableSession | None:
+    session = getattr(engine, "sess", None)
+    if isinstance(session, _CancellableSession):
+        return session
+    if session is None or not callable(getattr(session, "run", None)):
+        return None
+    proxy = _CancellableSession(session)
+    engine.sess = proxy  # type: ignore[attr-defined]
+    return proxy
+
+
+def _run_options_factory() -> Callable[[], object] | None:
+    try:
+        from onnxruntime import RunOptions  # type: ignore
+    except ImportError:
+        return None
+    return RunOptions
+
+
 def _runtime_base_path() -> Path:
     if getattr(sys, "frozen", False):
         return Path(sys._MEIPASS)  # type: ignore[arg-type]
@@ -7,6 +7,7 @@ import numpy as np
 
 class MockSpeechBackend:
     name = "mock"
+    max_concurrent_sessions = 4
 
     def __init__(
         self,
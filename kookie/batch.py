@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from .app import AppRuntime, create_app
+from .config import load_config
+from .export import SUPPORTED_EXPORT_FORMATS, save_speech_to_audio
+from .pdf_import import PdfImportResult, extract_pdf_content
+
+BATCH_SOURCE_SUFFIXES = (".txt", ".pdf")
+
+PdfLoader = Callable[[Path], PdfImportResult]
+
+
+@dataclass(slots=True)
+class BatchItemResult:
+    source: str
+    output: str
+    status: str
+    elapsed_seconds: float = 0.0
+    characters: int = 0
+    audio_seconds: float = 0.0
+    error: str = ""
+
+
+@dataclass(slots=True)
+class BatchSummary:
+    items: list[BatchItemResult] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    workers: int = 1
+
+    def count(self, status: str) -> int:
+        return sum(1 for item in self.items if item.status == status)
+
+    def to_dict(self) -> dict[str, object]:
+        converted = [item for item in self.items if item.status == "converted"]
+        characters = sum(item.characters for item in converted)
+        audio_seconds = sum(item.audio_seconds for item in converted)
+        elapsed = self.elapsed_seconds
+        return {
+            "total": len(self.items),
+            "converted": len(converted),
+            "skipped": self.count("skipped"),
+            "failed": self.count("failed"),
+            "workers": self.workers,
+            "elapsed_seconds": round(elapsed, 3),
+            "characters": characters,
+            "audio_seconds": round(audio_seconds, 3),
+            "characters_per_second": round(characters / elapsed, 3) if elapsed > 0 else 0.0,
+            "realtime_factor": round(audio_seconds / elapsed, 3) if elapsed > 0 else 0.0,
+            "items": [asdict(item) for item in self.items],
+        }
+
+
+def collect_sources(patterns: Iterable[str]) -> list[Path]:
+    """Expand files, directories (recursively) and glob patterns into supported source files."""
+    found: dict[Path, None] = {}
+    for pattern in patterns:
+        path = Path(pattern).expanduser()
+        if path.is_dir():
+            candidates: Iterable[Path] = sorted(path.rglob("*"))
+        elif path.exists():
+            candidates = [path]
+        else:
+            candidates = sorted(Path(match) for match in glob.glob(str(path), recursive=True))
+        for candidate in candidates:
+            if candidate.is_file() and candidate.suffix.lower() in BATCH_SOURCE_SUFFIXES:
+                found.setdefault(candidate, None)
+    return list(found)
+
+
+def output_path_for(source: Path, *, format: str, output_dir: Path | None = None, root: Path | None = None) -> Path:
+    """Output next to ``source``, or under ``output_dir`` mirroring its directory relative to ``root``."""
+    if output_dir is None:
+        return source.parent / f"{source.stem}.{format}"
+    relative_dir = source.absolute().parent.relative_to(root) if root is not None else Path()
+    return output_dir / relative_dir / f"{source.stem}.{format}"
+
+
+def common_root(sources: Sequence[Path]) -> Path | None:
+    """Deepest directory containing every source, used to mirror the source tree under ``--output-dir``."""
+    if not sources:
+        return None
+    return Path(os.path.commonpath([str(source.parent.absolute()) for source in sources]))
+
+
+def is_up_to_date(source: Path, output: Path) -> bool:
+    try:
+        return output.stat().st_mtime >= source.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+
+def run_batch(
+    sources: Sequence[Path],
+    *,
+    runtime: AppRuntime,
+    format: str = "mp3",
+    output_dir: Path | None = None,
+    workers: int | None = None,
+    force: bool = False,
+    pdf_loader: PdfLoader = extract_pdf_content,
+) -> BatchSummary:
+    if format not in SUPPORTED_EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {format}")
+
+    worker_count = max(1, workers or os.cpu_count() or 1)
+    backend = _SessionLimitedBackend(runtime.backend)
+    sample_rate = int(runtime.config.sample_rate)
+    root = common_root(sources) if output_dir is not None else None
+    claimed: dict[Path, Path] = {}
+    for source in sources:
+        claimed.setdefault(output_path_for(source, format=format, output_dir=output_dir, root=root).absolute(), source)
+
+    def _convert(source: Path) -> BatchItemResult:
+        output = output_path_for(source, format=format, output_dir=output_dir, root=root)
+        result = BatchItemResult(source=str(source), output=str(output), status="converted")
+        owner = claimed[output.absolute()]
+        if owner != source:
+            result.status = "failed"
+            result.error = f"output collides with {owner}"
+            return result
+        if not force and is_up_to_date(source, output):
+            result.status = "skipped"
+            return result
+
+        started = time.perf_counter()
+        encoded_samples = 0
+
+        def _progress(stage: str, samples: int) -> None:
+            nonlocal encoded_samples
+            if stage == "encoded":
+                encoded_samples = samples
+
+        try:
+            text, sentences = _read_source(source, pdf_loader=pdf_loader)
+            result.characters = len(text)
+            _write_atomically(
+                output,
+                lambda partial: save_speech_to_audio(
+                    backend=backend,
+                    text=text,
+                    voice=runtime.selected_voice,
+                    sample_rate=sample_rate,
+                    output_path=partial,
+                    format=format,
+                    sentences=sentences,
+                    progress_callback=_progress,
+                ),
+            )
+        except Exception as exc:
+            result.status = "failed"
+            result.error = str(exc)
+        result.elapsed_seconds = round(time.perf_counter() - started, 3)
+        result.audio_seconds = round(encoded_samples / sample_rate, 3)
+        return result
+
+    summary = BatchSummary(workers=worker_count)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="kookie-batch") as executor:
+        summary.items = list(executor.map(_convert, sources))
+    summary.elapsed_seconds = time.perf_counter() - started
+    return summary
+
+
+def _write_atomically(output: Path, write: Callable[[Path], object]) -> None:
+    """Run ``write`` against a hidden sibling and move it into place, so an interrupted run leaves no output."""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    partial = output.with_name(f".{output.stem}.{os.getpid()}-{threading.get_ident()}.partial{output.suffix}")
+    try:
+        write(partial)
+        os.replace(partial, output)
+    finally:
+        partial.unlink(missing_ok=True)
+
+
+class _SessionLimitedBackend:
+    """Lets batch workers read and encode in parallel while capping concurrent synthesis sessions."""
+
+    def __init__(self, backend: object):
+        self._backend = backend
+        self._slots = threading.BoundedSemaphore(max(1, int(getattr(backend, "max_concurrent_sessions", 1))))
+
+    def synthesize_sentences(self, sentences, voice, **kwargs):
+        with self._slots:
+            yield from self._backend.synthesize_sentences(sentences, voice, **kwargs)
+
+
+def _read_source(source: Path, *, pdf_loader: PdfLoader) -> tuple[str, list[str] | None]:
+    if source.suffix.lower() == ".pdf":
+        result = pdf_loader(source)
+        sentences = list(result.document.sentences) if result.document is not None else None
+        return result.text, sentences
+    return source.read_text(encoding="utf-8"), None
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Convert text and PDF files to audio without the UI")
+    parser.add_argument("paths", nargs="+", help="Files, directories or glob patterns of .txt/.pdf sources.")
+    parser.add_argument("--output-dir", default=None, help="Write outputs here instead of next to each source.")
+    parser.add_argument("--format", choices=SUPPORTED_EXPORT_FORMATS, default="mp3", help="Output audio format.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker threads (default: CPU count).")
+    parser.add_argument("--voice", default=None, help="Voice id (default: KOOKIE_DEFAULT_VOICE).")
+    parser.add_argument("--force", action="store_true", help="Convert even when the output is newer than the source.")
+    parser.add_argument("--summary", default=None, help="Write the JSON summary to this file instead of stdout.")
+    args = parser.parse_args(argv)
+
+    sources = collect_sources(args.paths)
+    if not sources:
+        print("No .txt or .pdf files matched.", file=sys.stderr)
+        return 1
+
+    config = load_config()
+    runtime = create_app(config, headless=True)
+    try:
+        if runtime.backend_name == "mock" and config.backend_mode != "mock":
+            print(runtime.status_message, file=sys.stderr)
+            return 1
+        if args.voice:
+            runtime.set_voice(args.voice)
+
+        output_dir = Path(args.output_dir).expanduser() if args.output_dir else None
+        summary = run_batch(
+            sources,
+            runtime=runtime,
+            format=args.format,
+            output_dir=output_dir,
+            workers=args.workers,
+            force=args.force,
+        )
+    finally:
+        runtime.shutdown()
+
+    payload = json.dumps(summary.to_dict(), indent=2)
+    if args.summary:
+        Path(args.summary).expanduser().write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    return 1 if summary.count("failed") else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -24,11 +24,20 @@ class AppConfig:
     voices_filename: str = "voices.bin"
     model_url: str = DEFAULT_MODEL_URL
     voices_url: str = DEFAULT_VOICES_URL
+    model_mirrors: tuple[str, ...] = ()
+    voices_mirrors: tuple[str, ...] = ()
     model_sha256: str | None = None
     voices_sha256: str | None = None
     default_voice: str = "af_sarah"
     sample_rate: int = 24_000
     download_timeout: float = 30.0
+    download_connections: int = 4
+    download_min_bytes_per_second: int = 65_536
+    network_probe_enabled: bool = True
+    network_probe_endpoints: tuple[str, ...] = ()
+    network_probe_timeout: float = 1.5
+    network_probe_ttl_seconds: float = 30.0
+    network_retry_budget_seconds: float = 120.0
     audio_queue_timeout: float = 0.1
     require_asset_checksums: bool = False
     asset_auto_update: bool = True
@@ -39,6 +48,7 @@ class AppConfig:
     )
     update_check_enabled: bool = True
     update_repo: str = "ematta/kookie"
+    update_check_interval_hours: float = 24.0
     language: str = "en"
     theme: str = "system"
     high_contrast: bool = False
@@ -47,6 +57,22 @@ class AppConfig:
     health_check_port: int = 8765
     synthesis_cache_size: int = 32
     normalization_cache_size: int = 512
+    pdf_stream_playback: bool = False
+    editor_virtual_threshold_chars: int = 200_000
+    export_segment_minutes: float = 0.0
+    export_workers: int = 0
+    export_max_jobs: int = 2
+    backend_sessions: int = 2
+    synthesis_api_enabled: bool = False
+    synthesis_max_concurrent: int = 0
+    synthesis_max_queued: int = 8
+    trace_enabled: bool = False
+    trace_capacity: int = 10_000
+    audio_prebuffer_max_seconds: float = 8.0
+    playback_reuse_cache_seconds: float = 300.0
+    telemetry_max_bytes: int = 5_000_000
+    telemetry_backup_count: int = 3
+    telemetry_compress: bool = False
 
     @classmethod
     def from_env(cls, base: AppConfig | None = None) -> AppConfig:
@@ -90,11 +116,47 @@ class AppConfig:
             ),
             model_url=os.getenv("KOOKIE_MODEL_URL", base_cfg.model_url).strip() or DEFAULT_MODEL_URL,
             voices_url=os.getenv("KOOKIE_VOICES_URL", base_cfg.voices_url).strip() or DEFAULT_VOICES_URL,
+            model_mirrors=_string_list(os.getenv("KOOKIE_MODEL_MIRRORS"), default=base_cfg.model_mirrors),
+            voices_mirrors=_string_list(os.getenv("KOOKIE_VOICES_MIRRORS"), default=base_cfg.voices_mirrors),
             model_sha256=_clean_optional(os.getenv("KOOKIE_MODEL_SHA256")),
             voices_sha256=_clean_optional(os.getenv("KOOKIE_VOICES_SHA256")),
             default_voice=os.getenv("KOOKIE_DEFAULT_VOICE", base_cfg.default_voice).strip() or "af_sarah",
             sample_rate=sample_rate,
             download_timeout=download_timeout,
+            download_connections=max(
+                1,
+                _safe_int(os.getenv("KOOKIE_DOWNLOAD_CONNECTIONS"), default=base_cfg.download_connections),
+            ),
+            download_min_bytes_per_second=max(
+                0,
+                _safe_int(
+                    os.getenv("KOOKIE_DOWNLOAD_MIN_THROUGHPUT"),
+                    default=base_cfg.download_min_bytes_per_second,
+                ),
+            ),
+            network_probe_enabled=_safe_bool(
+                os.getenv("KOOKIE_NETWORK_PROBE"),
+                default=base_cfg.network_probe_enabled,
+            ),
+            network_probe_endpoints=_string_list(
+                os.getenv("KOOKIE_NETWORK_PROBE_ENDPOINTS"),
+                default=base_cfg.network_probe_endpoints,
+            ),
+            network_probe_timeout=_sanitize_positive_float(
+                _safe_float(os.getenv("KOOKIE_NETWORK_PROBE_TIMEOUT"), default=base_cfg.network_probe_timeout),
+                default=1.5,
+            ),
+            network_probe_ttl_seconds=max(
+                0.0,
+                _safe_float(os.getenv("KOOKIE_NETWORK_PROBE_TTL"), default=base_cfg.network_probe_ttl_seconds),
+            ),
+            network_retry_budget_seconds=_sanitize_positive_float(
+                _safe_float(
+                    os.getenv("KOOKIE_NETWORK_RETRY_BUDGET"),
+                    default=base_cfg.network_retry_budget_seconds,
+                ),
+                default=120.0,
+            ),
             audio_queue_timeout=audio_queue_timeout,
             require_asset_checksums=_safe_bool(
                 os.getenv("KOOKIE_REQUIRE_ASSET_CHECKSUMS"),
@@ -123,6 +185,13 @@ class AppConfig:
                 default=base_cfg.update_check_enabled,
             ),
             update_repo=os.getenv("KOOKIE_UPDATE_REPO", base_cfg.update_repo).strip() or "ematta/kookie",
+            update_check_interval_hours=_sanitize_positive_float(
+                _safe_float(
+                    os.getenv("KOOKIE_UPDATE_CHECK_INTERVAL_HOURS"),
+                    default=base_cfg.update_check_interval_hours,
+                ),
+                default=24.0,
+            ),
             language=_sanitize_language(os.getenv("KOOKIE_LANGUAGE", base_cfg.language)),
             theme=_sanitize_theme(os.getenv("KOOKIE_THEME", base_cfg.theme)),
             high_contrast=_safe_bool(
@@ -146,6 +215,67 @@ class AppConfig:
                 64,
                 _safe_int(os.getenv("KOOKIE_TEXT_CACHE_SIZE"), default=base_cfg.normalization_cache_size),
             ),
+            pdf_stream_playback=_safe_bool(
+                os.getenv("KOOKIE_PDF_STREAM_PLAYBACK"),
+                default=base_cfg.pdf_stream_playback,
+            ),
+            editor_virtual_threshold_chars=max(
+                0,
+                _safe_int(
+                    os.getenv("KOOKIE_EDITOR_VIRTUAL_THRESHOLD"),
+                    default=base_cfg.editor_virtual_threshold_chars,
+                ),
+            ),
+            export_segment_minutes=max(
+                0.0,
+                _safe_float(os.getenv("KOOKIE_EXPORT_SEGMENT_MINUTES"), default=base_cfg.export_segment_minutes),
+            ),
+            export_workers=max(0, _safe_int(os.getenv("KOOKIE_EXPORT_WORKERS"), default=base_cfg.export_workers)),
+            export_max_jobs=max(1, _safe_int(os.getenv("KOOKIE_EXPORT_MAX_JOBS"), default=base_cfg.export_max_jobs)),
+            backend_sessions=max(
+                1,
+                _safe_int(os.getenv("KOOKIE_BACKEND_SESSIONS"), default=base_cfg.backend_sessions),
+            ),
+            synthesis_api_enabled=_safe_bool(
+                os.getenv("KOOKIE_SYNTHESIS_API_ENABLED"),
+                default=base_cfg.synthesis_api_enabled,
+            ),
+            synthesis_max_concurrent=max(
+                0,
+                _safe_int(os.getenv("KOOKIE_SYNTHESIS_MAX_CONCURRENT"), default=base_cfg.synthesis_max_concurrent),
+            ),
+            synthesis_max_queued=max(
+                0,
+                _safe_int(os.getenv("KOOKIE_SYNTHESIS_MAX_QUEUED"), default=base_cfg.synthesis_max_queued),
+            ),
+            trace_enabled=_safe_bool(os.getenv("KOOKIE_TRACE_ENABLED"), default=base_cfg.trace_enabled),
+            trace_capacity=max(1, _safe_int(os.getenv("KOOKIE_TRACE_CAPACITY"), default=base_cfg.trace_capacity)),
+            audio_prebuffer_max_seconds=max(
+                0.0,
+                _safe_float(
+                    os.getenv("KOOKIE_AUDIO_PREBUFFER_MAX_SECONDS"),
+                    default=base_cfg.audio_prebuffer_max_seconds,
+                ),
+            ),
+            playback_reuse_cache_seconds=max(
+                0.0,
+                _safe_float(
+                    os.getenv("KOOKIE_PLAYBACK_REUSE_CACHE_SECONDS"),
+                    default=base_cfg.playback_reuse_cache_seconds,
+                ),
+            ),
+            telemetry_max_bytes=max(
+                0,
+                _safe_int(os.getenv("KOOKIE_TELEMETRY_MAX_BYTES"), default=base_cfg.telemetry_max_bytes),
+            ),
+            telemetry_backup_count=max(
+                0,
+                _safe_int(os.getenv("KOOKIE_TELEMETRY_BACKUP_COUNT"), default=base_cfg.telemetry_backup_count),
+            ),
+            telemetry_compress=_safe_bool(
+                os.getenv("KOOKIE_TELEMETRY_COMPRESS"),
+                default=base_cfg.telemetry_compress,
+            ),
         )
 
     @classmethod
@@ -170,6 +300,8 @@ class AppConfig:
             voices_filename=str(_value("voices_filename", cls().voices_filename)).strip() or cls().voices_filename,
             model_url=str(_value("model_url", DEFAULT_MODEL_URL)).strip() or DEFAULT_MODEL_URL,
             voices_url=str(_value("voices_url", DEFAULT_VOICES_URL)).strip() or DEFAULT_VOICES_URL,
+            model_mirrors=_string_list(_value("model_mirrors", None), default=()),
+            voices_mirrors=_string_list(_value("voices_mirrors", None), default=()),
             model_sha256=_clean_optional(_value("model_sha256", None)),
             voices_sha256=_clean_optional(_value("voices_sha256", None)),
             default_voice=str(_value("default_voice", "af_sarah")).strip() or "af_sarah",
@@ -178,6 +310,25 @@ class AppConfig:
                 _safe_float(_value("download_timeout", 30.0), default=30.0),
                 default=30.0,
             ),
+            download_connections=max(1, _safe_int(_value("download_connections", 4), default=4)),
+            download_min_bytes_per_second=max(
+                0,
+                _safe_int(_value("download_min_bytes_per_second", 65_536), default=65_536),
+            ),
+            network_probe_enabled=_safe_bool(_value("network_probe_enabled", True), default=True),
+            network_probe_endpoints=_string_list(
+                _value("network_probe_endpoints", None),
+                default=(),
+            ),
+            network_probe_timeout=_sanitize_positive_float(
+                _safe_float(_value("network_probe_timeout", 1.5), default=1.5),
+                default=1.5,
+            ),
+            network_probe_ttl_seconds=max(0.0, _safe_float(_value("network_probe_ttl_seconds", 30.0), default=30.0)),
+            network_retry_budget_seconds=_sanitize_positive_float(
+                _safe_float(_value("network_retry_budget_seconds", 120.0), default=120.0),
+                default=120.0,
+            ),
             audio_queue_timeout=_sanitize_positive_float(
                 _safe_float(_value("audio_queue_timeout", 0.1), default=0.1),
                 default=0.1,
@@ -197,6 +348,10 @@ class AppConfig:
             ).expanduser(),
             update_check_enabled=_safe_bool(_value("update_check_enabled", True), default=True),
             update_repo=str(_value("update_repo", "ematta/kookie")).strip() or "ematta/kookie",
+            update_check_interval_hours=_sanitize_positive_float(
+                _safe_float(_value("update_check_interval_hours", 24.0), default=24.0),
+                default=24.0,
+            ),
             language=_sanitize_language(_value("language", "en")),
             theme=_sanitize_theme(_value("theme", "system")),
             high_contrast=_safe_bool(_value("high_contrast", False), default=False),
@@ -205,6 +360,31 @@ class AppConfig:
             health_check_port=_sanitize_port(_safe_int(_value("health_check_port", 8765), default=8765)),
             synthesis_cache_size=max(1, _safe_int(_value("synthesis_cache_size", 32), default=32)),
             normalization_cache_size=max(64, _safe_int(_value("normalization_cache_size", 512), default=512)),
+            pdf_stream_playback=_safe_bool(_value("pdf_stream_playback", False), default=False),
+            editor_virtual_threshold_chars=max(
+                0,
+                _safe_int(_value("editor_virtual_threshold_chars", 200_000), default=200_000),
+            ),
+            export_segment_minutes=max(0.0, _safe_float(_value("export_segment_minutes", 0.0), default=0.0)),
+            export_workers=max(0, _safe_int(_value("export_workers", 0), default=0)),
+            export_max_jobs=max(1, _safe_int(_value("export_max_jobs", 2), default=2)),
+            backend_sessions=max(1, _safe_int(_value("backend_sessions", 2), default=2)),
+            synthesis_api_enabled=_safe_bool(_value("synthesis_api_enabled", False), default=False),
+            synthesis_max_concurrent=max(0, _safe_int(_value("synthesis_max_concurrent", 0), default=0)),
+            synthesis_max_queued=max(0, _safe_int(_value("synthesis_max_queued", 8), default=8)),
+            trace_enabled=_safe_bool(_value("trace_enabled", False), default=False),
+            trace_capacity=max(1, _safe_int(_value("trace_capacity", 10_000), default=10_000)),
+            audio_prebuffer_max_seconds=max(
+                0.0,
+                _safe_float(_value("audio_prebuffer_max_seconds", 8.0), default=8.0),
+            ),
+            playback_reuse_cache_seconds=max(
+                0.0,
+                _safe_float(_value("playback_reuse_cache_seconds", 300.0), default=300.0),
+            ),
+            telemetry_max_bytes=max(0, _safe_int(_value("telemetry_max_bytes", 5_000_000), default=5_000_000)),
+            telemetry_backup_count=max(0, _safe_int(_value("telemetry_backup_count", 3), default=3)),
+            telemetry_compress=_safe_bool(_value("telemetry_compress", False), default=False),
         )
 
         if candidate.backend_mode not in {"auto", "mock", "real"}:
@@ -236,6 +416,14 @@ def _safe_float(value: object, default: float) -> float:
         return default
 
 
+def _string_list(value: object, *, default: tuple[str, ...]) -> tuple[str, ...]:
+    """Parse a comma-separated string or a list of strings, dropping blanks."""
+    if value is None:
+        return default
+    items = value.split(",") if isinstance(value, str) else value if isinstance(value, (list, tuple)) else []
+    return tuple(cleaned for item in items if (cleaned := str(item).strip()))
+
+
 def _clean_optional(value: object) -> str | None:
     if value is None:
         return None
@@ -1,16 +1,25 @@
 from __future__ import annotations
 
+import inspect
 import queue
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 
 import numpy as np
 
+from .audio import AdaptiveBufferPolicy
+from .export import ESTIMATED_CHARS_PER_SECOND
+from .monitoring import MetricsStore
 from .text_processing import normalize_text, split_sentences
+from .timeline import SentenceTimeline, SpokenSentence, TextSpan, locate_sentences
+from .tracing import span
+
+# Audio kept for replay after an edit; about 29 MB of float32 samples at 24 kHz.
+DEFAULT_REUSE_CACHE_SECONDS = 300.0
 
 
 class PlaybackState(Enum):
@@ -40,6 +49,9 @@ class PlaybackController:
         chunker: Callable[[str], list[str]] = split_sentences,
         queue_timeout: float = 0.1,
         queue_maxsize: int = 8,
+        metrics: MetricsStore | None = None,
+        buffer_policy: AdaptiveBufferPolicy | None = None,
+        reuse_cache_seconds: float = DEFAULT_REUSE_CACHE_SECONDS,
     ):
         self.backend = backend
         self.audio_player = audio_player
@@ -48,6 +60,8 @@ class PlaybackController:
         self._chunker = chunker
         self._queue_timeout = max(0.01, queue_timeout)
         self._queue_maxsize = max(1, queue_maxsize)
+        self._metrics = metrics
+        self.buffer_policy = buffer_policy
 
         self._lock = threading.Lock()
         self._state = PlaybackState.IDLE
@@ -61,9 +75,26 @@ class PlaybackController:
         self._seek_samples = 0
         self._synthesized_samples = 0
         self._played_samples = 0
+        self._skipped_samples = 0
+        self._timeline = SentenceTimeline()
         self._playback_speed = 1.0
+        self._sentence_feed: queue.Queue[tuple[str, TextSpan] | None] | None = None
+        self._stream_text_offset = 0
+        self._session_started = 0.0
+        self._estimated_audio_seconds: float | None = None
         self._sample_rate = int(getattr(audio_player, "sample_rate", 24_000))
         self.last_error: Exception | None = None
+        # Synthesized audio per (voice, speed, sentence), replayed by later sessions instead of re-synthesized.
+        self._reuse_cache_samples = max(0, int(reuse_cache_seconds * self._sample_rate))
+        self._sentence_audio: dict[tuple[str, float, str], np.ndarray] = {}
+        self._sentence_audio_samples = 0
+        # The last session's sentences and the (speed, audio) of its leading ones, for the prefix a restart keeps.
+        self._session_voice = ""
+        self._session_sentences: list[str] = []
+        self._session_audio: list[tuple[float, np.ndarray]] = []
+        self._session_audio_samples = 0
+        # (sentences, voice, source_text, text_offset) of a restart waiting for the stopped session to wind down.
+        self._queued_session: tuple[list[str], str, str, int] | None = None
 
     @property
     def state(self) -> PlaybackState:
@@ -78,39 +109,159 @@ class PlaybackController:
                 "synthesized_samples": self._synthesized_samples,
             }
 
+    @property
+    def spoken_sentence(self) -> SpokenSentence | None:
+        """Sentence at the current playback position, with its text span in the session's source text."""
+        with self._lock:
+            return self._timeline.at(self._played_samples + self._skipped_samples)
+
     @property
     def volume(self) -> float:
         with self._lock:
             return self._volume
 
-    def start(self, text: str, voice: str = "af_sarah") -> bool:
-        normalized = self._normalizer(text)
+    def start(self, text: str, voice: str = "af_sarah", *, text_offset: int = 0) -> bool:
+        """Speak ``text``; sentence spans are offsets into the normalized text, shifted by ``text_offset``."""
+        with span("normalize", "text", chars=len(text)):
+            normalized = self._normalizer(text)
         if not normalized:
             return False
 
         with self._lock:
-            if self._is_running_locked():
+            if self._busy_locked():
                 return False
 
-            sentences = self._chunker(normalized)
+            with span("chunk", "text"):
+                sentences = self._chunker(normalized)
             if not sentences:
                 return False
 
-            self.last_error = None
-            self._audio_queue = queue.Queue(maxsize=self._queue_maxsize)
-            self._stop_event = threading.Event()
-            self._pause_event = threading.Event()
-            self._seek_samples = 0
-            self._synthesized_samples = 0
-            self._played_samples = 0
-            self._state = PlaybackState.SYNTHESIZING
-            self._synthesis_future = self._executor.submit(self._run_synthesis, sentences, voice)
-            self._audio_future = self._executor.submit(self._run_audio)
+            self._begin_session_locked(sentences, voice, source_text=normalized, text_offset=text_offset)
 
         self._emit("state", PlaybackState.SYNTHESIZING)
         return True
 
+    def restart(self, text: str, voice: str = "af_sarah", *, text_offset: int = 0) -> bool:
+        """Stop the running session, if any, and speak ``text`` from the start.
+
+        Never waits for the old session: the new one is queued and begins once the old workers have wound
+        down, so the UI thread can call this. The leading sentences ``text`` shares with the previous session
+        keep their audio, and synthesis resumes at the first sentence that changed; later unchanged sentences
+        are replayed from memory too.
+        """
+        if not self._is_busy():
+            return self.start(text, voice, text_offset=text_offset)
+        with span("normalize", "text", chars=len(text)):
+            normalized = self._normalizer(text)
+        if not normalized:
+            return False
+        with span("chunk", "text"):
+            sentences = self._chunker(normalized)
+        if not sentences:
+            return False
+
+        with self._lock:
+            running = [future for future in (self._synthesis_future, self._audio_future) if future is not None]
+            if not self._is_running_locked():
+                self._queued_session = None
+                self._begin_session_locked(sentences, voice, source_text=normalized, text_offset=text_offset)
+                running = []
+            else:
+                self._queued_session = (sentences, voice, normalized, text_offset)
+
+        if not running:
+            self._emit("state", PlaybackState.SYNTHESIZING)
+            return True
+        self._stop_session()
+        for future in running:
+            future.add_done_callback(self._begin_queued_session)
+        return True
+
+    def _begin_queued_session(self, _finished: Future[None]) -> None:
+        with self._lock:
+            queued = self._queued_session
+            if queued is None or self._is_running_locked():
+                return
+            self._queued_session = None
+            sentences, voice, source_text, text_offset = queued
+            self._begin_session_locked(sentences, voice, source_text=source_text, text_offset=text_offset)
+        self._emit("state", PlaybackState.SYNTHESIZING)
+
+    def start_sentences(
+        self,
+        sentences: Sequence[str],
+        voice: str = "af_sarah",
+        *,
+        source_text: str | None = None,
+        text_offset: int = 0,
+    ) -> bool:
+        """Start playback from already chunked sentences, skipping normalization.
+
+        When ``source_text`` is given, sentence spans are located in it and shifted by ``text_offset``.
+        """
+        selected = [sentence for sentence in sentences if sentence]
+        if not selected:
+            return False
+
+        with self._lock:
+            if self._busy_locked():
+                return False
+            self._begin_session_locked(selected, voice, source_text=source_text, text_offset=text_offset)
+
+        self._emit("state", PlaybackState.SYNTHESIZING)
+        return True
+
+    def start_stream(self, voice: str = "af_sarah") -> bool:
+        """Start a session whose sentences arrive later through ``feed_text``."""
+        with self._lock:
+            if self._busy_locked():
+                return False
+
+            self._begin_session_locked(None, voice, feed=queue.Queue())
+            self._stream_text_offset = 0
+
+        self._emit("state", PlaybackState.SYNTHESIZING)
+        return True
+
+    def feed_text(self, text: str) -> bool:
+        """Queue more text; spans continue from the end of the previously fed text plus one separator."""
+        normalized = self._normalizer(text)
+        sentences = self._chunker(normalized) if normalized else []
+        with self._lock:
+            feed = self._sentence_feed
+            if feed is None or self._stop_event.is_set():
+                return False
+            for located in locate_sentences(sentences, normalized, text_offset=self._stream_text_offset):
+                feed.put(located)
+            if normalized:
+                self._stream_text_offset += len(normalized) + 1
+        return True
+
+    def finish_stream(self) -> None:
+        with self._lock:
+            feed = self._sentence_feed
+            self._sentence_feed = None
+        if feed is not None:
+            feed.put(None)
+
+    @property
+    def is_streaming(self) -> bool:
+        with self._lock:
+            return self._sentence_feed is not None
+
     def stop(self) -> bool:
+        with self._lock:
+            cancelled = self._queued_session is not None
+            self._queued_session = None
+            # The stopped session held back its idle event for the restart that is now cancelled.
+            announce_idle = cancelled and not self._is_running_locked()
+        if self._stop_session():
+            return True
+        if announce_idle:
+            self._emit("state", PlaybackState.IDLE)
+        return cancelled
+
+    def _stop_session(self) -> bool:
         with self._lock:
             running = self._is_running_locked()
             if not running and self._audio_queue is None:
@@ -121,7 +272,17 @@ class PlaybackController:
             self._stop_event.set()
             self._pause_event.clear()
             self._state = PlaybackState.STOPPING if running else PlaybackState.IDLE
+            self._sentence_feed = None
             audio_queue = self._audio_queue
+            stop_event = self._stop_event
+
+        # Abort the inference in flight so the backend is free now rather than after the current sentence.
+        cancel = getattr(self.backend, "cancel", None)
+        if callable(cancel):
+            try:
+                cancel(stop_event)
+            except Exception:
+                pass
 
         if audio_queue is not None:
             try:
@@ -136,7 +297,7 @@ class PlaybackController:
         deadline = time.time() + timeout
         while time.time() < deadline:
             current_state = self.state
-            if current_state in {PlaybackState.IDLE, PlaybackState.ERROR} and not self._is_running():
+            if current_state in {PlaybackState.IDLE, PlaybackState.ERROR} and not self._is_busy():
                 return
             time.sleep(0.01)
 
@@ -185,24 +346,160 @@ class PlaybackController:
             self._playback_speed = bounded
         return bounded
 
-    def _run_synthesis(self, sentences: list[str], voice: str) -> None:
+    def _begin_session_locked(
+        self,
+        sentences: Iterable[str] | None,
+        voice: str,
+        *,
+        feed: queue.Queue[tuple[str, TextSpan] | None] | None = None,
+        source_text: str | None = None,
+        text_offset: int = 0,
+    ) -> None:
+        self.last_error = None
+        known = list(sentences) if isinstance(sentences, Sequence) else None
+        prefix = self._reusable_prefix_locked(voice, known)
+        self._session_voice = voice
+        self._session_sentences = known or []
+        self._session_audio = []
+        self._session_audio_samples = 0
+        self._prune_sentence_audio_locked(voice, known)
+        self._audio_queue = queue.Queue(maxsize=self._queue_maxsize)
+        self._stop_event = threading.Event()
+        self._pause_event = threading.Event()
+        self._sentence_feed = feed
+        located: Iterable[tuple[str, TextSpan]]
+        if feed is not None:
+            located = self._iter_sentence_feed(feed, self._stop_event)
+        else:
+            assert sentences is not None
+            located = locate_sentences(sentences, source_text, text_offset=text_offset)
+        self._seek_samples = 0
+        self._synthesized_samples = 0
+        self._played_samples = 0
+        self._skipped_samples = 0
+        self._timeline = SentenceTimeline()
+        self._session_started = time.perf_counter()
+        if isinstance(sentences, Sequence):
+            total_chars = sum(len(sentence) for sentence in sentences)
+            self._estimated_audio_seconds = total_chars / ESTIMATED_CHARS_PER_SECOND
+        else:
+            self._estimated_audio_seconds = None
+        self._state = PlaybackState.SYNTHESIZING
+        self._synthesis_future = self._executor.submit(self._run_synthesis, located, voice, prefix)
+        self._audio_future = self._executor.submit(self._run_audio)
+
+    def _iter_sentence_feed(
+        self,
+        feed: queue.Queue[tuple[str, TextSpan] | None],
+        stop_event: threading.Event,
+    ) -> Iterator[tuple[str, TextSpan]]:
+        while not stop_event.is_set():
+            try:
+                located = feed.get(timeout=self._queue_timeout)
+            except queue.Empty:
+                continue
+            if located is None:
+                return
+            yield located
+
+    def _run_synthesis(self, located: Iterable[tuple[str, TextSpan]], voice: str, prefix: list[np.ndarray]) -> None:
+        """Queue the kept ``prefix`` audio, then synthesize the remaining sentences, replaying cached ones."""
         assert self._audio_queue is not None
-        try:
-            for chunk in self._synthesize_chunks(sentences, voice):
-                if self._stop_event.is_set():
+        audio_queue = self._audio_queue
+        inference_seconds = 0.0
+        inferred_samples = 0
+        first_audio = True
+        remaining = iter(located)
+        # Backends pull one sentence per chunk, so the last sentence pulled labels the next chunk.
+        current: tuple[str, TextSpan] = ("", (0, 0))
+        # A cached sentence met while feeding the backend; its audio is queued once that backend run ends.
+        held: list[tuple[str, TextSpan, np.ndarray]] = []
+        exhausted = False
+        speed = self._playback_speed
+        # Time spent waiting on the sentence source (e.g. a streaming PDF feed), kept out of inference timings.
+        feed_wait = 0.0
+
+        def _uncached() -> Iterator[str]:
+            nonlocal current, exhausted, feed_wait
+            while True:
+                wait_started = time.perf_counter()
+                item = next(remaining, None)
+                feed_wait += time.perf_counter() - wait_started
+                if item is None:
                     break
-                data = np.asarray(chunk, dtype=np.float32).reshape(-1)
-                if data.size == 0:
-                    continue
-                with self._lock:
-                    self._synthesized_samples += int(data.size)
-
+                sentence, sentence_span = item
+                cached = self._cached_sentence_audio(voice, speed, sentence)
+                if cached is not None:
+                    held.append((sentence, sentence_span, cached))
+                    return
+                current = (sentence, sentence_span)
+                yield sentence
+            exhausted = True
+
+        def _deliver(data: np.ndarray, sentence: str, text_span: TextSpan) -> None:
+            nonlocal first_audio
+            with self._lock:
+                self._synthesized_samples += int(data.size)
+                self._timeline.append(int(data.size), *text_span)
+                self._record_session_audio_locked(sentence, speed, data)
+            with span("audio_queue_put", "queue"):
                 while not self._stop_event.is_set():
                     try:
-                        self._audio_queue.put(data, timeout=self._queue_timeout)
+                        audio_queue.put(data, timeout=self._queue_timeout)
                         break
                     except queue.Full:
                         continue
+            if first_audio:
+                first_audio = False
+                self._observe("time_to_first_audio_seconds", time.perf_counter() - self._session_started)
+            if self._metrics is not None:
+                self._metrics.set_gauge("audio_queue_depth", audio_queue.qsize())
+
+        try:
+            # ``remaining`` goes second so zip stops without pulling a sentence past the prefix.
+            kept = 0
+            for data, (sentence, sentence_span) in zip(prefix, remaining, strict=False):
+                if self._stop_event.is_set():
+                    break
+                _deliver(data, sentence, sentence_span)
+                kept += 1
+            if kept and self._metrics is not None:
+                self._metrics.increment("sentences_reused", kept)
+            while not self._stop_event.is_set():
+                speed = self._playback_speed
+                chunks = iter(self._synthesize_chunks(_uncached(), voice))
+                while True:
+                    inference_started = time.perf_counter()
+                    waited_before = feed_wait
+                    with span("synthesize_sentence", "synthesis"):
+                        chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    elapsed = max(0.0, time.perf_counter() - inference_started - (feed_wait - waited_before))
+                    inference_seconds += elapsed
+                    if self._stop_event.is_set():
+                        break
+                    data = np.asarray(chunk, dtype=np.float32).reshape(-1)
+                    if data.size == 0:
+                        continue
+                    inferred_samples += int(data.size)
+                    self._observe("sentence_inference_seconds", elapsed)
+                    if self.buffer_policy is not None:
+                        self.buffer_policy.record_synthesis(data.size / self._sample_rate, elapsed)
+                    self._remember_sentence_audio(voice, speed, current[0], data)
+                    _deliver(data, *current)
+                if not held:
+                    # The input ran out, or the backend stopped pulling from it.
+                    break
+                for sentence, text_span, cached in held:
+                    _deliver(cached, sentence, text_span)
+                if self._metrics is not None:
+                    self._metrics.increment("sentences_reused", len(held))
+                held.clear()
+                if exhausted:
+                    break
+            if inference_seconds > 0 and inferred_samples:
+                self._observe("synthesis_realtime_factor", inferred_samples / self._sample_rate / inference_seconds)
         except Exception as exc:
             self.last_error = exc
             with self._lock:
@@ -210,10 +507,58 @@ class PlaybackController:
             self._emit("error", PlaybackState.ERROR, str(exc))
         finally:
             try:
-                self._audio_queue.put(None, timeout=self._queue_timeout)
+                audio_queue.put(None, timeout=self._queue_timeout)
             except queue.Full:
                 pass
 
+    def _cached_sentence_audio(self, voice: str, speed: float, sentence: str) -> np.ndarray | None:
+        with self._lock:
+            return self._sentence_audio.get((voice, speed, sentence))
+
+    def _remember_sentence_audio(self, voice: str, speed: float, sentence: str, data: np.ndarray) -> None:
+        key = (voice, speed, sentence)
+        with self._lock:
+            if key in self._sentence_audio:
+                return
+            if self._sentence_audio_samples + int(data.size) > self._reuse_cache_samples:
+                return
+            self._sentence_audio[key] = data
+            self._sentence_audio_samples += int(data.size)
+
+    def _reusable_prefix_locked(self, voice: str, sentences: list[str] | None) -> list[np.ndarray]:
+        """Audio of the previous session's leading sentences that ``sentences`` starts with unchanged."""
+        if sentences is None or voice != self._session_voice:
+            return []
+        speed = self._playback_speed
+        prefix: list[np.ndarray] = []
+        session = zip(self._session_sentences, sentences, self._session_audio, strict=False)
+        for previous, sentence, (audio_speed, audio) in session:
+            if previous != sentence or audio_speed != speed:
+                break
+            prefix.append(audio)
+        return prefix
+
+    def _record_session_audio_locked(self, sentence: str, speed: float, data: np.ndarray) -> None:
+        """Extend the session's kept prefix with ``sentence``'s audio while it is in order and within budget."""
+        index = len(self._session_audio)
+        if index >= len(self._session_sentences) or self._session_sentences[index] != sentence:
+            return
+        if self._session_audio_samples + int(data.size) > self._reuse_cache_samples:
+            return
+        self._session_audio.append((speed, data))
+        self._session_audio_samples += int(data.size)
+
+    def _prune_sentence_audio_locked(self, voice: str, sentences: Sequence[str] | None) -> None:
+        """Drop cached audio the new session cannot use; sessions of unknown length keep the voice's entries."""
+        wanted = set(sentences) if sentences is not None else None
+        speed = self._playback_speed
+        self._sentence_audio = {
+            key: audio
+            for key, audio in self._sentence_audio.items()
+            if key[0] == voice and key[1] == speed and (wanted is None or key[2] in wanted)
+        }
+        self._sentence_audio_samples = sum(int(audio.size) for audio in self._sentence_audio.values())
+
     def _run_audio(self) -> None:
         assert self._audio_queue is not None
 
@@ -235,7 +580,9 @@ class PlaybackController:
                 if self._state is not PlaybackState.ERROR:
                     self._state = PlaybackState.IDLE
                 self._cleanup_completed_locked()
-            if self.state is PlaybackState.IDLE:
+                # A queued restart follows at once; announcing idle in between would flash "Ready".
+                announce = self._state is PlaybackState.IDLE and self._queued_session is None
+            if announce:
                 self._emit("state", PlaybackState.IDLE)
 
     def _join_futures(self, timeout: float = 0.1) -> None:
@@ -253,9 +600,12 @@ class PlaybackController:
             except Exception:
                 pass
 
-    def _is_running(self) -> bool:
+    def _is_busy(self) -> bool:
         with self._lock:
-            return self._is_running_locked()
+            return self._busy_locked()
+
+    def _busy_locked(self) -> bool:
+        return self._is_running_locked() or self._queued_session is not None
 
     def _is_running_locked(self) -> bool:
         self._cleanup_completed_locked()
@@ -275,34 +625,64 @@ class PlaybackController:
         with self._lock:
             pending = self._seek_samples
             self._seek_samples = 0
+            self._skipped_samples += pending
             return pending
 
     def _on_audio_progress(self, sample_count: int) -> None:
         with self._lock:
             self._played_samples += max(0, int(sample_count))
+            state = self._state
+        self._emit("progress", state)
 
     def _get_volume(self) -> float:
         with self._lock:
             return self._volume
 
+    def _on_audio_underrun(self) -> None:
+        if self._metrics is not None:
+            self._metrics.increment("audio_underruns")
+        if self.buffer_policy is not None:
+            self.buffer_policy.record_underrun()
+
+    def _prebuffer_samples(self) -> int:
+        policy = self.buffer_policy
+        if policy is None:
+            return 0
+        with self._lock:
+            estimated = self._estimated_audio_seconds
+            synthesized_seconds = self._synthesized_samples / self._sample_rate
+        remaining = None if estimated is None else max(0.0, estimated - synthesized_seconds)
+        return int(policy.target_seconds(remaining) * self._sample_rate)
+
+    def _observe(self, key: str, value: float) -> None:
+        if self._metrics is not None:
+            self._metrics.observe(key, value)
+
     def _play_audio_queue(self) -> None:
         assert self._audio_queue is not None
+        play = self.audio_player.play_from_queue
+        options: dict[str, object] = {
+            "pause_event": self._pause_event,
+            "volume_getter": self._get_volume,
+            "on_progress": self._on_audio_progress,
+            "consume_seek_samples": self._consume_seek_samples,
+        }
+        if _accepts_keyword(play, "on_underrun"):
+            options["on_underrun"] = self._on_audio_underrun
+        if self.buffer_policy is not None and _accepts_keyword(play, "prebuffer_samples"):
+            options["prebuffer_samples"] = self._prebuffer_samples
         try:
-            self.audio_player.play_from_queue(
-                self._audio_queue,
-                self._stop_event,
-                pause_event=self._pause_event,
-                volume_getter=self._get_volume,
-                on_progress=self._on_audio_progress,
-                consume_seek_samples=self._consume_seek_samples,
-            )
+            play(self._audio_queue, self._stop_event, **options)
         except TypeError:
             # Backward compatibility for older test doubles/custom players.
             self.audio_player.play_from_queue(self._audio_queue, self._stop_event)
 
-    def _synthesize_chunks(self, sentences: list[str], voice: str):
+    def _synthesize_chunks(self, sentences: Iterable[str], voice: str):
+        options: dict[str, object] = {}
+        if _accepts_keyword(self.backend.synthesize_sentences, "cancel_event"):
+            options["cancel_event"] = self._stop_event
         try:
-            return self.backend.synthesize_sentences(sentences, voice, speed=self._playback_speed)
+            return self.backend.synthesize_sentences(sentences, voice, speed=self._playback_speed, **options)
         except TypeError:
             return self.backend.synthesize_sentences(sentences, voice)
 
@@ -310,3 +690,11 @@ class PlaybackController:
         if self._on_event is None:
             return
         self._on_event(ControllerEvent(kind=kind, state=state, message=message))
+
+
+def _accepts_keyword(func: Callable[..., object], name: str) -> bool:
+    try:
+        parameters = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+    return name in parameters or any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values())
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+from .text_processing import split_sentences
+
+PAGE_SEPARATOR = "\n\n"
+
+
+@dataclass(slots=True)
+class DocumentModel:
+    """Page-indexed view of an imported document.
+
+    Pages are stored once in ``buffer`` (joined with ``PAGE_SEPARATOR``) and addressed through
+    offset arrays, so page and sentence lookups never re-scan the whole text.
+    """
+
+    buffer: str
+    page_numbers: tuple[int, ...]
+    page_starts: array
+    page_ends: array
+    sentences: tuple[str, ...]
+    sentence_starts: array
+    _page_lookup: dict[int, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self._page_lookup:
+            self._page_lookup = {number: idx for idx, number in enumerate(self.page_numbers)}
+
+    @classmethod
+    def from_pages(
+        cls,
+        pages: Iterable[tuple[int, str]],
+        *,
+        chunker: Callable[[str], list[str]] = split_sentences,
+    ) -> DocumentModel:
+        page_numbers: list[int] = []
+        page_texts: list[str] = []
+        page_starts = array("q")
+        page_ends = array("q")
+        sentence_starts = array("q", [0])
+        sentences: list[str] = []
+
+        offset = 0
+        for page_number, text in pages:
+            if page_texts:
+                offset += len(PAGE_SEPARATOR)
+            page_numbers.append(int(page_number))
+            page_texts.append(text)
+            page_starts.append(offset)
+            offset += len(text)
+            page_ends.append(offset)
+            sentences.extend(chunker(text))
+            sentence_starts.append(len(sentences))
+
+        return cls(
+            buffer=PAGE_SEPARATOR.join(page_texts),
+            page_numbers=tuple(page_numbers),
+            page_starts=page_starts,
+            page_ends=page_ends,
+            sentences=tuple(sentences),
+            sentence_starts=sentence_starts,
+        )
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_numbers)
+
+    def has_page(self, page_number: int) -> bool:
+        return page_number in self._page_lookup
+
+    def page_span(self, page_number: int) -> tuple[int, int]:
+        idx = self._page_index(page_number)
+        return self.page_starts[idx], self.page_ends[idx]
+
+    def page_text(self, page_number: int) -> str:
+        start, end = self.page_span(page_number)
+        return self.buffer[start:end]
+
+    def sentence_range(self, page_number: int) -> range:
+        idx = self._page_index(page_number)
+        return range(self.sentence_starts[idx], self.sentence_starts[idx + 1])
+
+    def sentences_from_page(self, page_number: int) -> list[str]:
+        start = self.sentence_range(page_number).start
+        return list(self.sentences[start:])
+
+    def sentences_for_pages(self, first_page: int, last_page: int) -> list[str]:
+        first, last = self._page_bounds(first_page, last_page)
+        return list(self.sentences[self.sentence_starts[first] : self.sentence_starts[last + 1]])
+
+    def page_sentences(self, first_page: int | None = None, last_page: int | None = None) -> list[list[str]]:
+        """Sentences grouped by page, for every page or for ``first_page`` through ``last_page``."""
+        if not self.page_numbers:
+            return []
+        first, last = self._page_bounds(
+            self.page_numbers[0] if first_page is None else first_page,
+            self.page_numbers[-1] if last_page is None else last_page,
+        )
+        return [
+            list(self.sentences[self.sentence_starts[idx] : self.sentence_starts[idx + 1]])
+            for idx in range(first, last + 1)
+        ]
+
+    def text_for_pages(self, first_page: int, last_page: int) -> str:
+        first, last = self._page_bounds(first_page, last_page)
+        return self.buffer[self.page_starts[first] : self.page_ends[last]]
+
+    def page_at_offset(self, offset: int) -> int:
+        if not self.page_numbers:
+            raise ValueError("Document has no pages")
+        idx = max(0, bisect_right(self.page_starts, offset) - 1)
+        return self.page_numbers[idx]
+
+    def page_for_sentence(self, sentence_index: int) -> int:
+        if not 0 <= sentence_index < len(self.sentences):
+            raise ValueError(f"Sentence index out of range: {sentence_index}")
+        idx = bisect_right(self.sentence_starts, sentence_index) - 1
+        return self.page_numbers[idx]
+
+    def _page_index(self, page_number: int) -> int:
+        try:
+            return self._page_lookup[page_number]
+        except KeyError as exc:
+            raise ValueError(f"Page {page_number} is not loaded") from exc
+
+    def _page_bounds(self, first_page: int, last_page: int) -> tuple[int, int]:
+        first = self._page_index(first_page)
+        last = self._page_index(last_page)
+        if last < first:
+            raise ValueError("Page range must be in document order")
+        return first, last
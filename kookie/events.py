@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Callable, Hashable
+
+# Pending events kept before the oldest droppable ones are dropped.
+DEFAULT_MAX_PENDING_EVENTS = 256
+
+
+class EventDispatcher[T]:
+    """Delivers events to ``handler`` on a dedicated thread.
+
+    ``emit`` never blocks: it appends to a bounded queue and returns. An event whose ``coalesce_key`` matches
+    the newest pending event replaces it, so a burst of repeated updates costs one delivery while the order of
+    distinct events is kept. When the queue is full the oldest pending ``droppable`` event (by default, any
+    event with a coalesce key) is dropped and counted in ``dropped``; other events, such as errors or a final
+    state change, are always delivered, even past ``max_pending``. Handler errors are swallowed.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[T], None],
+        *,
+        coalesce_key: Callable[[T], Hashable | None] | None = None,
+        droppable: Callable[[T], bool] | None = None,
+        max_pending: int = DEFAULT_MAX_PENDING_EVENTS,
+        name: str = "kookie-events",
+    ):
+        self._handler = handler
+        self._coalesce_key = coalesce_key
+        self._droppable = droppable
+        self._max_pending = max(1, int(max_pending))
+        self._name = name
+        self._pending: deque[list[object]] = deque()
+        self._condition = threading.Condition()
+        self._delivering = False
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self.dropped = 0
+
+    def emit(self, event: T) -> None:
+        key = self._coalesce_key(event) if self._coalesce_key is not None else None
+        droppable = key is not None if self._droppable is None else bool(self._droppable(event))
+        with self._condition:
+            if self._closed:
+                return
+            if key is not None and self._pending and self._pending[-1][0] == key:
+                self._pending[-1][1:] = [event, droppable]
+                return
+            if len(self._pending) >= self._max_pending:
+                self._drop_oldest_locked()
+            self._pending.append([key, event, droppable])
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name=self._name)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Block until every event emitted so far has been handled."""
+        if threading.current_thread() is self._thread:
+            return not self._pending
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._delivering, timeout=timeout)
+
+    def close(self, timeout: float = 2.0) -> None:
+        self.flush(timeout=timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+
+    def _drop_oldest_locked(self) -> None:
+        for index, (_, _, droppable) in enumerate(self._pending):
+            if droppable:
+                del self._pending[index]
+                self.dropped += 1
+                return
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                _, event, _ = self._pending.popleft()
+                self._delivering = True
+            try:
+                self._handler(event)  # type: ignore[arg-type]
+            except Exception:
+                pass
+            finally:
+                with self._condition:
+                    self._delivering = False
+                    self._condition.notify_all()
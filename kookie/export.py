@@ -2,16 +2,40 @@ from __future__ import annotations
 
 import os
 import shutil
+import struct
 import subprocess
 import sys
+import tempfile
+import threading
 import wave
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
 
 from .errors import ErrorCategory, ErrorCode, KookieError
 from .text_processing import normalize_text, split_sentences
+from .tracing import span
+
+# Rough Kokoro speaking rate at 1.0x, used to size segments before any audio exists.
+ESTIMATED_CHARS_PER_SECOND = 15.0
+SUPPORTED_EXPORT_FORMATS = ("mp3", "wav")
+
+# Called with ("synthesized" | "encoded", cumulative sample count).
+ProgressCallback = Callable[[str, int], None]
+
+
+class ExportCancelledError(RuntimeError):
+    """Raised when an export is cancelled through its cancel event."""
+
+
+@dataclass(frozen=True, slots=True)
+class ExportTarget:
+    output_path: Path
+    format: str = "mp3"
+    quality: int = 2
 
 
 def save_speech_to_mp3(
@@ -25,6 +49,9 @@ def save_speech_to_mp3(
     chunker: Callable[[str], list[str]] = split_sentences,
     encoder: Callable[[np.ndarray, int, Path], None] | None = None,
     quality: int = 2,
+    sentences: Sequence[str] | None = None,
+    progress_callback: ProgressCallback | None = None,
+    cancel_event: threading.Event | None = None,
 ) -> Path:
     return save_speech_to_audio(
         backend=backend,
@@ -37,6 +64,9 @@ def save_speech_to_mp3(
         chunker=chunker,
         encoder=encoder,
         quality=quality,
+        sentences=sentences,
+        progress_callback=progress_callback,
+        cancel_event=cancel_event,
     )
 
 
@@ -52,40 +82,264 @@ def save_speech_to_audio(
     chunker: Callable[[str], list[str]] = split_sentences,
     encoder: Callable[[np.ndarray, int, Path], None] | None = None,
     quality: int = 2,
+    sentences: Sequence[str] | None = None,
+    progress_callback: ProgressCallback | None = None,
+    cancel_event: threading.Event | None = None,
 ) -> Path:
-    normalized = normalizer(text)
-    if not normalized:
-        raise ValueError("No text to synthesize")
+    selected_sentences = _resolve_sentences(text, sentences, normalizer=normalizer, chunker=chunker)
+    selected_encoder = _select_encoder(format, encoder=encoder, quality=quality)
+    merged = _synthesize_pcm(
+        backend,
+        selected_sentences,
+        voice,
+        progress_callback=progress_callback,
+        cancel_event=cancel_event,
+    )
 
-    sentences = chunker(normalized)
-    if not sentences:
-        raise ValueError("No text to synthesize")
+    output = output_path.expanduser()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with span("export_encode", "export", format=format):
+        selected_encoder(merged, sample_rate, output)
+    if progress_callback is not None:
+        progress_callback("encoded", int(merged.size))
+    return output
 
-    chunks: list[np.ndarray] = []
-    for chunk in backend.synthesize_sentences(sentences, voice):
-        data = np.asarray(chunk, dtype=np.float32).reshape(-1)
-        if data.size > 0:
-            chunks.append(data)
 
-    if not chunks:
-        raise ValueError("No synthesized audio to save")
+def save_speech_to_targets(
+    *,
+    backend,
+    text: str,
+    voice: str,
+    sample_rate: int,
+    targets: Sequence[ExportTarget],
+    normalizer: Callable[[str], str] = normalize_text,
+    chunker: Callable[[str], list[str]] = split_sentences,
+    sentences: Sequence[str] | None = None,
+    runner: Callable[..., object] = subprocess.run,
+    progress_callback: ProgressCallback | None = None,
+    cancel_event: threading.Event | None = None,
+) -> list[Path]:
+    """Synthesize once and write the audio to every target.
+
+    All MP3 targets share one ffmpeg process with multiple outputs; WAV targets are written
+    directly from the same PCM buffer.
+    """
+    if not targets:
+        raise ValueError("At least one export target is required")
+    for target in targets:
+        if target.format.strip().lower() not in SUPPORTED_EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {target.format}")
+
+    selected_sentences = _resolve_sentences(text, sentences, normalizer=normalizer, chunker=chunker)
+    merged = _synthesize_pcm(
+        backend,
+        selected_sentences,
+        voice,
+        progress_callback=progress_callback,
+        cancel_event=cancel_event,
+    )
+
+    outputs = [target.output_path.expanduser() for target in targets]
+    for output in outputs:
+        output.parent.mkdir(parents=True, exist_ok=True)
+
+    mp3_outputs = [
+        (output, target.quality)
+        for target, output in zip(targets, outputs, strict=True)
+        if target.format.strip().lower() == "mp3"
+    ]
+    if mp3_outputs:
+        with span("export_encode", "export", format="mp3", outputs=len(mp3_outputs)):
+            encode_mp3_outputs(merged, sample_rate, mp3_outputs, runner=runner)
+    for target, output in zip(targets, outputs, strict=True):
+        if target.format.strip().lower() == "wav":
+            encode_wav(merged, sample_rate, output)
+    if progress_callback is not None:
+        progress_callback("encoded", int(merged.size))
+    return outputs
+
+
+def partition_sentences(
+    sentences: Sequence[str],
+    *,
+    segment_minutes: float,
+    chars_per_second: float = ESTIMATED_CHARS_PER_SECOND,
+) -> list[list[str]]:
+    """Group sentences into segments of roughly ``segment_minutes`` of speech each."""
+    budget = _segment_budget(segment_minutes, chars_per_second)
+    segments: list[list[str]] = []
+    current: list[str] = []
+    current_chars = 0
+    for sentence in sentences:
+        if current and current_chars + len(sentence) > budget:
+            segments.append(current)
+            current = []
+            current_chars = 0
+        current.append(sentence)
+        current_chars += len(sentence)
+    if current:
+        segments.append(current)
+    return segments
 
+
+def partition_pages(
+    pages: Sequence[Sequence[str]],
+    *,
+    segment_minutes: float,
+    chars_per_second: float = ESTIMATED_CHARS_PER_SECOND,
+) -> list[list[str]]:
+    """Group whole pages into segments of roughly ``segment_minutes`` of speech each.
+
+    Segments break between pages; only a page longer than a segment is split between its sentences.
+    """
+    budget = _segment_budget(segment_minutes, chars_per_second)
+    segments: list[list[str]] = []
+    current: list[str] = []
+    current_chars = 0
+    for page in pages:
+        page_chars = sum(len(sentence) for sentence in page)
+        if not page_chars:
+            continue
+        if current and current_chars + page_chars > budget:
+            segments.append(current)
+            current = []
+            current_chars = 0
+        if page_chars > budget:
+            segments.extend(
+                partition_sentences(page, segment_minutes=segment_minutes, chars_per_second=chars_per_second)
+            )
+            continue
+        current.extend(page)
+        current_chars += page_chars
+    if current:
+        segments.append(current)
+    return segments
+
+
+def _segment_budget(segment_minutes: float, chars_per_second: float) -> int:
+    if segment_minutes <= 0:
+        raise ValueError("segment_minutes must be greater than zero")
+    return max(1, int(segment_minutes * 60.0 * chars_per_second))
+
+
+def save_speech_segmented(
+    *,
+    backend,
+    segments: Sequence[Sequence[str]],
+    voice: str,
+    sample_rate: int,
+    output_path: Path,
+    format: str = "mp3",
+    encoder: Callable[[np.ndarray, int, Path], None] | None = None,
+    quality: int = 2,
+    max_workers: int | None = None,
+    runner: Callable[..., object] = subprocess.run,
+    progress_callback: ProgressCallback | None = None,
+    cancel_event: threading.Event | None = None,
+) -> Path:
+    """Synthesize and encode each segment in parallel, then join the encoded pieces.
+
+    Workers are capped at the backend's ``max_concurrent_sessions`` since they all share ``backend``.
+
+    MP3 segments are joined with ffmpeg's concat demuxer (``-c copy``) and WAV segments by
+    appending frames, so no segment is re-encoded.
+    """
+    selected_segments = [list(segment) for segment in segments if segment]
+    if not selected_segments:
+        raise ValueError("No text to synthesize")
+
+    selected_format = format.strip().lower()
+    selected_encoder = _select_encoder(selected_format, encoder=encoder, quality=quality)
     output = output_path.expanduser()
     output.parent.mkdir(parents=True, exist_ok=True)
+    sessions = max(1, int(getattr(backend, "max_concurrent_sessions", 1)))
+    workers = max(1, min(len(selected_segments), sessions, max_workers or os.cpu_count() or 1))
 
-    merged = np.concatenate(chunks).astype(np.float32, copy=False)
-    selected_format = format.strip().lower()
-    if selected_format == "mp3":
-        selected_encoder = encoder or (lambda audio, sr, path: encode_mp3(audio, sr, path, quality=quality))
-        selected_encoder(merged, sample_rate, output)
-    elif selected_format == "wav":
-        selected_encoder = encoder or encode_wav
-        selected_encoder(merged, sample_rate, output)
-    else:
-        raise ValueError(f"Unsupported export format: {format}")
+    with tempfile.TemporaryDirectory(prefix=f".{output.stem}-", dir=output.parent) as work_dir:
+        segment_paths = [
+            Path(work_dir) / f"segment-{idx:04d}.{selected_format}" for idx in range(len(selected_segments))
+        ]
+
+        totals = {"synthesized": 0, "encoded": 0}
+        totals_lock = threading.Lock()
+
+        def _add_progress(stage: str, samples: int) -> None:
+            with totals_lock:
+                totals[stage] += samples
+                current = totals[stage]
+            if progress_callback is not None:
+                progress_callback(stage, current)
+
+        def _render(idx: int) -> Path:
+            segment_synthesized = 0
+
+            def _segment_progress(_stage: str, samples: int) -> None:
+                nonlocal segment_synthesized
+                _add_progress("synthesized", samples - segment_synthesized)
+                segment_synthesized = samples
+
+            audio = _synthesize_pcm(
+                backend,
+                selected_segments[idx],
+                voice,
+                progress_callback=_segment_progress,
+                cancel_event=cancel_event,
+            )
+            with span("export_encode", "export", format=selected_format, segment=idx):
+                selected_encoder(audio, sample_rate, segment_paths[idx])
+            _add_progress("encoded", int(audio.size))
+            return segment_paths[idx]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kookie-export") as executor:
+            rendered = list(executor.map(_render, range(len(selected_segments))))
+
+        with span("export_concat", "export", segments=len(rendered)):
+            if len(rendered) == 1:
+                os.replace(rendered[0], output)
+            elif selected_format == "wav":
+                concat_wav(rendered, output)
+            else:
+                concat_with_ffmpeg(rendered, output, work_dir=Path(work_dir), runner=runner)
     return output
 
 
+def concat_with_ffmpeg(
+    segment_paths: Sequence[Path],
+    output_path: Path,
+    *,
+    work_dir: Path,
+    runner: Callable[..., object] = subprocess.run,
+) -> None:
+    list_path = work_dir / "segments.txt"
+    list_path.write_text(
+        "".join(f"file '{_concat_list_escape(path)}'\n" for path in segment_paths),
+        encoding="utf-8",
+    )
+    command = [
+        _resolve_ffmpeg_executable(),
+        "-y",
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        str(list_path),
+        "-c",
+        "copy",
+        str(output_path),
+    ]
+    _run_ffmpeg(command, runner=runner, action="MP3 concatenation")
+
+
+def concat_wav(segment_paths: Sequence[Path], output_path: Path) -> None:
+    with wave.open(str(output_path), "wb") as output:
+        for idx, path in enumerate(segment_paths):
+            with wave.open(str(path), "rb") as segment:
+                if idx == 0:
+                    output.setparams(segment.getparams())
+                output.writeframes(segment.readframes(segment.getnframes()))
+
+
 def encode_mp3(
     audio: np.ndarray,
     sample_rate: int,
@@ -94,10 +348,19 @@ def encode_mp3(
     quality: int = 2,
     runner: Callable[..., object] = subprocess.run,
 ) -> None:
-    ffmpeg_executable = _resolve_ffmpeg_executable()
-    normalized_quality = min(9, max(0, int(quality)))
+    encode_mp3_outputs(audio, sample_rate, [(output_path, quality)], runner=runner)
+
+
+def encode_mp3_outputs(
+    audio: np.ndarray,
+    sample_rate: int,
+    outputs: Sequence[tuple[Path, int]],
+    *,
+    runner: Callable[..., object] = subprocess.run,
+) -> None:
+    """Encode one PCM buffer to several MP3 files with a single ffmpeg process."""
     command = [
-        ffmpeg_executable,
+        _resolve_ffmpeg_executable(),
         "-y",
         "-f",
         "f32le",
@@ -107,14 +370,51 @@ def encode_mp3(
         "1",
         "-i",
         "pipe:0",
-        "-vn",
-        "-q:a",
-        str(normalized_quality),
-        str(output_path),
     ]
+    for output_path, quality in outputs:
+        normalized_quality = min(9, max(0, int(quality)))
+        command.extend(["-vn", "-q:a", str(normalized_quality), str(output_path)])
 
     payload = np.asarray(audio, dtype=np.float32).reshape(-1).tobytes()
+    _run_ffmpeg(command, runner=runner, payload=payload, action="MP3 encoding")
+
+
+def encode_wav(audio: np.ndarray, sample_rate: int, output_path: Path) -> None:
+    with wave.open(str(output_path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm16_bytes(audio))
+
+
+def pcm16_bytes(audio: np.ndarray) -> bytes:
+    payload = np.asarray(audio, dtype=np.float32).reshape(-1)
+    clipped = np.clip(payload, -1.0, 1.0)
+    return (clipped * 32767.0).astype("<i2").tobytes()
 
+
+def wav_stream_header(sample_rate: int) -> bytes:
+    """Mono 16-bit WAV header for a stream whose length is not known up front."""
+    unknown = 0xFFFFFFFF
+    return b"".join(
+        (
+            b"RIFF",
+            struct.pack("<I", unknown),
+            b"WAVEfmt ",
+            struct.pack("<IHHIIHH", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16),
+            b"data",
+            struct.pack("<I", unknown),
+        )
+    )
+
+
+def _run_ffmpeg(
+    command: list[str],
+    *,
+    runner: Callable[..., object],
+    action: str,
+    payload: bytes | None = None,
+) -> None:
     try:
         result = runner(
             command,
@@ -145,28 +445,80 @@ def encode_mp3(
         raise KookieError(
             code=ErrorCode.BACKEND_FAILURE,
             category=ErrorCategory.BACKEND,
-            message=f"MP3 encoding failed: {detail}",
+            message=f"{action} failed: {detail}",
             hint="Retry the export. If it persists, check ffmpeg availability and permissions.",
             detail=detail,
         )
     raise KookieError(
         code=ErrorCode.BACKEND_FAILURE,
         category=ErrorCategory.BACKEND,
-        message="MP3 encoding failed",
+        message=f"{action} failed",
         hint="Retry the export. If it persists, check ffmpeg availability and permissions.",
     )
 
 
-def encode_wav(audio: np.ndarray, sample_rate: int, output_path: Path) -> None:
-    payload = np.asarray(audio, dtype=np.float32).reshape(-1)
-    clipped = np.clip(payload, -1.0, 1.0)
-    int16_data = (clipped * 32767.0).astype(np.int16)
+def _resolve_sentences(
+    text: str,
+    sentences: Sequence[str] | None,
+    *,
+    normalizer: Callable[[str], str],
+    chunker: Callable[[str], list[str]],
+) -> Sequence[str]:
+    if sentences is None:
+        normalized = normalizer(text)
+        if not normalized:
+            raise ValueError("No text to synthesize")
+        sentences = chunker(normalized)
+    if not sentences:
+        raise ValueError("No text to synthesize")
+    return sentences
 
-    with wave.open(str(output_path), "wb") as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(int16_data.tobytes())
+
+def _synthesize_pcm(
+    backend,
+    sentences: Sequence[str],
+    voice: str,
+    *,
+    progress_callback: ProgressCallback | None = None,
+    cancel_event: threading.Event | None = None,
+) -> np.ndarray:
+    if cancel_event is not None and cancel_event.is_set():
+        raise ExportCancelledError("Export cancelled")
+
+    chunks: list[np.ndarray] = []
+    synthesized = 0
+    with span("export_synthesize", "export", sentences=len(sentences)):
+        for chunk in backend.synthesize_sentences(sentences, voice):
+            if cancel_event is not None and cancel_event.is_set():
+                raise ExportCancelledError("Export cancelled")
+            data = np.asarray(chunk, dtype=np.float32).reshape(-1)
+            if data.size > 0:
+                chunks.append(data)
+                synthesized += int(data.size)
+                if progress_callback is not None:
+                    progress_callback("synthesized", synthesized)
+
+    if not chunks:
+        raise ValueError("No synthesized audio to save")
+    return np.concatenate(chunks).astype(np.float32, copy=False)
+
+
+def _select_encoder(
+    format: str,
+    *,
+    encoder: Callable[[np.ndarray, int, Path], None] | None,
+    quality: int,
+) -> Callable[[np.ndarray, int, Path], None]:
+    selected_format = format.strip().lower()
+    if selected_format == "mp3":
+        return encoder or (lambda audio, sr, path: encode_mp3(audio, sr, path, quality=quality))
+    if selected_format == "wav":
+        return encoder or encode_wav
+    raise ValueError(f"Unsupported export format: {format}")
+
+
+def _concat_list_escape(path: Path) -> str:
+    return str(path.resolve()).replace("'", "'\\''")
 
 
 def _resolve_ffmpeg_executable(
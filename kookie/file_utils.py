@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def apply_default_permissions(path: Path) -> None:
+    """Give a ``mkstemp`` file (always ``0600``) the mode a plain ``open`` would have, before it is moved into place."""
+    try:
+        os.chmod(path, 0o666 & ~_process_umask())
+    except OSError:
+        return
+
+
+def _process_umask() -> int:
+    mask = _proc_umask()
+    return _IMPORT_UMASK if mask is None else mask
+
+
+def _proc_umask() -> int | None:
+    """Umask as reported by ``/proc/self/status`` (Linux 4.7+), read without changing it."""
+    try:
+        with open("/proc/self/status", encoding="ascii", errors="replace") as fh:
+            for line in fh:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        return None
+    return None
+
+
+def _swap_umask() -> int:
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+# Elsewhere the umask can only be read by setting it, so that happens once, at import, before worker threads
+# exist to create files under the temporary mask.
+_IMPORT_UMASK = 0o022 if _proc_umask() is not None else _swap_umask()
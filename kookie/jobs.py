@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import itertools
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from enum import Enum
+from pathlib import Path
+
+from .export import ExportCancelledError
+
+# Finished jobs kept for ``jobs()``/``get()``; older ones are forgotten.
+DEFAULT_JOB_HISTORY = 32
+
+
+class ExportJobState(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+@dataclass(slots=True)
+class ExportJob:
+    job_id: str
+    output_path: Path
+    state: ExportJobState = ExportJobState.QUEUED
+    synthesized_samples: int = 0
+    encoded_samples: int = 0
+    result_path: Path | None = None
+    error: Exception | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.state in {ExportJobState.COMPLETED, ExportJobState.FAILED, ExportJobState.CANCELLED}
+
+
+@dataclass(slots=True)
+class ExportJobContext:
+    """Handed to job work functions for progress reporting and cancellation."""
+
+    job_id: str
+    cancel_event: threading.Event
+    _report: Callable[[str, int], None] = field(repr=False)
+
+    def report_progress(self, stage: str, samples: int) -> None:
+        self._report(stage, samples)
+
+
+ExportWork = Callable[[ExportJobContext], Path]
+
+
+class ExportJobQueue:
+    """FIFO export scheduler that runs at most ``max_concurrency`` jobs at once.
+
+    Only the newest ``max_history`` finished jobs are remembered.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 1,
+        on_change: Callable[[ExportJob], None] | None = None,
+        max_history: int = DEFAULT_JOB_HISTORY,
+    ):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.max_history = max(0, int(max_history))
+        self._on_change = on_change
+        self._lock = threading.Lock()
+        self._jobs: dict[str, ExportJob] = {}
+        self._cancel_events: dict[str, threading.Event] = {}
+        self._futures: dict[str, Future[None]] = {}
+        self._finished: deque[str] = deque()
+        self._ids = itertools.count(1)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="kookie-export-job")
+
+    def submit(self, work: ExportWork, *, output_path: Path) -> str:
+        with self._lock:
+            job_id = f"export-{next(self._ids)}"
+            job = ExportJob(job_id=job_id, output_path=output_path)
+            self._jobs[job_id] = job
+            self._cancel_events[job_id] = threading.Event()
+            self._futures[job_id] = self._executor.submit(self._run, job_id, work)
+            snapshot = replace(job)
+        self._notify(snapshot)
+        return job_id
+
+    def cancel(self, job_id: str) -> bool:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.done:
+                return False
+            self._cancel_events[job_id].set()
+            if job.state is not ExportJobState.QUEUED:
+                # Running jobs observe the event between synthesized chunks.
+                return True
+            job.state = ExportJobState.CANCELLED
+            self._retire_locked(job_id)
+            snapshot = replace(job)
+        self._notify(snapshot)
+        return True
+
+    def get(self, job_id: str) -> ExportJob | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return replace(job) if job is not None else None
+
+    def jobs(self) -> list[ExportJob]:
+        with self._lock:
+            return [replace(job) for job in self._jobs.values()]
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if not job.done)
+
+    @property
+    def waiting_count(self) -> int:
+        """Unfinished jobs that have not started; at most ``max_concurrency`` jobs run at once."""
+        return max(0, self.pending_count - self.max_concurrency)
+
+    def wait(self, job_id: str, timeout: float | None = None) -> ExportJob | None:
+        with self._lock:
+            future = self._futures.get(job_id)
+        if future is not None:
+            try:
+                future.result(timeout=timeout)
+            except Exception:
+                pass
+        return self.get(job_id)
+
+    def shutdown(self, *, cancel_pending: bool = True) -> None:
+        if cancel_pending:
+            for job in self.jobs():
+                self.cancel(job.job_id)
+        self._executor.shutdown(wait=False, cancel_futures=cancel_pending)
+
+    def _run(self, job_id: str, work: ExportWork) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.state is ExportJobState.CANCELLED:
+                return
+            cancel_event = self._cancel_events[job_id]
+            job.state = ExportJobState.RUNNING
+            snapshot = replace(job)
+        self._notify(snapshot)
+
+        context = ExportJobContext(
+            job_id=job_id,
+            cancel_event=cancel_event,
+            _report=lambda stage, samples: self._record_progress(job_id, stage, samples),
+        )
+        try:
+            result_path = work(context)
+        except ExportCancelledError:
+            self._finish(job_id, state=ExportJobState.CANCELLED)
+        except Exception as exc:
+            self._finish(job_id, state=ExportJobState.FAILED, error=exc)
+        else:
+            self._finish(job_id, state=ExportJobState.COMPLETED, result_path=result_path)
+
+    def _record_progress(self, job_id: str, stage: str, samples: int) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            if stage == "synthesized":
+                job.synthesized_samples = int(samples)
+            elif stage == "encoded":
+                job.encoded_samples = int(samples)
+            snapshot = replace(job)
+        self._notify(snapshot)
+
+    def _finish(
+        self,
+        job_id: str,
+        *,
+        state: ExportJobState,
+        result_path: Path | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            job.state = state
+            job.result_path = result_path
+            job.error = error
+            self._retire_locked(job_id)
+            snapshot = replace(job)
+        self._notify(snapshot)
+
+    def _retire_locked(self, job_id: str) -> None:
+        self._cancel_events.pop(job_id, None)
+        self._futures.pop(job_id, None)
+        self._finished.append(job_id)
+        while len(self._finished) > self.max_history:
+            self._jobs.pop(self._finished.popleft(), None)
+
+    def _notify(self, job: ExportJob) -> None:
+        if self._on_change is None:
+            return
+        try:
+            self._on_change(job)
+        except Exception:
+            pass
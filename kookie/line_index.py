@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+
+
+class LineIndex:
+    """Start offsets of the display lines of a document.
+
+    Lines break at ``\\n`` and, when ``wrap_width`` is set, at the last space that fits in ``wrap_width``
+    characters (or hard at the width when a word is longer). Offsets are kept in a flat ``array`` so an index
+    over a multi-megabyte book stays compact, and offset lookups are a binary search.
+    """
+
+    __slots__ = ("text", "wrap_width", "_starts")
+
+    def __init__(self, text: str, *, wrap_width: int = 0):
+        self.text = text
+        self.wrap_width = max(0, int(wrap_width))
+        self._starts = _line_starts(text, self.wrap_width)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def append(self, suffix: str) -> None:
+        """Extend the text, re-scanning only its last line, so streaming pages in costs O(new text)."""
+        if not suffix:
+            return
+        self.text += suffix
+        last_start = self._starts.pop()
+        self._starts.extend(_line_starts(self.text, self.wrap_width, last_start))
+
+    def rewrap(self, wrap_width: int) -> LineIndex:
+        if max(0, int(wrap_width)) == self.wrap_width:
+            return self
+        return LineIndex(self.text, wrap_width=wrap_width)
+
+    def line_start(self, line: int) -> int:
+        return self._starts[self._clamp_line(line)]
+
+    def line_end(self, line: int) -> int:
+        """Offset just past the last character shown on ``line``, excluding its newline."""
+        line = self._clamp_line(line)
+        end = self._starts[line + 1] if line + 1 < len(self._starts) else len(self.text)
+        if end > self._starts[line] and self.text[end - 1] == "\n":
+            end -= 1
+        return end
+
+    def line_text(self, line: int) -> str:
+        return self.text[self.line_start(line) : self.line_end(line)]
+
+    def lines(self, start: int, stop: int) -> list[str]:
+        start = max(0, start)
+        stop = min(len(self._starts), stop)
+        return [self.line_text(line) for line in range(start, stop)]
+
+    def line_for_offset(self, offset: int) -> int:
+        offset = min(max(0, int(offset)), len(self.text))
+        return max(0, bisect_right(self._starts, offset) - 1)
+
+    def offset_to_position(self, offset: int) -> tuple[int, int]:
+        line = self.line_for_offset(offset)
+        column = min(max(0, int(offset)), len(self.text)) - self._starts[line]
+        return line, column
+
+    def position_to_offset(self, line: int, column: int) -> int:
+        line = self._clamp_line(line)
+        return min(self.line_start(line) + max(0, int(column)), self.line_end(line))
+
+    def visible_lines(
+        self,
+        scroll_top: float,
+        viewport_height: float,
+        line_height: float,
+        *,
+        overscan: int = 0,
+    ) -> range:
+        """Lines intersecting a viewport ``scroll_top`` pixels from the top of the document."""
+        if line_height <= 0 or viewport_height <= 0:
+            return range(0)
+        first = int(max(0.0, scroll_top) // line_height)
+        last = int((max(0.0, scroll_top) + viewport_height) // line_height) + 1
+        return range(max(0, first - overscan), min(len(self._starts), last + overscan))
+
+    def scroll_top_for_offset(self, offset: int, line_height: float) -> float:
+        return self.line_for_offset(offset) * max(0.0, line_height)
+
+    def content_height(self, line_height: float) -> float:
+        return len(self._starts) * max(0.0, line_height)
+
+    def _clamp_line(self, line: int) -> int:
+        return min(max(0, int(line)), len(self._starts) - 1)
+
+
+def _line_starts(text: str, wrap_width: int, start: int = 0) -> array:
+    """Starts of the lines from ``start`` (itself a line start) to the end of ``text``."""
+    starts = array("q", [start])
+    length = len(text)
+    while start < length:
+        newline = text.find("\n", start)
+        end = length if newline == -1 else newline
+        if wrap_width:
+            while end - start > wrap_width:
+                limit = start + wrap_width
+                space = text.rfind(" ", start + 1, limit + 1)
+                start = space + 1 if space != -1 else limit
+                starts.append(start)
+        if newline == -1:
+            break
+        start = newline + 1
+        starts.append(start)
+    return starts
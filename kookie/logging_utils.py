@@ -1,30 +1,93 @@
 from __future__ import annotations
 
+import atexit
+import gzip
 import logging
+import os
+import queue
+import shutil
+import threading
 import traceback
 from collections.abc import Callable
 from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from types import TracebackType
 
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+DEFAULT_LOG_MAX_BYTES = 5_000_000
+DEFAULT_LOG_BACKUP_COUNT = 5
 
-def configure_logging(*, log_path: Path, name: str = "kookie") -> logging.Logger:
+_listeners: dict[tuple[str, str], tuple[QueueHandler, QueueListener]] = {}
+_listeners_lock = threading.Lock()
+
+
+def configure_logging(
+    *,
+    log_path: Path,
+    name: str = "kookie",
+    max_bytes: int = DEFAULT_LOG_MAX_BYTES,
+    backup_count: int = DEFAULT_LOG_BACKUP_COUNT,
+    compress: bool = True,
+) -> logging.Logger:
+    """Log ``name`` to ``log_path`` without doing file I/O on the calling thread.
+
+    Records go through a ``QueueHandler`` to a listener thread that owns a size-rotated file handler, so a
+    log call from the audio or synthesis threads only enqueues. Rotated files are gzipped when ``compress``
+    is set. Call ``shutdown_logging`` (also run at exit) to drain the queue.
+    """
     log_path.parent.mkdir(parents=True, exist_ok=True)
     logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)
 
-    existing_file_handler = any(
-        isinstance(handler, logging.FileHandler) and getattr(handler, "baseFilename", "") == str(log_path)
-        for handler in logger.handlers
-    )
-    if not existing_file_handler:
-        handler = logging.FileHandler(log_path, encoding="utf-8")
-        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
-        logger.addHandler(handler)
-
+    key = (name, str(log_path))
+    with _listeners_lock:
+        if key in _listeners:
+            return logger
+        file_handler = RotatingFileHandler(
+            log_path,
+            maxBytes=max(0, max_bytes),
+            backupCount=max(0, backup_count),
+            encoding="utf-8",
+            delay=True,
+        )
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        if compress:
+            file_handler.namer = _gzip_name
+            file_handler.rotator = _gzip_rotate
+        queue_handler = QueueHandler(queue.SimpleQueue())
+        listener = QueueListener(queue_handler.queue, file_handler, respect_handler_level=True)
+        listener.start()
+        logger.addHandler(queue_handler)
+        _listeners[key] = (queue_handler, listener)
     return logger
 
 
+def shutdown_logging(name: str | None = None) -> None:
+    """Flush and stop the listeners of ``name`` (every configured logger when None)."""
+    with _listeners_lock:
+        keys = [key for key in _listeners if name is None or key[0] == name]
+        stopped = [(key[0], *_listeners.pop(key)) for key in keys]
+    for logger_name, queue_handler, listener in stopped:
+        logging.getLogger(logger_name).removeHandler(queue_handler)
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+def _gzip_name(default_name: str) -> str:
+    return f"{default_name}.gz"
+
+
+def _gzip_rotate(source: str, dest: str) -> None:
+    with open(source, "rb") as raw, gzip.open(dest, "wb") as packed:
+        shutil.copyfileobj(raw, packed)
+    os.remove(source)
+
+
+atexit.register(shutdown_logging)
+
+
 def make_crash_hook(*, crash_dir: Path) -> Callable[[type[BaseException], BaseException, TracebackType | None], None]:
     crash_dir.mkdir(parents=True, exist_ok=True)
 
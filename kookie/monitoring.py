@@ -1,10 +1,26 @@
 from __future__ import annotations
 
+import itertools
 import json
+import math
+import re
 import threading
-from collections.abc import Callable
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from .export import pcm16_bytes, wav_stream_header
+from .text_processing import normalize_text, split_sentences
+from .tracing import tracer
+
+SYNTHESIS_FORMATS = ("wav", "pcm")
+KEEPALIVE_TIMEOUT_SECONDS = 15.0
+MAX_SYNTHESIS_REQUEST_BYTES = 1024 * 1024
 
 
 @dataclass(slots=True)
@@ -23,19 +39,220 @@ class HealthStatus:
         }
 
 
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+HISTOGRAM_BUCKETS: dict[str, tuple[float, ...]] = {
+    "synthesis_realtime_factor": (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0),
+    "export_duration_seconds": (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0),
+    "pdf_pages_per_second": (1.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0),
+}
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_METRIC_NAME_RE = re.compile(r"[^a-zA-Z0-9_:]")
+
+
+@dataclass(slots=True)
+class HistogramSnapshot:
+    buckets: tuple[float, ...]
+    counts: tuple[int, ...]
+    total: float
+    count: int
+
+
+@dataclass(slots=True)
+class _Histogram:
+    buckets: tuple[float, ...]
+    counts: list[int]
+    total: float = 0.0
+    count: int = 0
+
+    def observe(self, value: float) -> None:
+        # counts[i] holds observations <= buckets[i] only; cumulative counts are built on export.
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(buckets=self.buckets, counts=tuple(self.counts), total=self.total, count=self.count)
+
+
 @dataclass(slots=True)
 class MetricsStore:
     _values: dict[str, int] = field(default_factory=dict)
+    _gauges: dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    _histograms: dict[str, _Histogram] = field(default_factory=dict, init=False, repr=False)
     _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
 
     def increment(self, key: str, amount: int = 1) -> None:
         with self._lock:
             self._values[key] = self._values.get(key, 0) + amount
 
+    def set_gauge(self, key: str, value: float) -> None:
+        with self._lock:
+            self._gauges[key] = float(value)
+
+    def observe(self, key: str, value: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                buckets = HISTOGRAM_BUCKETS.get(key, DEFAULT_LATENCY_BUCKETS)
+                histogram = _Histogram(buckets=buckets, counts=[0] * (len(buckets) + 1))
+                self._histograms[key] = histogram
+            histogram.observe(float(value))
+
     def snapshot(self) -> dict[str, int]:
         with self._lock:
             return dict(self._values)
 
+    def gauges(self) -> dict[str, float]:
+        with self._lock:
+            return dict(self._gauges)
+
+    def histograms(self) -> dict[str, HistogramSnapshot]:
+        with self._lock:
+            return {key: histogram.snapshot() for key, histogram in self._histograms.items()}
+
+    def to_prometheus(self, *, prefix: str = "kookie_") -> str:
+        lines: list[str] = []
+        for key, value in sorted(self.snapshot().items()):
+            name = _metric_name(prefix, key) + "_total"
+            lines.extend((f"# TYPE {name} counter", f"{name} {value}"))
+        for key, value in sorted(self.gauges().items()):
+            name = _metric_name(prefix, key)
+            lines.extend((f"# TYPE {name} gauge", f"{name} {_format_float(value)}"))
+        for key, histogram in sorted(self.histograms().items()):
+            name = _metric_name(prefix, key)
+            lines.append(f"# TYPE {name} histogram")
+            cumulative = 0
+            for bound, count in zip((*histogram.buckets, math.inf), histogram.counts, strict=True):
+                cumulative += count
+                lines.append(f'{name}_bucket{{le="{_format_float(bound)}"}} {cumulative}')
+            lines.append(f"{name}_sum {_format_float(histogram.total)}")
+            lines.append(f"{name}_count {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def wants_prometheus(path: str, accept: str | None) -> bool:
+    query = parse_qs(urlsplit(path).query)
+    if "format" in query:
+        return query["format"][-1].lower() in {"prometheus", "text"}
+    accepted = (accept or "").lower()
+    return "text/plain" in accepted or "application/openmetrics-text" in accepted
+
+
+def _metric_name(prefix: str, key: str) -> str:
+    return _METRIC_NAME_RE.sub("_", f"{prefix}{key}")
+
+
+def _format_float(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class SynthesisBusyError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class SynthesisRequest:
+    sentences: list[str]
+    voice: str
+    speed: float
+    format: str
+
+
+class SynthesisService:
+    """Shares one loaded backend between local HTTP clients.
+
+    At most ``max_concurrent`` requests synthesize at once; up to ``max_queued`` more wait for a slot
+    (for ``queue_timeout`` seconds) and anything beyond that is rejected immediately.
+    """
+
+    def __init__(
+        self,
+        backend,
+        *,
+        sample_rate: int,
+        default_voice: str = "af_sarah",
+        max_concurrent: int = 1,
+        max_queued: int = 8,
+        queue_timeout: float = 30.0,
+        normalizer: Callable[[str], str] = normalize_text,
+        chunker: Callable[[str], list[str]] = split_sentences,
+    ):
+        self.backend = backend
+        self.sample_rate = int(sample_rate)
+        self.default_voice = default_voice
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.max_queued = max(0, int(max_queued))
+        self.queue_timeout = max(0.0, float(queue_timeout))
+        self._normalizer = normalizer
+        self._chunker = chunker
+        self._admission = threading.BoundedSemaphore(self.max_concurrent + self.max_queued)
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+
+    def sentences_for(self, text: str) -> list[str]:
+        normalized = self._normalizer(text)
+        sentences = self._chunker(normalized) if normalized else []
+        if not sentences:
+            raise ValueError("No text to synthesize")
+        return sentences
+
+    @contextmanager
+    def reserve(self) -> Iterator[None]:
+        if not self._admission.acquire(blocking=False):
+            raise SynthesisBusyError("Synthesis queue is full")
+        try:
+            if not self._slots.acquire(timeout=self.queue_timeout):
+                raise SynthesisBusyError("Timed out waiting for a synthesis slot")
+            try:
+                yield
+            finally:
+                self._slots.release()
+        finally:
+            self._admission.release()
+
+    def parse_request(self, body: bytes) -> SynthesisRequest:
+        """Validated ``POST /synthesize`` JSON body; any invalid field raises ``ValueError``."""
+        try:
+            request = json.loads(body or b"{}")
+        except json.JSONDecodeError as exc:
+            raise ValueError("Request body must be valid JSON") from exc
+        if not isinstance(request, dict):
+            raise ValueError("Request body must be a JSON object")
+        audio_format = str(request.get("format", "wav")).lower()
+        if audio_format not in SYNTHESIS_FORMATS:
+            raise ValueError(f"Unsupported format: {audio_format}")
+        raw_speed = request.get("speed", 1.0)
+        if isinstance(raw_speed, bool) or not isinstance(raw_speed, (int, float)):
+            raise ValueError("speed must be a number")
+        return SynthesisRequest(
+            voice=self.voice_for(request.get("voice")),
+            sentences=self.sentences_for(str(request.get("text", ""))),
+            speed=min(2.0, max(0.5, float(raw_speed))),
+            format=audio_format,
+        )
+
+    def voice_for(self, voice: object) -> str:
+        """Requested voice (or the default), rejected with ``ValueError`` when the backend does not know it."""
+        if voice is not None and not isinstance(voice, str):
+            raise ValueError("voice must be a string")
+        selected = (voice or "").strip() or self.default_voice
+        validate = getattr(self.backend, "validate_voice", None)
+        if callable(validate):
+            validate(selected)
+        return selected
+
+    def synthesize(self, sentences: Sequence[str], *, voice: str | None = None, speed: float = 1.0) -> Iterator[bytes]:
+        selected_voice = voice or self.default_voice
+        try:
+            chunks = self.backend.synthesize_sentences(sentences, selected_voice, speed=speed)
+        except TypeError:
+            chunks = self.backend.synthesize_sentences(sentences, selected_voice)
+        for chunk in chunks:
+            data = np.asarray(chunk, dtype=np.float32).reshape(-1)
+            if data.size:
+                yield pcm16_bytes(data)
+
 
 def start_health_server(
     *,
@@ -43,27 +260,144 @@ def start_health_server(
     port: int,
     health_provider: Callable[[], HealthStatus],
     metrics_store: MetricsStore,
+    synthesis_service: SynthesisService | None = None,
 ) -> ThreadingHTTPServer:
     class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        timeout = KEEPALIVE_TIMEOUT_SECONDS
+
         def do_GET(self) -> None:  # noqa: N802
-            if self.path == "/health":
+            path = urlsplit(self.path).path
+            if path == "/health":
                 payload = health_provider().as_dict()
                 self._write_json(payload)
                 return
-            if self.path == "/metrics":
-                self._write_json(metrics_store.snapshot())
+            if path == "/metrics":
+                if wants_prometheus(self.path, self.headers.get("Accept")):
+                    self._write_text(metrics_store.to_prometheus(), content_type=PROMETHEUS_CONTENT_TYPE)
+                else:
+                    self._write_json(metrics_store.snapshot())
                 return
-            self.send_response(404)
-            self.end_headers()
+            if path == "/trace":
+                self._write_json(tracer.to_chrome_trace())
+                return
+            self._write_json({"error": "not found"}, status=404)
+
+        def do_POST(self) -> None:  # noqa: N802
+            length = self._content_length()
+            if length is None:
+                return
+            body = self.rfile.read(length)
+            if urlsplit(self.path).path != "/synthesize" or synthesis_service is None:
+                self._write_json({"error": "not found"}, status=404)
+                return
+
+            try:
+                request = synthesis_service.parse_request(body)
+            except ValueError as exc:
+                self._write_json({"error": str(exc)}, status=400)
+                return
+
+            metrics_store.increment("synthesis_requests")
+            try:
+                with synthesis_service.reserve():
+                    chunks = synthesis_service.synthesize(request.sentences, voice=request.voice, speed=request.speed)
+                    # Pull the first chunk before any headers go out, so backend errors still get a status code.
+                    try:
+                        first = next(chunks, None)
+                    except ValueError as exc:
+                        self._write_json({"error": str(exc)}, status=400)
+                        return
+                    except Exception as exc:
+                        metrics_store.increment("synthesis_failed")
+                        self._write_json({"error": str(exc) or type(exc).__name__}, status=500)
+                        return
+                    self._stream_audio(
+                        itertools.chain(() if first is None else (first,), chunks),
+                        audio_format=request.format,
+                    )
+            except SynthesisBusyError as exc:
+                metrics_store.increment("synthesis_rejected")
+                self._write_json({"error": str(exc)}, status=503, headers={"Retry-After": "1"})
 
         def log_message(self, _format: str, *_args) -> None:
             return
 
-        def _write_json(self, payload: dict[str, object]) -> None:
-            body = json.dumps(payload, sort_keys=True).encode("utf-8")
+        def _content_length(self) -> int | None:
+            """Validated request body size; on a missing, malformed or oversized value the error is sent."""
+            raw = self.headers.get("Content-Length")
+            if raw is None:
+                self.close_connection = True
+                self._write_json({"error": "Content-Length required"}, status=411)
+                return None
+            try:
+                length = int(raw)
+            except ValueError:
+                length = -1
+            if length < 0:
+                self.close_connection = True
+                self._write_json({"error": "Invalid Content-Length"}, status=400)
+                return None
+            if length > MAX_SYNTHESIS_REQUEST_BYTES:
+                self.close_connection = True
+                self._write_json({"error": "Request body too large"}, status=413)
+                return None
+            return length
+
+        def _stream_audio(self, chunks: Iterator[bytes], *, audio_format: str) -> None:
+            assert synthesis_service is not None
+            sample_rate = synthesis_service.sample_rate
+            self.send_response(200)
+            if audio_format == "wav":
+                self.send_header("Content-Type", "audio/wav")
+            else:
+                self.send_header("Content-Type", "application/octet-stream")
+                self.send_header("X-Kookie-Sample-Format", "s16le")
+            self.send_header("X-Kookie-Sample-Rate", str(sample_rate))
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+
+            try:
+                if audio_format == "wav":
+                    self._write_chunk(wav_stream_header(sample_rate))
+                for chunk in chunks:
+                    self._write_chunk(chunk)
+            except OSError:
+                # Client went away mid-stream.
+                self.close_connection = True
+                return
+            except Exception:
+                # Headers are already sent; dropping the connection without the final chunk signals the failure.
+                metrics_store.increment("synthesis_failed")
+                self.close_connection = True
+                return
+            self.wfile.write(b"0\r\n\r\n")
+            metrics_store.increment("synthesis_completed")
+
+        def _write_chunk(self, data: bytes) -> None:
+            self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+
+        def _write_text(self, text: str, *, content_type: str) -> None:
+            body = text.encode("utf-8")
             self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _write_json(
+            self,
+            payload: dict[str, object],
+            *,
+            status: int = 200,
+            headers: dict[str, str] | None = None,
+        ) -> None:
+            body = json.dumps(payload, sort_keys=True).encode("utf-8")
+            self.send_response(status)
             self.send_header("Content-Type", "application/json")
             self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
             self.end_headers()
             self.wfile.write(body)
 
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from urllib.parse import urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+from .config import AppConfig
+
+# No fixed endpoints: each check probes the hosts it is about to contact (or their proxy).
+DEFAULT_PROBE_ENDPOINTS: tuple[str, ...] = ()
+DEFAULT_PROBE_TIMEOUT_SECONDS = 1.5
+DEFAULT_PROBE_TTL_SECONDS = 30.0
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class NetworkProbe:
+    """Cached answer to "can we reach the network?".
+
+    A probe opens TCP connections to every endpoint concurrently and reports online as soon as one succeeds.
+    Configured ``endpoints`` are always used; without them, ``is_online(urls)`` probes the hosts of ``urls``,
+    or the proxy each one would go through. Answers are reused for ``ttl_seconds`` per endpoint set, so the
+    asset downloads and the update check of one startup share their probes, and an offline machine skips
+    them at once instead of waiting out timeouts and backoff.
+    """
+
+    def __init__(
+        self,
+        endpoints: Iterable[str] = DEFAULT_PROBE_ENDPOINTS,
+        *,
+        timeout: float = DEFAULT_PROBE_TIMEOUT_SECONDS,
+        ttl_seconds: float = DEFAULT_PROBE_TTL_SECONDS,
+        connect: Callable[..., object] = socket.create_connection,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.endpoints = tuple(_parse_endpoint(item) for item in endpoints if str(item).strip())
+        self.timeout = max(0.0, float(timeout))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self._connect = connect
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._answers: dict[tuple[tuple[str, int], ...], tuple[bool, float]] = {}
+
+    def is_online(self, urls: Iterable[str] = ()) -> bool:
+        endpoints = self.endpoints or _url_endpoints(urls)
+        if not endpoints:
+            return True
+        with self._lock:
+            cached = self._answers.get(endpoints)
+            if cached is None or self._clock() - cached[1] >= self.ttl_seconds:
+                cached = (self._probe(endpoints), self._clock())
+                self._answers[endpoints] = cached
+            return cached[0]
+
+    def invalidate(self) -> None:
+        """Forget the cached answers, e.g. after a request failed, so the next check probes again."""
+        with self._lock:
+            self._answers.clear()
+
+    def _probe(self, endpoints: tuple[tuple[str, int], ...]) -> bool:
+        executor = ThreadPoolExecutor(max_workers=len(endpoints), thread_name_prefix="kookie-probe")
+        try:
+            futures = [executor.submit(self._reachable, endpoint) for endpoint in endpoints]
+            return any(future.result() for future in as_completed(futures))
+        finally:
+            # The first success answers; connects still in flight finish on their own, outside the probe lock.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _reachable(self, endpoint: tuple[str, int]) -> bool:
+        try:
+            connection = self._connect(endpoint, timeout=self.timeout)
+        except OSError:
+            return False
+        close = getattr(connection, "close", None)
+        if callable(close):
+            close()
+        return True
+
+
+def network_probe_for(config: AppConfig) -> NetworkProbe | None:
+    """Probe shared by every caller with the same probe settings, or None when probing is disabled."""
+    if not getattr(config, "network_probe_enabled", True):
+        return None
+    return _shared_probe(
+        tuple(getattr(config, "network_probe_endpoints", DEFAULT_PROBE_ENDPOINTS)),
+        float(getattr(config, "network_probe_timeout", DEFAULT_PROBE_TIMEOUT_SECONDS)),
+        float(getattr(config, "network_probe_ttl_seconds", DEFAULT_PROBE_TTL_SECONDS)),
+    )
+
+
+def _url_endpoint(url: str) -> tuple[str, int] | None:
+    """``(host, port)`` a request for an ``http``/``https`` ``url`` connects to first: its proxy, if one applies."""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS or not parts.hostname:
+        return None
+    proxy = getproxies().get(scheme)
+    if proxy and not proxy_bypass(parts.hostname):
+        proxy_parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+        if proxy_parts.hostname:
+            return proxy_parts.hostname, proxy_parts.port or _DEFAULT_PORTS.get(proxy_parts.scheme.lower(), 80)
+    try:
+        port = parts.port
+    except ValueError:
+        return None
+    return parts.hostname, port or _DEFAULT_PORTS[scheme]
+
+
+@lru_cache(maxsize=8)
+def _shared_probe(endpoints: tuple[str, ...], timeout: float, ttl_seconds: float) -> NetworkProbe:
+    return NetworkProbe(endpoints, timeout=timeout, ttl_seconds=ttl_seconds)
+
+
+def _url_endpoints(urls: Iterable[str]) -> tuple[tuple[str, int], ...]:
+    endpoints = (_url_endpoint(url) for url in urls)
+    return tuple(sorted({endpoint for endpoint in endpoints if endpoint is not None}))
+
+
+def _parse_endpoint(value: str) -> tuple[str, int]:
+    text = str(value).strip()
+    host, separator, port = text.rpartition(":")
+    if not separator or not port.isdigit() or (host.startswith("[") != host.endswith("]")):
+        return text.strip("[]"), 443
+    return host.strip("[]"), int(port)
@@ -6,6 +6,8 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from .document import DocumentModel
+
 
 class PdfImportError(RuntimeError):
     """Raised when PDF text extraction fails."""
@@ -17,6 +19,7 @@ class PdfImportResult:
     metadata: dict[str, str] = field(default_factory=dict)
     pages_loaded: list[int] = field(default_factory=list)
     used_ocr: bool = False
+    document: DocumentModel | None = None
 
 
 def extract_pdf_text(pdf_path: Path | str) -> str:
@@ -30,6 +33,7 @@ def extract_pdf_content(
     use_ocr_fallback: bool = False,
     ocr_loader: Callable[[Path], str] | None = None,
     progress_callback: Callable[[int, int], None] | None = None,
+    page_callback: Callable[[int, str], None] | None = None,
 ) -> PdfImportResult:
     path = Path(pdf_path).expanduser()
 
@@ -69,6 +73,8 @@ def extract_pdf_content(
                 if text:
                     pages.append(text)
                     loaded_page_numbers.append(page_idx + 1)
+                    if page_callback is not None:
+                        page_callback(page_idx + 1, text)
                 
                 if progress_callback is not None:
                     progress_callback(current_idx, total_pages)
@@ -89,11 +95,14 @@ def extract_pdf_content(
     if not pages:
         raise PdfImportError("No extractable text found in PDF.")
 
+    # Whole-document OCR output has no page numbers of its own; treat it as page 1.
+    document = DocumentModel.from_pages(zip(loaded_page_numbers or [1], pages, strict=True))
     return PdfImportResult(
-        text="\n\n".join(pages),
+        text=document.buffer,
         metadata=metadata,
         pages_loaded=loaded_page_numbers,
         used_ocr=used_ocr,
+        document=document,
     )
 
 
@@ -13,6 +13,8 @@ class RetryPolicy:
     factor: float = 2.0
     jitter: float = 0.2
     max_delay: float = 5.0
+    # Total time budget across all attempts and waits; no retry is scheduled that would end past it.
+    deadline_seconds: float | None = None
 
 
 def retry_call[T](
@@ -21,19 +23,51 @@ def retry_call[T](
     policy: RetryPolicy | None = None,
     sleeper: Callable[[float], None] = time.sleep,
     randomizer: Callable[[], float] = random.random,
+    should_retry: Callable[[Exception], bool] | None = None,
+    clock: Callable[[], float] = time.monotonic,
 ) -> T:
+    return retry_within_budget(
+        lambda _remaining: func(),
+        policy=policy,
+        sleeper=sleeper,
+        randomizer=randomizer,
+        should_retry=should_retry,
+        clock=clock,
+    )
+
+
+def retry_within_budget[T](
+    func: Callable[[float | None], T],
+    *,
+    policy: RetryPolicy | None = None,
+    sleeper: Callable[[float], None] = time.sleep,
+    randomizer: Callable[[], float] = random.random,
+    should_retry: Callable[[Exception], bool] | None = None,
+    clock: Callable[[], float] = time.monotonic,
+) -> T:
+    """Like ``retry_call``, but each attempt gets the seconds left of ``deadline_seconds`` (None without one).
+
+    Attempts use it to cap their own timeouts, so a single slow attempt cannot overrun the budget.
+    """
     selected_policy = policy or RetryPolicy()
+    deadline = selected_policy.deadline_seconds
+    started = clock() if deadline is not None else 0.0
     attempts = 0
     delay = selected_policy.base_delay
 
     while True:
         attempts += 1
+        remaining = None if deadline is None else max(0.0, deadline - (clock() - started))
         try:
-            return func()
-        except Exception:
+            return func(remaining)
+        except Exception as exc:
             if attempts >= selected_policy.max_attempts:
                 raise
+            if should_retry is not None and not should_retry(exc):
+                raise
             jitter_factor = (randomizer() * 2.0 - 1.0) * selected_policy.jitter
             bounded_delay = min(selected_policy.max_delay, max(0.0, delay * (1.0 + jitter_factor)))
+            if deadline is not None and clock() - started + bounded_delay >= deadline:
+                raise
             sleeper(bounded_delay)
             delay = min(selected_policy.max_delay, delay * selected_policy.factor)
@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from .app import create_app
+from .config import load_config
+from .export import pcm16_bytes, wav_stream_header
+from .monitoring import KEEPALIVE_TIMEOUT_SECONDS, MetricsStore, SynthesisService
+from .text_processing import normalize_text, split_sentences
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+# Sentences synthesized ahead of the one being written; a slow reader stalls production after this many.
+SYNTHESIS_LOOKAHEAD = 1
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large", 503: "Service Unavailable"}
+
+
+class _BadRequest(ValueError):
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+class AsyncSynthesisServer:
+    """Asyncio HTTP front end for ``synthesize_sentences``.
+
+    Inference runs on a bounded thread pool. Identical (voice, speed, sentence) requests in flight at the
+    same time share a single inference, and streamed responses wait on ``drain()`` so a slow client
+    pauses its producer instead of buffering audio in memory.
+    """
+
+    def __init__(
+        self,
+        backend,
+        *,
+        sample_rate: int,
+        default_voice: str = "af_sarah",
+        max_workers: int = 1,
+        max_pending: int = 64,
+        metrics: MetricsStore | None = None,
+        normalizer: Callable[[str], str] = normalize_text,
+        chunker: Callable[[str], list[str]] = split_sentences,
+    ):
+        self.backend = backend
+        self.sample_rate = int(sample_rate)
+        self.default_voice = default_voice
+        self.max_pending = max(1, int(max_pending))
+        self.metrics = metrics or MetricsStore()
+        # Request validation is shared with the threaded /synthesize endpoint.
+        self._requests = SynthesisService(
+            backend,
+            sample_rate=self.sample_rate,
+            default_voice=default_voice,
+            normalizer=normalizer,
+            chunker=chunker,
+        )
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix="kookie-infer")
+        self._inflight: dict[tuple[str, float, str], asyncio.Future[bytes]] = {}
+        self._pending = 0
+        self._server: asyncio.Server | None = None
+
+    async def start(self, host: str, port: int) -> asyncio.Server:
+        self._server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_HEADER_BYTES)
+        return self._server
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def synthesize_sentence(self, sentence: str, *, voice: str, speed: float = 1.0) -> bytes:
+        key = (voice, speed, sentence)
+        future = self._inflight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, self._infer, sentence, voice, speed)
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+            self.metrics.increment("synthesis_inferences")
+        else:
+            self.metrics.increment("synthesis_coalesced")
+        # Shield so one client disconnecting does not cancel audio other clients are waiting on.
+        return await asyncio.shield(future)
+
+    def _forget(self, key: tuple[str, float, str], future: asyncio.Future[bytes]) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(_read_request(reader), timeout=KEEPALIVE_TIMEOUT_SECONDS)
+                except (TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    return
+                except _BadRequest as exc:
+                    await _write_json(writer, {"error": str(exc)}, status=exc.status, close=True)
+                    return
+                if request is None:
+                    return
+                method, path, version, headers, body = request
+                keep_alive = _keep_alive(version, headers)
+                if not await self._dispatch(writer, method, path, body, keep_alive=keep_alive) or not keep_alive:
+                    return
+        except ConnectionError:
+            return
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _dispatch(
+        self,
+        writer: asyncio.StreamWriter,
+        method: str,
+        path: str,
+        body: bytes,
+        *,
+        keep_alive: bool = True,
+    ) -> bool:
+        close = not keep_alive
+        if method != "POST" or urlsplit(path).path != "/synthesize":
+            await _write_json(writer, {"error": "not found"}, status=404, close=close)
+            return True
+
+        try:
+            request = self._requests.parse_request(body)
+        except ValueError as exc:
+            await _write_json(writer, {"error": str(exc)}, status=400, close=close)
+            return True
+
+        if self._pending >= self.max_pending:
+            self.metrics.increment("synthesis_rejected")
+            await _write_json(
+                writer, {"error": "Synthesis queue is full"}, status=503, headers={"Retry-After": "1"}, close=close
+            )
+            return True
+
+        self._pending += 1
+        self.metrics.increment("synthesis_requests")
+        try:
+            return await self._stream(
+                writer,
+                request.sentences,
+                voice=request.voice,
+                speed=request.speed,
+                audio_format=request.format,
+                close=close,
+            )
+        finally:
+            self._pending -= 1
+
+    async def _stream(
+        self,
+        writer: asyncio.StreamWriter,
+        sentences: Sequence[str],
+        *,
+        voice: str,
+        speed: float,
+        audio_format: str,
+        close: bool = False,
+    ) -> bool:
+        headers = {"X-Kookie-Sample-Rate": str(self.sample_rate), "Transfer-Encoding": "chunked"}
+        if close:
+            headers["Connection"] = "close"
+        if audio_format == "wav":
+            headers["Content-Type"] = "audio/wav"
+        else:
+            headers["Content-Type"] = "application/octet-stream"
+            headers["X-Kookie-Sample-Format"] = "s16le"
+        _write_head(writer, 200, headers)
+        if audio_format == "wav":
+            _write_chunk(writer, wav_stream_header(self.sample_rate))
+
+        pending = [
+            asyncio.ensure_future(self.synthesize_sentence(sentence, voice=voice, speed=speed))
+            for sentence in sentences[: SYNTHESIS_LOOKAHEAD + 1]
+        ]
+        next_index = len(pending)
+        try:
+            while pending:
+                audio = await pending.pop(0)
+                if next_index < len(sentences):
+                    pending.append(
+                        asyncio.ensure_future(self.synthesize_sentence(sentences[next_index], voice=voice, speed=speed))
+                    )
+                    next_index += 1
+                if audio:
+                    _write_chunk(writer, audio)
+                    await writer.drain()
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+        except ConnectionError:
+            return False
+        except Exception:
+            # Headers are already sent; closing without the final chunk tells the client the stream failed.
+            self.metrics.increment("synthesis_failed")
+            return False
+        finally:
+            for task in pending:
+                task.cancel()
+        self.metrics.increment("synthesis_completed")
+        return True
+
+    def _infer(self, sentence: str, voice: str, speed: float) -> bytes:
+        started = time.perf_counter()
+        try:
+            chunks = self.backend.synthesize_sentences([sentence], voice, speed=speed)
+        except TypeError:
+            chunks = self.backend.synthesize_sentences([sentence], voice)
+        parts = [np.asarray(chunk, dtype=np.float32).reshape(-1) for chunk in chunks]
+        self.metrics.observe("sentence_inference_seconds", time.perf_counter() - started)
+        if not parts:
+            return b""
+        return pcm16_bytes(np.concatenate(parts))
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, str, dict[str, str], bytes] | None:
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as exc:
+        if not exc.partial:
+            return None
+        raise
+    except asyncio.LimitOverrunError as exc:
+        raise _BadRequest("Request headers too large") from exc
+
+    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, path, version = request_line.split(" ", 2)
+    except ValueError as exc:
+        raise _BadRequest("Malformed request line") from exc
+
+    headers: dict[str, str] = {}
+    for line in header_lines:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError as exc:
+        raise _BadRequest("Invalid Content-Length") from exc
+    if length > MAX_BODY_BYTES:
+        raise _BadRequest("Request body too large", status=413)
+    body = await reader.readexactly(length) if length > 0 else b""
+    return method.upper(), path, version.strip().upper(), headers, body
+
+
+def _keep_alive(version: str, headers: dict[str, str]) -> bool:
+    """HTTP/1.1 connections persist unless the client sends ``close``; HTTP/1.0 ones only on ``keep-alive``."""
+    tokens = {token.strip().lower() for token in headers.get("connection", "").split(",")}
+    if version == "HTTP/1.0":
+        return "keep-alive" in tokens
+    return "close" not in tokens
+
+
+def _write_head(writer: asyncio.StreamWriter, status: int, headers: dict[str, str]) -> None:
+    lines = [f"HTTP/1.1 {status} {_REASONS.get(status, 'OK')}"]
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+
+
+def _write_chunk(writer: asyncio.StreamWriter, data: bytes) -> None:
+    writer.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+
+
+async def _write_json(
+    writer: asyncio.StreamWriter,
+    payload: dict[str, object],
+    *,
+    status: int,
+    headers: dict[str, str] | None = None,
+    close: bool = False,
+) -> None:
+    body = json.dumps(payload, sort_keys=True).encode("utf-8")
+    selected = {"Content-Type": "application/json", "Content-Length": str(len(body)), **(headers or {})}
+    if close:
+        selected["Connection"] = "close"
+    _write_head(writer, status, selected)
+    writer.write(body)
+    await writer.drain()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    config = load_config()
+    parser = argparse.ArgumentParser(description="Serve POST /synthesize with an asyncio front end")
+    parser.add_argument("--host", default=config.health_check_host, help="Bind address.")
+    parser.add_argument("--port", type=int, default=config.health_check_port, help="Bind port.")
+    parser.add_argument("--workers", type=int, default=0, help="Inference threads (default: backend sessions).")
+    parser.add_argument("--max-pending", type=int, default=64, help="Concurrent requests before answering 503.")
+    args = parser.parse_args(argv)
+
+    runtime = create_app(config, headless=True, serve_http=False)
+    if runtime.backend_name == "mock" and config.backend_mode != "mock":
+        print(runtime.status_message, file=sys.stderr)
+        runtime.shutdown()
+        return 1
+
+    sessions = max(1, int(getattr(runtime.backend, "max_concurrent_sessions", 1)))
+    server = AsyncSynthesisServer(
+        runtime.backend,
+        sample_rate=config.sample_rate,
+        default_voice=runtime.selected_voice,
+        max_workers=min(args.workers, sessions) if args.workers > 0 else sessions,
+        max_pending=args.max_pending,
+        metrics=runtime.metrics,
+    )
+
+    async def _serve() -> None:
+        listener = await server.start(args.host, args.port)
+        try:
+            await listener.serve_forever()
+        finally:
+            await server.close()
+
+    print(f"Serving synthesis on http://{args.host}:{args.port}/synthesize")
+    try:
+        asyncio.run(_serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        runtime.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
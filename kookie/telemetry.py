@@ -1,30 +1,154 @@
 from __future__ import annotations
 
+import gzip
 import json
+import os
+import queue
+import shutil
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from threading import Lock
 from typing import Any
 
+# Events drained per file append; bigger batches amortize the open/close cost.
+TELEMETRY_BATCH_SIZE = 256
+
 
 @dataclass(slots=True)
 class LocalTelemetry:
+    """Opt-in JSONL event log.
+
+    ``record`` only enqueues; a background writer appends events in batches and rotates the file once it
+    exceeds ``max_bytes``, keeping ``backup_count`` older files (gzipped when ``compress_rotated`` is set).
+    Events are dropped, and counted in ``dropped``, when the queue is full.
+    """
+
     enabled: bool
     output_path: Path
-    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+    max_bytes: int = 5_000_000
+    backup_count: int = 3
+    compress_rotated: bool = False
+    queue_size: int = 10_000
+    flush_interval: float = 0.5
+    dropped: int = field(default=0, init=False)
+    _queue: queue.Queue[object] = field(init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _writer: threading.Thread | None = field(default=None, init=False, repr=False)
+    _closed: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._queue = queue.Queue(maxsize=max(1, self.queue_size))
 
     def record(self, event: str, data: dict[str, Any] | None = None) -> None:
-        if not self.enabled:
+        if not self.enabled or self._closed:
             return
+        if self._writer is None:
+            self._start_writer()
+        try:
+            self._queue.put_nowait((time.time(), event, data or {}))
+        except queue.Full:
+            self.dropped += 1
 
-        payload = {
-            "timestamp": datetime.now(UTC).isoformat(),
-            "event": event,
-            "data": data or {},
-        }
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Block until every event recorded so far is on disk."""
+        if self._writer is None or not self._writer.is_alive():
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
 
+    def close(self, timeout: float = 2.0) -> None:
+        if self._closed:
+            return
+        self.flush(timeout=timeout)
+        self._closed = True
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                return
+            writer.join(timeout=timeout)
+
+    def _start_writer(self) -> None:
         with self._lock:
-            self.output_path.parent.mkdir(parents=True, exist_ok=True)
-            with self.output_path.open("a", encoding="utf-8") as fh:
-                fh.write(json.dumps(payload, sort_keys=True) + "\n")
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(target=self._run_writer, daemon=True, name="kookie-telemetry")
+            self._writer.start()
+
+    def _run_writer(self) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = [first]
+            while len(batch) < TELEMETRY_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines: list[str] = []
+            waiters: list[threading.Event] = []
+            stopping = False
+            for item in batch:
+                if item is None:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    timestamp, event, data = item
+                    lines.append(_serialize(timestamp, event, data))
+
+            if lines:
+                try:
+                    self._write_lines(lines)
+                except OSError:
+                    self.dropped += len(lines)
+            for waiter in waiters:
+                waiter.set()
+            if stopping:
+                return
+
+    def _write_lines(self, lines: list[str]) -> None:
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.output_path.open("a", encoding="utf-8") as fh:
+            fh.write("".join(lines))
+            size = fh.tell()
+        if self.max_bytes > 0 and size >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        if self.backup_count <= 0:
+            self.output_path.unlink(missing_ok=True)
+            return
+        suffix = ".gz" if self.compress_rotated else ""
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self._backup_path(index, suffix)
+            if source.exists():
+                os.replace(source, self._backup_path(index + 1, suffix))
+        first = self._backup_path(1, "")
+        os.replace(self.output_path, first)
+        if self.compress_rotated:
+            with first.open("rb") as raw, gzip.open(self._backup_path(1, suffix), "wb") as packed:
+                shutil.copyfileobj(raw, packed)
+            first.unlink()
+
+    def _backup_path(self, index: int, suffix: str) -> Path:
+        return self.output_path.with_name(f"{self.output_path.name}.{index}{suffix}")
+
+
+def _serialize(timestamp: float, event: str, data: dict[str, Any]) -> str:
+    payload = {
+        "timestamp": datetime.fromtimestamp(timestamp, UTC).isoformat(),
+        "event": event,
+        "data": data,
+    }
+    return json.dumps(payload, sort_keys=True, default=str) + "\n"
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import re
+from array import array
+from bisect import bisect_left
 from functools import lru_cache
 
 _SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
@@ -21,6 +23,61 @@ def _normalize_text_cached(text: str) -> str:
     return _WHITESPACE.sub(" ", cleaned).strip()
 
 
+@lru_cache(maxsize=4)
+def normalized_offsets(text: str) -> array:
+    """Index in ``text`` of each character of ``normalize_text(text)``, followed by the end of the last one.
+
+    A collapsed whitespace run maps to its first raw character. The result is shared; do not modify it.
+    """
+    offsets = array("q")
+    pending_space = -1
+    end = 0
+    for index, char in enumerate(text):
+        if char == "\u200b":
+            continue
+        if char.isspace() or char == "\u00a0" or not char.isprintable():
+            if offsets and pending_space < 0:
+                pending_space = index
+            continue
+        if pending_space >= 0:
+            offsets.append(pending_space)
+            pending_space = -1
+        offsets.append(index)
+        end = index + 1
+    offsets.append(end)
+    return offsets
+
+
+class NormalizedOffsetMap:
+    """Converts offsets between a raw ``text`` and ``normalize_text(text)``.
+
+    The map is built on first use, so views can hold one per text and pay the O(n) scan once.
+    """
+
+    __slots__ = ("text", "_offsets")
+
+    def __init__(self, text: str = ""):
+        self.text = text
+        self._offsets: array | None = None
+
+    def raw_span(self, start: int, end: int) -> tuple[int, int] | None:
+        """Raw span of the normalized ``start:end``, or None when it is empty or out of range."""
+        offsets = self._map()
+        if start < 0 or end <= start or end >= len(offsets):
+            return None
+        return offsets[start], offsets[end - 1] + 1
+
+    def normalized_offset(self, raw_offset: int) -> int:
+        """First normalized character at or after ``raw_offset``."""
+        offsets = self._map()
+        return min(bisect_left(offsets, raw_offset), len(offsets) - 1)
+
+    def _map(self) -> array:
+        if self._offsets is None:
+            self._offsets = normalized_offsets(self.text)
+        return self._offsets
+
+
 def split_sentences(text: str, max_chars: int = 280) -> list[str]:
     return list(_split_sentences_cached(text, max_chars))
 
@@ -94,4 +151,5 @@ def text_processing_cache_info() -> dict[str, int]:
 
 def clear_text_processing_cache() -> None:
     _normalize_text_cached.cache_clear()
+    normalized_offsets.cache_clear()
     _split_sentences_cached.cache_clear()
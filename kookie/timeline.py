@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+TextSpan = tuple[int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class SpokenSentence:
+    index: int
+    start_sample: int
+    end_sample: int
+    text_start: int
+    text_end: int
+
+
+class SentenceTimeline:
+    """Cumulative sample offsets and text spans of synthesized sentences, in playback order.
+
+    Entries live in flat ``array`` columns, so a book-length session costs a few bytes per sentence, and
+    mapping a played-sample position to its sentence is a binary search.
+    """
+
+    __slots__ = ("_ends", "_text_starts", "_text_ends")
+
+    def __init__(self) -> None:
+        self._ends = array("q")
+        self._text_starts = array("q")
+        self._text_ends = array("q")
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    @property
+    def total_samples(self) -> int:
+        return self._ends[-1] if self._ends else 0
+
+    def append(self, sample_count: int, text_start: int, text_end: int) -> None:
+        self._ends.append(self.total_samples + max(0, int(sample_count)))
+        self._text_starts.append(int(text_start))
+        self._text_ends.append(max(int(text_start), int(text_end)))
+
+    def clear(self) -> None:
+        del self._ends[:]
+        del self._text_starts[:]
+        del self._text_ends[:]
+
+    def index_at(self, sample: int) -> int | None:
+        """Sentence playing at ``sample``; positions past the last sentence clamp to it."""
+        if not self._ends:
+            return None
+        return min(bisect_right(self._ends, max(0, int(sample))), len(self._ends) - 1)
+
+    def entry(self, index: int) -> SpokenSentence:
+        start_sample = self._ends[index - 1] if index > 0 else 0
+        return SpokenSentence(
+            index=index,
+            start_sample=start_sample,
+            end_sample=self._ends[index],
+            text_start=self._text_starts[index],
+            text_end=self._text_ends[index],
+        )
+
+    def at(self, sample: int) -> SpokenSentence | None:
+        index = self.index_at(sample)
+        return None if index is None else self.entry(index)
+
+
+def locate_sentences(
+    sentences: Iterable[str],
+    source_text: str | None,
+    *,
+    text_offset: int = 0,
+) -> Iterator[tuple[str, TextSpan]]:
+    """Pair each sentence with its span in ``source_text``, searching forward from the previous match.
+
+    Sentences that cannot be found (or when there is no source text) get an empty span at the search cursor.
+    """
+    cursor = 0
+    for sentence in sentences:
+        start = source_text.find(sentence, cursor) if source_text else -1
+        if start == -1:
+            yield sentence, (text_offset + cursor, text_offset + cursor)
+            continue
+        cursor = start + len(sentence)
+        yield sentence, (text_offset + start, text_offset + cursor)
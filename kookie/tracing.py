@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+
+DEFAULT_TRACE_CAPACITY = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class SpanRecord:
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    thread_name: str
+    args: dict[str, object] = field(default_factory=dict)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    def set(self, **_args: object) -> None:
+        return
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_category", "_args", "_start_ns")
+
+    def __init__(self, tracer: Tracer, name: str, category: str, args: dict[str, object]):
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start_ns = 0
+
+    def __enter__(self) -> _Span:
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        duration = time.perf_counter_ns() - self._start_ns
+        if exc_type is not None:
+            self._args["error"] = exc_type.__name__
+        thread = threading.current_thread()
+        self._tracer._records.append(
+            SpanRecord(
+                name=self._name,
+                category=self._category,
+                start_ns=self._start_ns,
+                duration_ns=duration,
+                thread_id=thread.ident or 0,
+                thread_name=thread.name,
+                args=self._args,
+            )
+        )
+        return False
+
+    def set(self, **args: object) -> None:
+        self._args.update(args)
+
+
+class Tracer:
+    """Ring-buffered span recorder; ``span()`` returns a shared no-op object while disabled."""
+
+    def __init__(self, *, enabled: bool = False, capacity: int = DEFAULT_TRACE_CAPACITY):
+        self.enabled = enabled
+        self._records: deque[SpanRecord] = deque(maxlen=max(1, int(capacity)))
+
+    def configure(self, *, enabled: bool, capacity: int | None = None) -> None:
+        if capacity is not None and capacity != self._records.maxlen:
+            self._records = deque(self._records, maxlen=max(1, int(capacity)))
+        self.enabled = enabled
+
+    def span(self, name: str, category: str = "kookie", **args: object) -> _Span | _NullSpan:
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def records(self) -> list[SpanRecord]:
+        return list(self._records)
+
+    def clear(self) -> None:
+        self._records.clear()
+
+    def to_chrome_trace(self) -> dict[str, object]:
+        pid = os.getpid()
+        records = self.records()
+        events: list[dict[str, object]] = []
+        threads: dict[int, str] = {}
+        for record in records:
+            threads.setdefault(record.thread_id, record.thread_name)
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.category,
+                    "ph": "X",
+                    "ts": record.start_ns / 1000.0,
+                    "dur": record.duration_ns / 1000.0,
+                    "pid": pid,
+                    "tid": record.thread_id,
+                    "args": {key: _json_safe(value) for key, value in record.args.items()},
+                }
+            )
+        for thread_id, thread_name in threads.items():
+            events.append(
+                {"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": thread_name}}
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, output_path: Path) -> Path:
+        output = output_path.expanduser()
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(self.to_chrome_trace()), encoding="utf-8")
+        return output
+
+
+def _json_safe(value: object) -> object:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+tracer = Tracer()
+
+
+def span(name: str, category: str = "kookie", **args: object) -> _Span | _NullSpan:
+    return tracer.span(name, category, **args)
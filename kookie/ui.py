@@ -16,6 +16,8 @@ from .editor_prefs import (
     sanitize_editor_preferences,
     save_editor_preferences,
 )
+from .line_index import LineIndex
+from .text_processing import NormalizedOffsetMap
 
 TEXT_FOREGROUND_COLOR = (0.10, 0.12, 0.15, 1.0)
 TEXT_BACKGROUND_COLOR = (0.94, 0.95, 0.97, 1.0)
@@ -23,6 +25,13 @@ TEXT_SELECTION_COLOR = (0.70, 0.82, 0.98, 0.70)
 TEXT_CURSOR_COLOR = (0.17, 0.40, 0.85, 1.0)
 SAVE_SPINNER_FRAMES = ("|", "/", "-", "\\")
 LOAD_SPINNER_FRAMES = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
+SPINNER_INTERVAL_SECONDS = 0.1
+DOCUMENT_VIEW_LINE_SPACING = 1.4
+DOCUMENT_VIEW_CHAR_WIDTH_RATIO = 0.55
+DOCUMENT_VIEW_SCROLL_LINES = 3
+DOCUMENT_VIEW_CURSOR_COLOR = (0.17, 0.40, 0.85, 1.0)
+PLAYBACK_HIGHLIGHT_COLOR = (0.80, 0.38, 0.08, 1.0)
+PLAYBACK_HIGHLIGHT_BACKGROUND_COLOR = (0.98, 0.76, 0.45, 0.45)
 APP_BACKGROUND_COLOR = (0.07, 0.10, 0.15, 1.0)
 TOOLBAR_BACKGROUND_COLOR = (0.14, 0.18, 0.25, 1.0)
 CONTROL_SURFACE_COLOR = (0.21, 0.26, 0.34, 1.0)
@@ -88,6 +97,38 @@ def _scroll_view_config(word_wrap: bool) -> dict[str, object]:
     }
 
 
+def _document_wrap_width(content_width: float, *, font_size: float, word_wrap: bool) -> int:
+    """Characters per display line for the virtualized view, estimated from an average glyph width."""
+    if not word_wrap or font_size <= 0:
+        return 0
+    return max(20, int(content_width / (font_size * DOCUMENT_VIEW_CHAR_WIDTH_RATIO)))
+
+
+def _uses_virtual_view(text: str, *, threshold: int) -> bool:
+    return threshold > 0 and len(text) > threshold
+
+
+def _raw_highlight(offsets: NormalizedOffsetMap, highlight: tuple[int, int] | None) -> tuple[int, int] | None:
+    """Map a span of the normalized text (what playback speaks) onto the raw editor text."""
+    if highlight is None:
+        return None
+    return offsets.raw_span(*highlight)
+
+
+def _highlight_rows(
+    lines: list[str], start: tuple[int, int], end: tuple[int, int]
+) -> list[tuple[int, int, int]]:
+    """``(row, first_column, last_column)`` covered between two ``(column, row)`` cursor positions."""
+    (start_column, start_row), (end_column, end_row) = start, end
+    rows: list[tuple[int, int, int]] = []
+    for row in range(max(0, start_row), min(len(lines) - 1, end_row) + 1):
+        first = start_column if row == start_row else 0
+        last = end_column if row == end_row else len(lines[row])
+        if last > first:
+            rows.append((row, first, last))
+    return rows
+
+
 def _save_spinner_text(*, is_saving: bool, tick: int) -> str:
     if not is_saving:
         return ""
@@ -422,7 +463,7 @@ def run_kivy_ui(runtime, startup_prompt: dict[str, object] | None = None) -> str
         from kivy.app import App
         from kivy.clock import Clock
         from kivy.core.window import Window
-        from kivy.graphics import Color, Rectangle
+        from kivy.graphics import Color, InstructionGroup, Rectangle
         from kivy.uix.boxlayout import BoxLayout
         from kivy.uix.button import Button
         from kivy.uix.label import Label
@@ -436,6 +477,168 @@ def run_kivy_ui(runtime, startup_prompt: dict[str, object] | None = None) -> str
 
     from .i18n import get_translator
 
+    class DocumentView(BoxLayout):
+        """Read-only document view that keeps one label per visible row over a ``LineIndex``."""
+
+        def __init__(self, *, prefs: EditorPreferences, **kwargs: Any):
+            super().__init__(orientation="horizontal", **kwargs)
+            self.prefs = prefs
+            self.index = LineIndex("")
+            # The view shows the raw text; playback offsets index its normalized form.
+            self.offsets = NormalizedOffsetMap("")
+            self.first_line = 0
+            self.cursor_offset = 0
+            self.highlight: tuple[int, int] | None = None
+            self._rows: list[Any] = []
+            self._syncing_scrollbar = False
+            self._rows_box = BoxLayout(orientation="vertical", padding=[14, 14, 14, 14])
+            with self._rows_box.canvas.before:
+                Color(*TEXT_BACKGROUND_COLOR)
+                background = Rectangle(pos=self._rows_box.pos, size=self._rows_box.size)
+            self._rows_box.bind(pos=lambda widget, value: setattr(background, "pos", value))
+            self._rows_box.bind(size=lambda widget, value: setattr(background, "size", value))
+            self._rows_box.bind(size=lambda *_: self._relayout())
+            self._scrollbar = Slider(
+                orientation="vertical",
+                min=0.0,
+                max=1.0,
+                value=1.0,
+                size_hint_x=None,
+                width=12,
+            )
+            self._scrollbar.bind(value=lambda _, value: self._on_scrollbar(value))
+            self.add_widget(self._rows_box)
+            self.add_widget(self._scrollbar)
+
+        @property
+        def line_height(self) -> float:
+            return float(self.prefs.font_size) * DOCUMENT_VIEW_LINE_SPACING
+
+        @property
+        def play_offset(self) -> int:
+            """Cursor position as an offset into the normalized text that playback reads."""
+            return self.offsets.normalized_offset(self.cursor_offset)
+
+        def set_text(self, text: str) -> None:
+            anchor = self.index.line_start(self.first_line)
+            previous = self.index.text
+            if previous and len(text) > len(previous) and text.startswith(previous):
+                # Streamed PDF pages only add text; index the new part instead of the whole document.
+                self.index.append(text[len(previous) :])
+            else:
+                self.index = LineIndex(text, wrap_width=self._wrap_width())
+            self.offsets = NormalizedOffsetMap(text)
+            self.first_line = min(self.index.line_for_offset(anchor), self._max_first_line())
+            self.cursor_offset = min(self.cursor_offset, len(text))
+            self._render()
+
+        def set_preferences(self, prefs: EditorPreferences) -> None:
+            self.prefs = prefs
+            for row in self._rows:
+                row.font_name = prefs.font_name
+                row.font_size = prefs.font_size
+                row.height = self.line_height
+            self._relayout()
+
+        def set_highlight(self, highlight: tuple[int, int] | None) -> None:
+            """Highlight a span of the normalized text."""
+            self.highlight = self.offsets.raw_span(*highlight) if highlight is not None else None
+            if self.highlight is not None:
+                self.scroll_to_offset(self.highlight[0])
+            self._render()
+
+        def scroll_to_offset(self, offset: int) -> None:
+            line = self.index.line_for_offset(offset)
+            if not self.first_line <= line < self.first_line + len(self._rows):
+                self._scroll_to_line(line - len(self._rows) // 2)
+
+        def on_touch_down(self, touch: Any) -> bool:
+            if not self._rows_box.collide_point(*touch.pos):
+                return super().on_touch_down(touch)
+            if touch.is_mouse_scrolling:
+                # Kivy reports the wheel moving toward the user as "scrollup".
+                step = DOCUMENT_VIEW_SCROLL_LINES if touch.button == "scrollup" else -DOCUMENT_VIEW_SCROLL_LINES
+                self._scroll_to_line(self.first_line + step)
+                return True
+            padding_left, padding_top = self._rows_box.padding[0], self._rows_box.padding[1]
+            row_number = int((self._rows_box.top - padding_top - touch.y) // self.line_height)
+            char_width = self.prefs.font_size * DOCUMENT_VIEW_CHAR_WIDTH_RATIO
+            column = int((touch.x - self._rows_box.x - padding_left) // char_width)
+            self.cursor_offset = self.index.position_to_offset(self.first_line + max(0, row_number), column)
+            self._render()
+            return True
+
+        def _wrap_width(self) -> int:
+            padding = self._rows_box.padding[0] + self._rows_box.padding[2]
+            return _document_wrap_width(
+                self._rows_box.width - padding,
+                font_size=self.prefs.font_size,
+                word_wrap=self.prefs.word_wrap,
+            )
+
+        def _relayout(self) -> None:
+            anchor = self.index.line_start(self.first_line)
+            self.index = self.index.rewrap(self._wrap_width())
+            padding = self._rows_box.padding[1] + self._rows_box.padding[3]
+            row_count = max(1, int((self._rows_box.height - padding) // self.line_height))
+            while len(self._rows) < row_count:
+                row = Label(
+                    text="",
+                    font_name=self.prefs.font_name,
+                    font_size=self.prefs.font_size,
+                    color=TEXT_FOREGROUND_COLOR,
+                    halign="left",
+                    valign="middle",
+                    shorten=True,
+                    shorten_from="right",
+                    size_hint_y=None,
+                    height=self.line_height,
+                )
+                row.bind(size=lambda label, size: setattr(label, "text_size", size))
+                self._rows.append(row)
+                self._rows_box.add_widget(row)
+            while len(self._rows) > row_count:
+                self._rows_box.remove_widget(self._rows.pop())
+            self.first_line = min(self.index.line_for_offset(anchor), self._max_first_line())
+            self._render()
+
+        def _max_first_line(self) -> int:
+            return max(0, len(self.index) - len(self._rows))
+
+        def _scroll_to_line(self, line: int) -> None:
+            self.first_line = min(max(0, int(line)), self._max_first_line())
+            self._render()
+
+        def _on_scrollbar(self, value: float) -> None:
+            if self._syncing_scrollbar:
+                return
+            line_height = self.line_height
+            scroll_top = (1.0 - float(value)) * self._max_first_line() * line_height
+            visible = self.index.visible_lines(scroll_top, len(self._rows) * line_height, line_height)
+            self.first_line = min(visible.start, self._max_first_line()) if visible else 0
+            self._render()
+
+        def _render(self) -> None:
+            cursor_line = self.index.line_for_offset(self.cursor_offset)
+            highlighted = range(0)
+            if self.highlight is not None:
+                start, end = self.highlight
+                highlighted = range(self.index.line_for_offset(start), self.index.line_for_offset(end - 1) + 1)
+            line_count = len(self.index)
+            for row_number, row in enumerate(self._rows):
+                line = self.first_line + row_number
+                row.text = self.index.line_text(line) if line < line_count else ""
+                if line in highlighted:
+                    row.color = PLAYBACK_HIGHLIGHT_COLOR
+                elif line == cursor_line:
+                    row.color = DOCUMENT_VIEW_CURSOR_COLOR
+                else:
+                    row.color = TEXT_FOREGROUND_COLOR
+            max_first_line = self._max_first_line()
+            self._syncing_scrollbar = True
+            self._scrollbar.value = 1.0 - (self.first_line / max_first_line) if max_first_line else 1.0
+            self._syncing_scrollbar = False
+
     class KookieApp(App):
         def __init__(self, **kwargs: Any):
             super().__init__(**kwargs)
@@ -498,14 +701,27 @@ def run_kivy_ui(runtime, startup_prompt: dict[str, object] | None = None) -> str
             root.add_widget(editor_controls)
 
             self.editor_scroll = ScrollView(**_scroll_view_config(word_wrap=self.editor_prefs.word_wrap))
+            self._virtual_threshold = int(getattr(runtime.config, "editor_virtual_threshold_chars", 0))
+            self._virtual_mode = False
+            self._highlight: tuple[int, int] | None = None
+            self.document_view = DocumentView(prefs=self.editor_prefs)
+            initial_virtual = _uses_virtual_view(runtime.text, threshold=self._virtual_threshold)
             self.text_input = TextInput(
                 **_text_input_config(
-                    initial_text=runtime.text,
+                    initial_text="" if initial_virtual else runtime.text,
                     prefs=self.editor_prefs,
                 )
             )
             self.text_input.size_hint_y = None
-            self.text_input.bind(text=lambda _, value: runtime.set_text(value))
+            # Offsets of the editor text, rebuilt only when the text changes.
+            self._editor_offsets = NormalizedOffsetMap("" if initial_virtual else runtime.text)
+            # Playback is drawn over the editor so the user's selection and cursor stay theirs while typing.
+            self._editor_highlight: tuple[int, int] | None = None
+            self._editor_highlight_group = InstructionGroup()
+            self.text_input.canvas.after.add(self._editor_highlight_group)
+            self.text_input.bind(pos=lambda *_: self._draw_editor_highlight())
+            self.text_input.bind(size=lambda *_: self._draw_editor_highlight())
+            self.text_input.bind(text=lambda _, value: self._on_text_input_change(value))
             self.text_input.bind(minimum_height=lambda *_: self._sync_text_input_size())
             self.editor_scroll.bind(height=lambda *_: self._sync_text_input_size())
             self.editor_scroll.bind(width=lambda *_: self._sync_text_input_size())
@@ -514,7 +730,12 @@ def run_kivy_ui(runtime, startup_prompt: dict[str, object] | None = None) -> str
             except Exception:
                 pass
             self.editor_scroll.add_widget(self.text_input)
-            root.add_widget(self.editor_scroll)
+            # Holds either the editable TextInput or, for very large documents, the virtualized view.
+            self.editor_area = BoxLayout(orientation="vertical")
+            self.editor_area.add_widget(self.editor_scroll)
+            root.add_widget(self.editor_area)
+            if initial_virtual:
+                self._show_document(runtime.text)
 
             self.font_picker.bind(text=lambda _, value: self._on_font_change(value))
             self.font_size_picker.bind(text=lambda _, value: self._on_font_size_change(value))
@@ -619,7 +840,10 @@ def run_kivy_ui(runtime, startup_prompt: dict[str, object] | None = None) -> str
             status_bar.add_widget(self.recent_status)
             root.add_widget(status_bar)
 
-            Clock.schedule_interval(self._sync_ui, 0.1)
+            # Runtime listeners fire on worker threads; the trigger coalesces them into one sync per frame.
+            self._sync_trigger = Clock.create_trigger(self._sync_ui, 0)
+            self._spinner_trigger = Clock.create_trigger(self._sync_ui, SPINNER_INTERVAL_SECONDS)
+            self._unsubscribe_runtime = runtime.subscribe(lambda _topic: self._sync_trigger())
             self._sync_now()
             Clock.schedule_once(lambda *_: self._sync_text_input_size(), 0)
             Clock.schedule_once(lambda *_: setattr(self.text_input, "focus", True), 0)
@@ -627,6 +851,9 @@ def run_kivy_ui(runtime, startup_prompt: dict[str, object] | None = None) -> str
             return root
 
         def on_stop(self):
+            unsubscribe = getattr(self, "_unsubscribe_runtime", None)
+            if callable(unsubscribe):
+                unsubscribe()
             runtime.stop()
             if startup_prompt is not None and self.startup_action is None:
                 self.startup_action = "continue_mock"
@@ -644,12 +871,18 @@ def run_kivy_ui(runtime, startup_prompt: dict[str, object] | None = None) -> str
                 self._sync_now()
                 return
 
-            runtime.start_pdf_load(selected_path)
+            runtime.start_pdf_load(
+                selected_path,
+                stream_playback=bool(getattr(runtime.config, "pdf_stream_playback", False)),
+            )
             self._sync_now()
 
         def _on_play(self) -> None:
-            runtime.set_text(self.text_input.text)
-            runtime.play()
+            if self._virtual_mode:
+                runtime.play_from_offset(self.document_view.play_offset)
+            else:
+                runtime.set_text(self.text_input.text)
+                runtime.play()
             self._sync_now()
 
         def _on_pause(self) -> None:
@@ -664,7 +897,8 @@ def run_kivy_ui(runtime, startup_prompt: dict[str, object] | None = None) -> str
             self._sync_now()
 
         def _on_save(self) -> None:
-            runtime.set_text(self.text_input.text)
+            if not self._virtual_mode:
+                runtime.set_text(self.text_input.text)
             if not runtime.text:
                 runtime.status_message = "Enter text in the text area."
                 self._sync_now()
@@ -745,14 +979,99 @@ def run_kivy_ui(runtime, startup_prompt: dict[str, object] | None = None) -> str
         def _sync_ui(self, *_: Any) -> None:
             self._sync_now()
 
+        def _sync_highlight(self, highlight: tuple[int, int] | None) -> None:
+            if highlight == self._highlight:
+                return
+            self._highlight = highlight
+            if self._virtual_mode:
+                self.document_view.set_highlight(highlight)
+                return
+            # Spans index the normalized text; the editor holds the raw text with its original whitespace.
+            self._editor_highlight = _raw_highlight(self._editor_offsets, highlight)
+            self._draw_editor_highlight()
+            if self._editor_highlight is not None:
+                self._scroll_editor_to(self._editor_highlight[0])
+
+        def _draw_editor_highlight(self) -> None:
+            group = self._editor_highlight_group
+            group.clear()
+            if self._editor_highlight is None or self._virtual_mode:
+                return
+            text_input = self.text_input
+            lines = getattr(text_input, "_lines", None) or text_input.text.split("\n")
+            start, end = self._editor_highlight
+            rows = _highlight_rows(
+                lines, text_input.get_cursor_from_index(start), text_input.get_cursor_from_index(end)
+            )
+            line_height = text_input.line_height + text_input.line_spacing
+            padding_left, padding_top = text_input.padding[0], text_input.padding[1]
+            top = text_input.top - padding_top + text_input.scroll_y
+            group.add(Color(*PLAYBACK_HIGHLIGHT_BACKGROUND_COLOR))
+            for row, first, last in rows:
+                line = lines[row]
+                x = text_input.x + padding_left - text_input.scroll_x + self._editor_text_width(line[:first])
+                width = self._editor_text_width(line[first:last])
+                group.add(Rectangle(pos=(x, top - (row + 1) * line_height), size=(width, line_height)))
+
+        def _editor_text_width(self, text: str) -> float:
+            measure = getattr(self.text_input, "_get_text_width", None)
+            if callable(measure):
+                return float(measure(text, self.text_input.tab_width, self.text_input._label_cached))
+            return len(text) * float(self.text_input.font_size) * DOCUMENT_VIEW_CHAR_WIDTH_RATIO
+
+        def _scroll_editor_to(self, offset: int) -> None:
+            _column, row = self.text_input.get_cursor_from_index(offset)
+            line_height = self.text_input.line_height + self.text_input.line_spacing
+            viewport = self.editor_scroll.height
+            scrollable = self.text_input.height - viewport
+            if scrollable <= 0:
+                return
+            line_top = row * line_height
+            viewport_top = (1.0 - self.editor_scroll.scroll_y) * scrollable
+            if viewport_top <= line_top <= viewport_top + viewport - line_height:
+                return
+            target_top = max(0.0, line_top - viewport / 3)
+            self.editor_scroll.scroll_y = min(1.0, max(0.0, 1.0 - target_top / scrollable))
+
+        def _on_text_input_change(self, value: str) -> None:
+            self._editor_offsets = NormalizedOffsetMap(value)
+            if self._editor_highlight is not None:
+                # Edited text no longer lines up with the spoken span; the next progress tick redraws it.
+                self._editor_highlight = None
+                self._highlight = None
+                self._draw_editor_highlight()
+            if not self._virtual_mode:
+                runtime.set_text(value)
+
+        def _show_document(self, text: str) -> None:
+            if _uses_virtual_view(text, threshold=self._virtual_threshold):
+                if not self._virtual_mode:
+                    self._virtual_mode = True
+                    self.text_input.text = ""
+                    self.editor_area.clear_widgets()
+                    self.editor_area.add_widget(self.document_view)
+                runtime.set_text(text)
+                self.document_view.set_text(text)
+                return
+
+            if self._virtual_mode:
+                self._virtual_mode = False
+                self.editor_area.clear_widgets()
+                self.editor_area.add_widget(self.editor_scroll)
+            self.text_input.text = text
+            self._sync_text_input_size()
+
         def _sync_now(self) -> None:
             runtime.poll_mp3_save()
-            
+
+            streamed_text = runtime.poll_pdf_stream()
+            if streamed_text is not None:
+                self._show_document(streamed_text)
+
             loaded_text, pdf_path = runtime.poll_pdf_load()
             if loaded_text is not None and pdf_path is not None:
                 self._recent_files = _update_recent_files(self._recent_files, str(pdf_path))
-                self.text_input.text = loaded_text
-                self._sync_text_input_size()
+                self._show_document(loaded_text)
 
             is_saving = runtime.is_saving_mp3
             is_loading = runtime.is_loading_pdf
@@ -763,6 +1082,9 @@ def run_kivy_ui(runtime, startup_prompt: dict[str, object] | None = None) -> str
             
             self.pause_btn.text = "Resume" if runtime.controller.state is PlaybackState.PAUSED else "Pause"
             
+            if is_saving or is_loading:
+                # Only busy states need periodic redraws, to animate the spinner.
+                self._spinner_trigger()
             if is_saving:
                 self.save_spinner.text = _save_spinner_text(is_saving=is_saving, tick=self._save_spinner_tick)
                 self._save_spinner_tick += 1
@@ -782,6 +1104,7 @@ def run_kivy_ui(runtime, startup_prompt: dict[str, object] | None = None) -> str
             self.progress_status.text = (
                 f"Progress: {progress['played_samples']} / {progress['synthesized_samples']} samples"
             )
+            self._sync_highlight(runtime.playback_highlight)
             if runtime.status_message.startswith("Saved MP3:"):
                 self._recent_files = _update_recent_files(
                     self._recent_files,
@@ -830,6 +1153,7 @@ def run_kivy_ui(runtime, startup_prompt: dict[str, object] | None = None) -> str
                 self.text_input.font_name = self.editor_prefs.font_name
             self.text_input.font_size = self.editor_prefs.font_size
             self.text_input.do_wrap = self.editor_prefs.word_wrap
+            self.document_view.set_preferences(self.editor_prefs)
 
             for key, value in _scroll_view_config(self.editor_prefs.word_wrap).items():
                 setattr(self.editor_scroll, key, value)
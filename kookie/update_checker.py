@@ -1,12 +1,22 @@
 from __future__ import annotations
 
 import json
+import os
 import re
-from dataclasses import dataclass
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.error import HTTPError, URLError
 from urllib.request import Request
 from urllib.request import urlopen as _stdlib_urlopen
 
+from .file_utils import apply_default_permissions
+from .network import NetworkProbe
+
 _VERSION_PATTERN = re.compile(r"^v?(\d+)\.(\d+)\.(\d+)")
+# Release fields kept in the on-disk cache; the rest of the GitHub payload is never read.
+_CACHED_RELEASE_FIELDS = ("tag_name", "html_url", "name", "prerelease")
 
 
 @dataclass(frozen=True, slots=True)
@@ -16,24 +26,120 @@ class UpdateInfo:
     release_name: str
 
 
+@dataclass(frozen=True, slots=True)
+class UpdateCheck:
+    """Outcome of one update check: the newer release, if any, or ``skipped`` when it never ran (offline)."""
+
+    info: UpdateInfo | None = None
+    skipped: bool = False
+
+
+@dataclass(slots=True)
+class UpdateCheckCache:
+    """Last release response and its ETag, so an unchanged release costs a bodiless ``304``."""
+
+    etag: str | None = None
+    release: dict[str, object] = field(default_factory=dict)
+    checked_at: float | None = None
+
+    @classmethod
+    def load(cls, path: Path) -> UpdateCheckCache:
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls()
+        if not isinstance(raw, dict):
+            return cls()
+        release = raw.get("release")
+        checked_at = raw.get("checked_at")
+        return cls(
+            etag=str(raw["etag"]) if raw.get("etag") else None,
+            release=dict(release) if isinstance(release, dict) else {},
+            checked_at=float(checked_at) if isinstance(checked_at, (int, float)) else None,
+        )
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as fh:
+                json.dump({"etag": self.etag, "release": self.release, "checked_at": self.checked_at}, fh)
+            apply_default_permissions(Path(temp_name))
+            os.replace(temp_name, path)
+        except OSError:
+            Path(temp_name).unlink(missing_ok=True)
+
+    def update_for(self, current_version: str) -> UpdateInfo | None:
+        return _update_from_release(self.release, current_version)
+
+
 def check_for_update(
     *,
     current_version: str,
     repo: str,
     fetcher=_stdlib_urlopen,
     timeout: float = 10.0,
+    network_probe: NetworkProbe | None = None,
+    cache_path: Path | None = None,
 ) -> UpdateInfo | None:
+    """Latest non-prerelease GitHub release newer than ``current_version``; skipped (None) while offline."""
+    return run_update_check(
+        current_version=current_version,
+        repo=repo,
+        fetcher=fetcher,
+        timeout=timeout,
+        network_probe=network_probe,
+        cache_path=cache_path,
+    ).info
+
+
+def run_update_check(
+    *,
+    current_version: str,
+    repo: str,
+    fetcher=_stdlib_urlopen,
+    timeout: float = 10.0,
+    network_probe: NetworkProbe | None = None,
+    cache_path: Path | None = None,
+) -> UpdateCheck:
+    """Check GitHub for a release newer than ``current_version``, reporting a check skipped while offline.
+
+    With ``cache_path``, the request carries ``If-None-Match`` for the cached ETag and a ``304`` reuses the
+    cached release.
+    """
     url = f"https://api.github.com/repos/{repo}/releases/latest"
-    request = Request(
-        url,
-        headers={
-            "Accept": "application/vnd.github+json",
-            "User-Agent": "kookie-update-checker",
-        },
-    )
-    with fetcher(request, timeout=timeout) as response:  # type: ignore[call-arg]
-        payload = json.loads(response.read().decode("utf-8"))
+    if network_probe is not None and not network_probe.is_online([url]):
+        return UpdateCheck(skipped=True)
+    cache = UpdateCheckCache.load(cache_path) if cache_path is not None else UpdateCheckCache()
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "kookie-update-checker",
+    }
+    if cache.etag and cache.release:
+        headers["If-None-Match"] = cache.etag
+    request = Request(url, headers=headers)
+    try:
+        with fetcher(request, timeout=timeout) as response:  # type: ignore[call-arg]
+            payload = json.loads(response.read().decode("utf-8"))
+            response_headers = getattr(response, "headers", None)
+            etag = response_headers.get("ETag") if response_headers is not None else None
+    except HTTPError as exc:
+        if exc.code != 304 or not cache.release:
+            raise
+        payload = cache.release
+        etag = (exc.headers.get("ETag") if exc.headers is not None else None) or cache.etag
+    except URLError:
+        if network_probe is not None:
+            network_probe.invalidate()
+        raise
+
+    if cache_path is not None and isinstance(payload, dict):
+        release = {key: payload[key] for key in _CACHED_RELEASE_FIELDS if key in payload}
+        UpdateCheckCache(etag=etag, release=release, checked_at=time.time()).save(cache_path)
+    return UpdateCheck(info=_update_from_release(payload, current_version))
+
 
+def _update_from_release(payload: object, current_version: str) -> UpdateInfo | None:
     if not isinstance(payload, dict):
         return None
     if bool(payload.get("prerelease", False)):
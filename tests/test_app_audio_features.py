@@ -57,6 +57,20 @@ def test_runtime_exposes_volume_speed_and_progress_controls(tmp_path: Path) -> N
     assert progress["synthesized_samples"] >= progress["played_samples"]
 
 
+class _DrainingAudioPlayer(_AudioPlayer):
+    """Stays in playback after the last chunk until stopped, like a device draining its buffer."""
+
+    def play_from_queue(self, audio_queue, stop_event, **kwargs):
+        super().play_from_queue(audio_queue, stop_event, **kwargs)
+        stop_event.wait(timeout=2.0)
+
+
+def _wait_for_playback(runtime, timeout: float = 2.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline and runtime.controller.state not in {PlaybackState.PLAYING, PlaybackState.PAUSED}:
+        time.sleep(0.01)
+
+
 def test_runtime_pause_resume_and_seek(tmp_path: Path) -> None:
     runtime = create_app(
         AppConfig(backend_mode="mock", asset_dir=tmp_path),
@@ -72,6 +86,8 @@ def test_runtime_pause_resume_and_seek(tmp_path: Path) -> None:
         time.sleep(0.01)
 
     paused = runtime.pause()
+    # Let the dispatcher deliver the pause first, so its thread is idle while resume and seek run.
+    assert runtime._event_dispatcher.flush(timeout=2.0)
     if paused:
         assert runtime.resume() is True
         assert runtime.seek(seconds=0.1) is True
@@ -79,3 +95,60 @@ def test_runtime_pause_resume_and_seek(tmp_path: Path) -> None:
         assert runtime.controller.state is PlaybackState.IDLE
     runtime.stop()
     runtime.wait_until_idle(timeout=2.0)
+
+
+def test_runtime_play_while_playing_restarts_with_edited_text(tmp_path: Path) -> None:
+    runtime = create_app(
+        AppConfig(backend_mode="mock", asset_dir=tmp_path),
+        ensure_download=False,
+        audio_player=_DrainingAudioPlayer(),
+    )
+
+    runtime.set_text("First sentence. Second sentence. Third sentence.")
+    assert runtime.play() is True
+    _wait_for_playback(runtime)
+    assert runtime.pause() is True
+
+    runtime.set_text("First sentence. Second sentence. Edited third sentence.")
+    assert runtime.play() is True
+    runtime.stop()
+    runtime.wait_until_idle(timeout=2.0)
+
+    snapshot = runtime.metrics.snapshot()
+    assert snapshot["play_restarted"] == 1
+    assert snapshot["play_started"] == 2
+    assert "play_rejected" not in snapshot
+    assert runtime.controller.state is PlaybackState.IDLE
+
+
+def test_runtime_play_from_offset_while_playing_restarts_at_the_cursor(tmp_path: Path) -> None:
+    runtime = create_app(
+        AppConfig(backend_mode="mock", asset_dir=tmp_path),
+        ensure_download=False,
+        audio_player=_DrainingAudioPlayer(),
+    )
+
+    runtime.set_text("First sentence. Second sentence. Third sentence.")
+    assert runtime.play() is True
+    _wait_for_playback(runtime)
+
+    assert runtime.play_from_offset(16) is True
+    runtime.stop()
+    runtime.wait_until_idle(timeout=2.0)
+
+    snapshot = runtime.metrics.snapshot()
+    assert snapshot["play_restarted"] == 1
+    assert snapshot["play_started"] == 2
+    assert "play_rejected" not in snapshot
+
+
+def test_headless_runtime_plays_without_an_output_device(tmp_path: Path) -> None:
+    from kookie.audio import NullAudioPlayer
+
+    runtime = create_app(AppConfig(backend_mode="mock", asset_dir=tmp_path), ensure_download=False, headless=True)
+
+    assert isinstance(runtime.controller.audio_player, NullAudioPlayer)
+    runtime.set_text("One sentence. Two sentence.")
+    assert runtime.play() is True
+    runtime.wait_until_idle(timeout=2.0)
+    assert runtime.controller.state is PlaybackState.IDLE
@@ -1,5 +1,6 @@
 import time
 from pathlib import Path
+from threading import Event
 from unittest.mock import MagicMock
 
 from kookie.app import create_app
@@ -106,3 +107,149 @@ def test_async_pdf_load_flow(tmp_path: Path) -> None:
     assert runtime.text == "Async Content"
     assert runtime.is_loading_pdf is False
     assert runtime.status_message == "Loaded PDF: async.pdf"
+
+
+def test_async_pdf_load_accepts_loader_without_page_callback(tmp_path: Path) -> None:
+    runtime = create_app(
+        AppConfig(backend_mode="mock", asset_dir=tmp_path),
+        ensure_download=False,
+        audio_player=_AudioPlayer(),
+    )
+
+    def _loader(path: Path, use_ocr_fallback: bool, progress_callback) -> PdfImportResult:
+        return PdfImportResult(text="Plain loader", pages_loaded=[1])
+
+    assert runtime.start_pdf_load(tmp_path / "plain.pdf", loader=_loader) is True
+
+    deadline = time.time() + 2.0
+    text = None
+    while time.time() < deadline and text is None:
+        text, _path = runtime.poll_pdf_load()
+        time.sleep(0.01)
+
+    assert text == "Plain loader"
+    assert runtime.text == "Plain loader"
+
+
+def test_streaming_pdf_load_plays_pages_while_loading(tmp_path: Path) -> None:
+    played: list[object] = []
+
+    class _RecordingPlayer:
+        def play_from_queue(self, audio_queue, stop_event):
+            while True:
+                chunk = audio_queue.get(timeout=2.0)
+                if chunk is None or stop_event.is_set():
+                    return
+                played.append(chunk)
+
+    runtime = create_app(
+        AppConfig(backend_mode="mock", asset_dir=tmp_path),
+        ensure_download=False,
+        audio_player=_RecordingPlayer(),
+    )
+    target = tmp_path / "book.pdf"
+    first_page_played = Event()
+    release = Event()
+
+    def _paged_loader(path: Path, *, page_callback, **kwargs) -> PdfImportResult:
+        page_callback(1, "First page.")
+        first_page_played.wait(timeout=2.0)
+        release.wait(timeout=2.0)
+        page_callback(2, "Second page.")
+        return PdfImportResult(text="First page.\n\nSecond page.", pages_loaded=[1, 2])
+
+    assert runtime.start_pdf_load(target, loader=_paged_loader, stream_playback=True) is True
+
+    deadline = time.time() + 2.0
+    while time.time() < deadline and not played:
+        time.sleep(0.01)
+    first_page_played.set()
+    assert len(played) == 1
+    assert runtime.is_loading_pdf is True
+    assert runtime.poll_pdf_stream() == "First page."
+    assert runtime.poll_pdf_stream() is None
+
+    release.set()
+    deadline = time.time() + 2.0
+    text = None
+    while time.time() < deadline and text is None:
+        text, _path = runtime.poll_pdf_load()
+        time.sleep(0.01)
+
+    runtime.wait_until_idle(timeout=2.0)
+    assert text == "First page.\n\nSecond page."
+    assert runtime.poll_pdf_stream() == "First page.\n\nSecond page."
+    assert len(played) == 2
+
+
+def test_loaded_document_supports_page_playback_and_page_range_export(tmp_path: Path, monkeypatch) -> None:
+    from kookie.document import DocumentModel
+
+    runtime = create_app(
+        AppConfig(backend_mode="mock", asset_dir=tmp_path),
+        ensure_download=False,
+        audio_player=_AudioPlayer(),
+    )
+    document = DocumentModel.from_pages([(1, "One. Two."), (2, "Three."), (3, "Four.")])
+
+    def _loader(path: Path, **kwargs) -> PdfImportResult:
+        return PdfImportResult(text=document.buffer, pages_loaded=[1, 2, 3], document=document)
+
+    runtime.load_pdf(tmp_path / "book.pdf", loader=_loader)
+    assert runtime.document is document
+
+    started: dict[str, object] = {}
+    monkeypatch.setattr(
+        runtime.controller,
+        "start_sentences",
+        lambda sentences, voice, **kwargs: started.update(sentences=sentences, voice=voice, **kwargs) or True,
+    )
+    assert runtime.play_page(2) is True
+    assert started["sentences"] == ["Three.", "Four."]
+    # The page joins are collapsed in ``text``, so the page offset is remapped onto it.
+    assert runtime.text == "One. Two. Three. Four."
+    assert started["text_offset"] == runtime.text.index("Three.")
+    assert started["source_text"] == "Three. Four."
+    assert runtime.play_page(9) is False
+
+    captured: dict[str, object] = {}
+
+    def _fake_save_speech_to_mp3(**kwargs):
+        captured.update(kwargs)
+        return kwargs["output_path"]
+
+    monkeypatch.setattr("kookie.app.save_speech_to_mp3", _fake_save_speech_to_mp3)
+    runtime.save_mp3(output_path=tmp_path / "range.mp3", page_range=(1, 2))
+    assert captured["sentences"] == ["One.", "Two.", "Three."]
+
+    runtime.set_text("Edited text")
+    assert runtime.document is None
+
+
+def test_segmented_export_of_a_loaded_document_breaks_between_pages(tmp_path: Path, monkeypatch) -> None:
+    from kookie.document import DocumentModel
+
+    # About ten characters of speech per segment: each page fits, but no two pages do.
+    runtime = create_app(
+        AppConfig(backend_mode="mock", asset_dir=tmp_path, export_segment_minutes=10 / 900),
+        ensure_download=False,
+        audio_player=_AudioPlayer(),
+    )
+    document = DocumentModel.from_pages([(1, "One. Two."), (2, "Three."), (3, "Four.")])
+    runtime.load_pdf(
+        tmp_path / "book.pdf",
+        loader=lambda path, **kwargs: PdfImportResult(text=document.buffer, pages_loaded=[1, 2, 3], document=document),
+    )
+
+    captured: dict[str, object] = {}
+
+    def _fake_save_speech_segmented(**kwargs):
+        captured.update(kwargs)
+        return kwargs["output_path"]
+
+    monkeypatch.setattr("kookie.app.save_speech_segmented", _fake_save_speech_segmented)
+    runtime.save_mp3(output_path=tmp_path / "book.mp3")
+    assert captured["segments"] == [["One.", "Two."], ["Three."], ["Four."]]
+
+    runtime.save_mp3(output_path=tmp_path / "range.mp3", page_range=(2, 3))
+    assert captured["segments"] == [["Three."], ["Four."]]
@@ -114,33 +114,89 @@ def test_start_mp3_save_sets_saving_status(tmp_path: Path, monkeypatch) -> None:
     _wait_for_async_save(runtime)
 
 
-def test_start_mp3_save_rejects_when_already_running(tmp_path: Path, monkeypatch) -> None:
+def test_start_mp3_save_queues_when_already_running(tmp_path: Path, monkeypatch) -> None:
     runtime = create_app(
-        AppConfig(backend_mode="mock", asset_dir=tmp_path),
+        AppConfig(backend_mode="mock", asset_dir=tmp_path, export_max_jobs=1),
         ensure_download=False,
         audio_player=_AudioPlayer(),
     )
     runtime.set_text("Save this speech")
     started = Event()
     release = Event()
+    saved: list[Path] = []
 
     def _fake_save_speech_to_mp3(**kwargs):
         started.set()
         release.wait(timeout=2.0)
         kwargs["output_path"].write_bytes(b"mp3")
+        saved.append(kwargs["output_path"])
         return kwargs["output_path"]
 
     monkeypatch.setattr("kookie.app.save_speech_to_mp3", _fake_save_speech_to_mp3)
 
     assert runtime.start_mp3_save(output_path=tmp_path / "saved.mp3") is True
     assert started.wait(timeout=1.0) is True
-    assert runtime.start_mp3_save(output_path=tmp_path / "second.mp3") is False
-    assert runtime.status_message == "MP3 save is already in progress."
+    assert runtime.start_mp3_save(output_path=tmp_path / "second.mp3") is True
+    assert runtime.status_message == "Saving MP3... (1 queued)"
+    states = [job.state.value for job in runtime.export_jobs()]
+    assert states == ["running", "queued"]
+
+    release.set()
+    _wait_for_async_save(runtime)
+    assert saved == [tmp_path / "saved.mp3", tmp_path / "second.mp3"]
+    assert runtime.status_message == f"Saved MP3: {tmp_path / 'second.mp3'}"
+
+
+def test_start_mp3_save_does_not_count_running_jobs_as_queued(tmp_path: Path, monkeypatch) -> None:
+    runtime = create_app(
+        AppConfig(backend_mode="mock", asset_dir=tmp_path, export_max_jobs=2),
+        ensure_download=False,
+        audio_player=_AudioPlayer(),
+    )
+    runtime.set_text("Save this speech")
+    release = Event()
+
+    def _fake_save_speech_to_mp3(**kwargs):
+        release.wait(timeout=2.0)
+        return kwargs["output_path"]
+
+    monkeypatch.setattr("kookie.app.save_speech_to_mp3", _fake_save_speech_to_mp3)
+
+    assert runtime.start_mp3_save(output_path=tmp_path / "first.mp3") is True
+    assert runtime.start_mp3_save(output_path=tmp_path / "second.mp3") is True
+    assert runtime.status_message == "Saving MP3..."
 
     release.set()
     _wait_for_async_save(runtime)
 
 
+def test_cancel_export_stops_queued_job(tmp_path: Path, monkeypatch) -> None:
+    runtime = create_app(
+        AppConfig(backend_mode="mock", asset_dir=tmp_path, export_max_jobs=1),
+        ensure_download=False,
+        audio_player=_AudioPlayer(),
+    )
+    runtime.set_text("Save this speech")
+    release = Event()
+
+    def _fake_save_speech_to_mp3(**kwargs):
+        release.wait(timeout=2.0)
+        return kwargs["output_path"]
+
+    monkeypatch.setattr("kookie.app.save_speech_to_mp3", _fake_save_speech_to_mp3)
+
+    runtime.queue_export(tmp_path / "first.mp3")
+    second = runtime.queue_export(tmp_path / "second.mp3", text="Another document")
+    assert second is not None
+    assert runtime.cancel_export(second) is True
+    release.set()
+    _wait_for_async_save(runtime)
+
+    states = {job.job_id: job.state.value for job in runtime.export_jobs()}
+    assert states[second] == "cancelled"
+    assert runtime.metrics.snapshot()["save_mp3_cancelled"] == 1
+
+
 def test_poll_mp3_save_updates_status_on_success(tmp_path: Path, monkeypatch) -> None:
     runtime = create_app(
         AppConfig(backend_mode="mock", asset_dir=tmp_path),
@@ -208,6 +264,8 @@ def test_poll_mp3_save_records_completed_telemetry_on_success(tmp_path: Path, mo
     assert runtime.start_mp3_save(output_path=output_path) is True
     _wait_for_async_save(runtime)
 
+    assert runtime.telemetry is not None
+    runtime.telemetry.flush()
     payloads = [
         json.loads(line)
         for line in telemetry_path.read_text(encoding="utf-8").splitlines()
@@ -59,3 +59,28 @@ def test_runtime_shutdown_closes_health_server_once(tmp_path) -> None:
 
     assert fake_server.shutdown_calls == 1
     assert fake_server.close_calls == 1
+
+
+def test_runtime_publishes_state_changes_to_subscribers(tmp_path) -> None:
+    runtime = create_app(
+        AppConfig(backend_mode="mock", asset_dir=tmp_path),
+        ensure_download=False,
+        audio_player=_AudioPlayer(),
+    )
+    topics: list[str] = []
+    unsubscribe = runtime.subscribe(topics.append)
+
+    runtime.set_text("Hello there.")
+    runtime.set_text("Hello there.")
+    assert topics == ["text"]
+
+    assert runtime.play() is True
+    runtime.wait_until_idle(timeout=2.0)
+    assert "playback" in topics
+    assert "status_message" in topics
+
+    unsubscribe()
+    topics.clear()
+    runtime.status_message = "Changed"
+    assert topics == []
+    runtime.shutdown()
@@ -4,7 +4,7 @@ from pathlib import Path
 
 from kookie.app import create_app
 from kookie.config import AppConfig
-from kookie.update_checker import UpdateInfo
+from kookie.update_checker import UpdateCheck, UpdateInfo
 
 
 class _AudioPlayer:
@@ -60,3 +60,117 @@ def test_runtime_check_for_updates_handles_checker_failure(tmp_path: Path) -> No
     assert runtime.check_for_updates(checker=failing_checker) is None
     assert runtime.status_message.startswith("Unable to check for updates:")
     assert runtime.metrics.snapshot().get("update_check_failed", 0) == 1
+
+
+def test_runtime_start_update_checks_publishes_cache_then_checks_in_background(tmp_path: Path) -> None:
+    import threading
+
+    from kookie.update_checker import UpdateCheckCache
+
+    UpdateCheckCache(
+        etag='"v9"',
+        release={"tag_name": "v9.0.0", "html_url": "https://example.test/v9", "name": "9.0.0"},
+        checked_at=None,
+    ).save(tmp_path / "update_check.json")
+    runtime = create_app(
+        AppConfig(backend_mode="mock", asset_dir=tmp_path, update_check_enabled=True),
+        ensure_download=False,
+        audio_player=_AudioPlayer(),
+    )
+    checked = threading.Event()
+    calls: list[dict[str, object]] = []
+
+    def _checker(**kwargs):
+        calls.append(kwargs)
+        checked.set()
+        return None
+
+    try:
+        runtime.start_update_checks(checker=_checker)
+        assert runtime.update_info is not None and runtime.update_info.version == "9.0.0"
+        assert checked.wait(2.0)
+    finally:
+        runtime.shutdown()
+
+    assert calls[0]["cache_path"] == tmp_path / "update_check.json"
+
+
+def test_runtime_start_update_checks_waits_for_interval_after_recent_check(tmp_path: Path) -> None:
+    import time
+
+    from kookie.update_checker import UpdateCheckCache
+
+    UpdateCheckCache(checked_at=time.time()).save(tmp_path / "update_check.json")
+    runtime = create_app(
+        AppConfig(backend_mode="mock", asset_dir=tmp_path, update_check_enabled=True),
+        ensure_download=False,
+        audio_player=_AudioPlayer(),
+    )
+    calls: list[object] = []
+
+    try:
+        runtime.start_update_checks(checker=lambda **kwargs: calls.append(kwargs))
+        time.sleep(0.2)
+    finally:
+        runtime.shutdown()
+
+    assert calls == []
+    assert runtime.update_info is None
+
+
+
+def test_background_update_checks_publish_info_without_touching_status(tmp_path: Path) -> None:
+    import threading
+    import time
+
+    runtime = create_app(
+        AppConfig(backend_mode="mock", asset_dir=tmp_path, update_check_enabled=True),
+        ensure_download=False,
+        audio_player=_AudioPlayer(),
+    )
+    runtime.status_message = "Saved MP3"
+    answers: list[object] = [RuntimeError("network down"), UpdateInfo("0.2.0", "https://example.test/v0.2.0", "0.2.0")]
+    failed = threading.Event()
+
+    def _checker(**_kwargs):
+        answer = answers.pop() if answers else RuntimeError("network down")
+        if isinstance(answer, Exception):
+            failed.set()
+            raise answer
+        return answer
+
+    worker = threading.Thread(target=runtime._run_update_checks, args=(_checker, 0.01, 0.0), daemon=True)
+    try:
+        worker.start()
+        assert failed.wait(2.0)
+        deadline = time.time() + 2.0
+        while time.time() < deadline and runtime.metrics.snapshot().get("update_check_failed", 0) == 0:
+            time.sleep(0.01)
+    finally:
+        runtime.shutdown()
+        worker.join(timeout=2.0)
+
+    assert runtime.update_info is not None and runtime.update_info.version == "0.2.0"
+    assert runtime.metrics.snapshot()["update_check_failed"] >= 1
+    assert runtime.status_message == "Saved MP3"
+
+
+def test_update_check_skipped_while_offline_keeps_the_published_update(tmp_path: Path) -> None:
+    from kookie.update_checker import UpdateCheckCache
+
+    UpdateCheckCache(
+        release={"tag_name": "v9.0.0", "html_url": "https://example.test/v9", "name": "9.0.0"},
+        checked_at=1.0,
+    ).save(tmp_path / "update_check.json")
+    runtime = create_app(
+        AppConfig(backend_mode="mock", asset_dir=tmp_path, update_check_enabled=True),
+        ensure_download=False,
+        audio_player=_AudioPlayer(),
+    )
+    runtime.update_info = UpdateCheckCache.load(tmp_path / "update_check.json").update_for("0.1.0")
+
+    assert runtime.check_for_updates(checker=lambda **_kwargs: UpdateCheck(skipped=True)) is None
+    assert runtime.update_info is not None and runtime.update_info.version == "9.0.0"
+
+    assert runtime.check_for_updates(checker=lambda **_kwargs: UpdateCheck()) is None
+    assert runtime.update_info is None
@@ -1,11 +1,14 @@
 import io
 import json
+import os
+import stat
 from urllib.error import URLError
 
 import pytest
 
-from kookie.assets import AssetDownloadError, AssetSpec, download_asset, resolve_assets
+from kookie.assets import AssetDownloadError, AssetSpec, download_asset, probe_sources, resolve_assets
 from kookie.config import AppConfig
+from kookie.retry import RetryPolicy
 
 
 class _BytesResponse(io.BytesIO):
@@ -73,6 +76,7 @@ def test_download_asset_cleans_temp_file_on_checksum_failure(tmp_path) -> None:
 
     assert not (tmp_path / "model.onnx").exists()
     assert not (tmp_path / "model.onnx.tmp").exists()
+    assert list(tmp_path.glob("model.onnx.*.tmp")) == []
 
 
 def test_download_asset_retries_transient_network_error(tmp_path) -> None:
@@ -143,6 +147,26 @@ def test_resolve_assets_writes_manifest_when_ready(tmp_path) -> None:
     assert "model_version" in resolved.manifest_path.read_text(encoding="utf-8")
 
 
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_downloaded_assets_and_manifest_get_umask_default_permissions(tmp_path) -> None:
+    cfg = AppConfig(asset_dir=tmp_path / "assets")
+    source = tmp_path / "mirror" / cfg.model_filename
+    source.parent.mkdir()
+    source.write_bytes(b"model")
+    cfg.asset_dir.mkdir()
+    (cfg.asset_dir / cfg.voices_filename).write_bytes(b"voices")
+    spec = AssetSpec(name="model", filename=cfg.model_filename, url=source.as_uri(), sha256=None)
+    mask = os.umask(0o022)
+    os.umask(mask)
+
+    saved = download_asset(spec, target_dir=cfg.asset_dir, timeout=2.0)
+    manifest = resolve_assets(cfg, ensure_download=False).manifest_path
+
+    assert stat.S_IMODE(saved.stat().st_mode) == 0o666 & ~mask
+    assert manifest is not None
+    assert stat.S_IMODE(manifest.stat().st_mode) == 0o666 & ~mask
+
+
 def test_resolve_assets_can_require_checksums(tmp_path) -> None:
     cfg = AppConfig(
         asset_dir=tmp_path,
@@ -206,3 +230,524 @@ def test_resolve_assets_not_verified_when_checksums_required_but_missing_with_lo
     assert resolved.ready is True
     assert resolved.verified is False
     assert any("checksum is required" in message for message in resolved.errors)
+
+
+def test_resolve_assets_caches_verified_digests_and_skips_unchanged_manifest(tmp_path, monkeypatch) -> None:
+    import hashlib
+
+    import kookie.assets as assets
+
+    model = tmp_path / "model.onnx"
+    voices = tmp_path / "voices.bin"
+    model.write_bytes(b"model")
+    voices.write_bytes(b"voices")
+    cfg = AppConfig(
+        asset_dir=tmp_path,
+        model_filename=model.name,
+        voices_filename=voices.name,
+        model_sha256=hashlib.sha256(b"model").hexdigest(),
+        voices_sha256=hashlib.sha256(b"voices").hexdigest(),
+    )
+    hashed: list[str] = []
+    real_sha256_file = assets._sha256_file
+    monkeypatch.setattr(assets, "_sha256_file", lambda path, *args: hashed.append(path.name) or real_sha256_file(path))
+
+    first = resolve_assets(cfg, ensure_download=False)
+    assert first.ready is True
+    assert sorted(hashed) == ["model.onnx", "voices.bin"]
+    manifest = json.loads(first.manifest_path.read_text(encoding="utf-8"))
+    assert manifest["digests"]["model.onnx"]["size"] == 5
+    written_at = first.manifest_path.stat().st_mtime_ns
+
+    hashed.clear()
+    second = resolve_assets(cfg, ensure_download=False)
+    assert second.ready is True
+    assert hashed == []
+    assert second.manifest_path.stat().st_mtime_ns == written_at
+
+    voices.write_bytes(b"tampered voices")
+    third = resolve_assets(cfg, ensure_download=False)
+    assert hashed == ["voices.bin"]
+    assert third.ready is False
+    assert any("checksum mismatch for voices.bin" in message for message in third.errors)
+
+
+def test_concurrent_downloads_of_the_same_asset_fetch_once(tmp_path, monkeypatch) -> None:
+    import threading
+
+    import kookie.assets as assets
+
+    contended = threading.Event()
+    real_try_lock = assets._try_lock
+
+    def _try_lock(handle) -> bool:
+        acquired = real_try_lock(handle)
+        if not acquired:
+            contended.set()
+        return acquired
+
+    monkeypatch.setattr(assets, "_try_lock", _try_lock)
+    spec = AssetSpec(name="model", filename="model.onnx", url="https://example.test/model.onnx")
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[str] = []
+
+    def slow_urlopen(url: str, timeout: float):
+        calls.append(url)
+        started.set()
+        assert release.wait(2.0)
+        return _BytesResponse(b"model-bytes")
+
+    def never_urlopen(url: str, timeout: float):
+        raise AssertionError("second process should reuse the first download")
+
+    results: dict[str, object] = {}
+    first = threading.Thread(
+        target=lambda: results.update(
+            first=download_asset(spec, target_dir=tmp_path, timeout=2.0, urlopen=slow_urlopen)
+        )
+    )
+    first.start()
+    assert started.wait(2.0)
+    second = threading.Thread(
+        target=lambda: results.update(
+            second=download_asset(spec, target_dir=tmp_path, timeout=2.0, urlopen=never_urlopen)
+        )
+    )
+    second.start()
+    assert contended.wait(2.0)
+    release.set()
+    first.join(2.0)
+    second.join(2.0)
+
+    assert calls == [spec.url]
+    assert results["first"] == results["second"] == tmp_path / "model.onnx"
+    assert (tmp_path / "model.onnx").read_bytes() == b"model-bytes"
+    assert list(tmp_path.glob("model.onnx.*.tmp")) == []
+
+
+def test_download_lock_times_out_while_another_holder_is_active(tmp_path) -> None:
+    from kookie.assets import download_lock
+
+    with download_lock(tmp_path, "model.onnx"):
+        with pytest.raises(AssetDownloadError, match="timed out"):
+            with download_lock(tmp_path, "model.onnx", timeout=0.2):
+                pass
+
+
+def _serve_asset(
+    payload: bytes,
+    *,
+    advertise_ranges: bool,
+    honor_ranges: bool,
+    delay: float = 0.0,
+    probe_delay: float = 0.0,
+    trickle: bool = False,
+    etag: str | None = None,
+    content_range_shift: int = 0,
+):
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            requested = self.headers.get("Range")
+            self.server.seen_ranges.append(requested)
+            if requested:
+                self.server.seen_if_range.append(self.headers.get("If-Range"))
+            time.sleep(delay + (probe_delay if requested == "bytes=0-0" else 0.0))
+            body = payload
+            status = 200
+            if requested == "bytes=0-0" and trickle:
+                body = payload[:1]
+                status = 206
+                start, end = 0, 0
+            elif requested and honor_ranges:
+                start, end = (int(value) for value in requested.removeprefix("bytes=").split("-"))
+                body = payload[start : end + 1]
+                status = 206
+            self.send_response(status)
+            if advertise_ranges:
+                self.send_header("Accept-Ranges", "bytes")
+            if status == 206:
+                shift = content_range_shift if requested != "bytes=0-0" else 0
+                self.send_header("Content-Range", f"bytes {start + shift}-{end + shift}/{len(payload)}")
+            if etag is not None:
+                self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            try:
+                if trickle and status == 200:
+                    for offset in range(0, len(body), 16):
+                        self.wfile.write(body[offset : offset + 16])
+                        self.wfile.flush()
+                        time.sleep(0.05)
+                else:
+                    self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        def log_message(self, *_args) -> None:
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.seen_ranges = []
+    server.seen_if_range = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.mark.parametrize(
+    ("advertise_ranges", "honor_ranges", "expected_ranges"),
+    [
+        (True, True, [None, "bytes=250-499", "bytes=500-749", "bytes=750-999"]),
+        (False, False, [None]),
+        (True, False, [None, "bytes=250-499", "bytes=500-749", "bytes=750-999", None]),
+    ],
+)
+def test_download_asset_fetches_byte_ranges_in_parallel_when_supported(
+    tmp_path, advertise_ranges, honor_ranges, expected_ranges
+) -> None:
+    import hashlib
+
+    payload = bytes(range(256)) * 3 + b"tail" * 58
+    assert len(payload) == 1000
+    server = _serve_asset(payload, advertise_ranges=advertise_ranges, honor_ranges=honor_ranges)
+    spec = AssetSpec(
+        name="model",
+        filename="model.onnx",
+        url=f"http://127.0.0.1:{server.server_address[1]}/model.onnx",
+        sha256=hashlib.sha256(payload).hexdigest(),
+    )
+    events: list[tuple[int, int | None]] = []
+    try:
+        saved = download_asset(
+            spec,
+            target_dir=tmp_path,
+            timeout=5.0,
+            connections=4,
+            min_segment_bytes=100,
+            chunk_size=64,
+            progress_callback=lambda downloaded, total: events.append((downloaded, total)),
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert saved.read_bytes() == payload
+    assert sorted(server.seen_ranges, key=str) == sorted(expected_ranges, key=str)
+    assert events[-1] == (1000, 1000)
+    assert list(tmp_path.glob("model.onnx.*.tmp")) == []
+
+
+def test_ranged_download_sends_if_range_and_rejects_mismatched_content_range(tmp_path) -> None:
+    payload = bytes(range(256)) * 4
+    tagged = _serve_asset(payload, advertise_ranges=True, honor_ranges=True, etag='"v1"')
+    shifted = _serve_asset(payload, advertise_ranges=True, honor_ranges=True, content_range_shift=1)
+    try:
+        for server, name in ((tagged, "tagged"), (shifted, "shifted")):
+            spec = AssetSpec(name=name, filename=f"{name}.bin", url=f"http://127.0.0.1:{server.server_address[1]}/")
+            saved = download_asset(spec, target_dir=tmp_path, timeout=5.0, connections=4, min_segment_bytes=100)
+            assert saved.read_bytes() == payload
+    finally:
+        for server in (tagged, shifted):
+            server.shutdown()
+            server.server_close()
+
+    assert tagged.seen_if_range and set(tagged.seen_if_range) == {'"v1"'}
+    # Ranges reported at the wrong offset are not spliced in; the file is fetched again as one stream.
+    assert shifted.seen_ranges[-1] is None
+
+
+def test_aborted_ranges_are_not_retried() -> None:
+    from kookie.assets import _DownloadAborted, _retryable_range_error
+
+    assert _retryable_range_error(_DownloadAborted("download aborted after another range failed")) is False
+    assert _retryable_range_error(OSError("reset")) is True
+
+
+def test_asset_spec_sources_normalize_mirror_entries(tmp_path) -> None:
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    spec = AssetSpec(
+        name="model",
+        filename="model.onnx",
+        url="https://example.test/model.onnx",
+        mirrors=(str(cache), cache.as_uri(), "http://lan-cache.local/kookie/", " ", "https://example.test/model.onnx"),
+    )
+
+    assert spec.sources == [
+        (cache / "model.onnx").as_uri(),
+        "http://lan-cache.local/kookie/model.onnx",
+        "https://example.test/model.onnx",
+    ]
+
+
+def test_probe_sources_orders_by_latency_and_drops_unreachable(tmp_path) -> None:
+    import socket
+
+    payload = b"x" * 10
+    fast = _serve_asset(payload, advertise_ranges=True, honor_ranges=True)
+    slow = _serve_asset(payload, advertise_ranges=True, honor_ranges=True, delay=0.2)
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        closed_port = sock.getsockname()[1]
+    local = tmp_path / "model.onnx"
+    local.write_bytes(payload)
+    try:
+        ordered = probe_sources(
+            [
+                f"http://127.0.0.1:{slow.server_address[1]}/model.onnx",
+                f"http://127.0.0.1:{closed_port}/model.onnx",
+                f"http://127.0.0.1:{fast.server_address[1]}/model.onnx",
+                local.as_uri(),
+                (tmp_path / "missing.onnx").as_uri(),
+            ],
+            timeout=2.0,
+        )
+    finally:
+        for server in (fast, slow):
+            server.shutdown()
+            server.server_close()
+
+    assert ordered == [
+        local.as_uri(),
+        f"http://127.0.0.1:{fast.server_address[1]}/model.onnx",
+        f"http://127.0.0.1:{slow.server_address[1]}/model.onnx",
+    ]
+
+
+def test_download_asset_falls_back_to_next_mirror_and_local_directories(tmp_path) -> None:
+    import hashlib
+
+    cache = tmp_path / "lan-cache"
+    cache.mkdir()
+    (cache / "voices.bin").write_bytes(b"cached voices")
+    target = tmp_path / "assets"
+    spec = AssetSpec(
+        name="voices",
+        filename="voices.bin",
+        url="https://example.invalid/voices.bin",
+        sha256=hashlib.sha256(b"cached voices").hexdigest(),
+        mirrors=(str(tmp_path / "empty-mirror"), str(cache)),
+    )
+
+    saved = download_asset(spec, target_dir=target, timeout=2.0, retry_policy=RetryPolicy(max_attempts=1))
+
+    assert saved.read_bytes() == b"cached voices"
+
+
+def test_download_asset_caps_attempt_timeouts_to_the_retry_budget(tmp_path) -> None:
+    timeouts: list[float] = []
+
+    def _urlopen(request, timeout: float):
+        timeouts.append(timeout)
+        raise URLError("unreachable")
+
+    spec = AssetSpec(name="model", filename="model.onnx", url="https://example.invalid/model.onnx", sha256=None)
+
+    with pytest.raises(AssetDownloadError):
+        download_asset(
+            spec,
+            target_dir=tmp_path,
+            timeout=30.0,
+            urlopen=_urlopen,
+            retry_policy=RetryPolicy(max_attempts=5, base_delay=0.2, jitter=0.0, deadline_seconds=0.5),
+        )
+
+    assert len(timeouts) == 2
+    assert timeouts[0] <= 0.5
+    assert timeouts[1] <= 0.3
+
+
+def test_download_asset_resumes_on_another_mirror_when_throughput_collapses(tmp_path, monkeypatch) -> None:
+    import hashlib
+
+    import kookie.assets as assets
+
+    monkeypatch.setattr(assets, "THROUGHPUT_WINDOW_SECONDS", 0.2)
+    payload = bytes(range(256)) * 4
+    # The trickling mirror answers probes quickly, so it is ranked first and then stalls mid-transfer.
+    trickle = _serve_asset(payload, advertise_ranges=False, honor_ranges=False, trickle=True)
+    healthy = _serve_asset(payload, advertise_ranges=True, honor_ranges=True, probe_delay=0.1)
+    spec = AssetSpec(
+        name="model",
+        filename="model.onnx",
+        url=f"http://127.0.0.1:{healthy.server_address[1]}/model.onnx",
+        sha256=hashlib.sha256(payload).hexdigest(),
+        mirrors=(f"http://127.0.0.1:{trickle.server_address[1]}/model.onnx",),
+    )
+    try:
+        saved = download_asset(
+            spec,
+            target_dir=tmp_path,
+            timeout=5.0,
+            chunk_size=64,
+            min_bytes_per_second=10_000,
+            retry_policy=RetryPolicy(max_attempts=1),
+        )
+    finally:
+        for server in (trickle, healthy):
+            server.shutdown()
+            server.server_close()
+
+    assert saved.read_bytes() == payload
+    resumed = [value for value in healthy.seen_ranges if value not in (None, "bytes=0-0")]
+    assert len(resumed) == 1
+    start, end = (int(value) for value in resumed[0].removeprefix("bytes=").split("-"))
+    assert 0 < start < len(payload) and end == len(payload) - 1
+
+
+def test_download_asset_lets_the_last_source_finish_below_the_throughput_floor(tmp_path, monkeypatch) -> None:
+    import hashlib
+
+    import kookie.assets as assets
+
+    monkeypatch.setattr(assets, "THROUGHPUT_WINDOW_SECONDS", 0.2)
+    payload = bytes(range(256))
+    slow_mirror = _serve_asset(payload, advertise_ranges=False, honor_ranges=False, trickle=True)
+    slow_origin = _serve_asset(payload, advertise_ranges=False, honor_ranges=False, trickle=True, probe_delay=0.1)
+    spec = AssetSpec(
+        name="model",
+        filename="model.onnx",
+        url=f"http://127.0.0.1:{slow_origin.server_address[1]}/model.onnx",
+        sha256=hashlib.sha256(payload).hexdigest(),
+        mirrors=(f"http://127.0.0.1:{slow_mirror.server_address[1]}/model.onnx",),
+    )
+    try:
+        saved = download_asset(
+            spec,
+            target_dir=tmp_path,
+            timeout=5.0,
+            chunk_size=16,
+            min_bytes_per_second=10_000,
+            retry_policy=RetryPolicy(max_attempts=1),
+        )
+    finally:
+        for server in (slow_mirror, slow_origin):
+            server.shutdown()
+            server.server_close()
+
+    assert saved.read_bytes() == payload
+
+
+def test_download_asset_restarts_on_a_mirror_serving_a_different_file_version(tmp_path, monkeypatch) -> None:
+    import kookie.assets as assets
+
+    monkeypatch.setattr(assets, "THROUGHPUT_WINDOW_SECONDS", 0.2)
+    payload = bytes(range(256)) * 4
+    trickle = _serve_asset(payload, advertise_ranges=False, honor_ranges=False, trickle=True, etag='"a"')
+    other = _serve_asset(payload, advertise_ranges=True, honor_ranges=True, probe_delay=0.1, etag='"b"')
+    spec = AssetSpec(
+        name="model",
+        filename="model.onnx",
+        url=f"http://127.0.0.1:{other.server_address[1]}/model.onnx",
+        mirrors=(f"http://127.0.0.1:{trickle.server_address[1]}/model.onnx",),
+    )
+    try:
+        saved = download_asset(
+            spec,
+            target_dir=tmp_path,
+            timeout=5.0,
+            chunk_size=64,
+            connections=1,
+            min_bytes_per_second=10_000,
+            retry_policy=RetryPolicy(max_attempts=1),
+        )
+    finally:
+        for server in (trickle, other):
+            server.shutdown()
+            server.server_close()
+
+    assert saved.read_bytes() == payload
+    # Without a checksum and with a different ETag, no byte of the first mirror is kept.
+    assert [value for value in other.seen_ranges if value not in (None, "bytes=0-0")] == []
+    assert None in other.seen_ranges
+
+
+def test_throughput_guard_trips_only_after_a_full_window() -> None:
+    from kookie.assets import ThroughputCollapsedError, _ThroughputGuard
+
+    now = [0.0]
+    guard = _ThroughputGuard(1_000, window_seconds=1.0, clock=lambda: now[0])
+    guard.record(10)
+    now[0] = 0.9
+    guard.record(10)
+    now[0] = 1.5
+    guard.record(2_000)
+    now[0] = 2.6
+    with pytest.raises(ThroughputCollapsedError):
+        guard.record(10)
+    assert _ThroughputGuard(0).record(1) is None
+
+
+def test_download_asset_uses_only_local_mirrors_while_offline(tmp_path) -> None:
+    from kookie.network import NetworkProbe
+
+    def _unreachable(*_args, **_kwargs):
+        raise OSError("no route")
+
+    def _urlopen(request, **kwargs):
+        from urllib.request import urlopen
+
+        url = getattr(request, "full_url", request)
+        assert url.startswith("file:"), "remote sources must be skipped while offline"
+        return urlopen(request, **kwargs)
+
+    offline = NetworkProbe(["github.com:443"], connect=_unreachable)
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    (cache / "voices.bin").write_bytes(b"voices")
+    remote_only = AssetSpec(name="model", filename="model.onnx", url="https://example.test/model.onnx")
+    with_local = AssetSpec(
+        name="voices",
+        filename="voices.bin",
+        url="https://example.test/voices.bin",
+        mirrors=(str(cache),),
+    )
+
+    target = tmp_path / "assets"
+
+    with pytest.raises(AssetDownloadError, match="network unavailable"):
+        download_asset(remote_only, target_dir=target, timeout=1.0, urlopen=_urlopen, network_probe=offline)
+    saved = download_asset(with_local, target_dir=target, timeout=1.0, urlopen=_urlopen, network_probe=offline)
+
+    assert saved.read_bytes() == b"voices"
+
+
+def test_download_asset_uses_a_reachable_lan_mirror_when_the_origin_is_not(tmp_path, monkeypatch) -> None:
+    import socket
+
+    from kookie.network import NetworkProbe
+
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "http_proxy", "https_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    payload = b"lan voices"
+    mirror = _serve_asset(payload, advertise_ranges=False, honor_ranges=False)
+    mirror_port = mirror.server_address[1]
+
+    def _connect(endpoint, timeout):
+        if endpoint != ("127.0.0.1", mirror_port):
+            raise OSError("unreachable")
+        return socket.create_connection(endpoint, timeout=timeout)
+
+    spec = AssetSpec(
+        name="voices",
+        filename="voices.bin",
+        url="https://github.invalid/voices.bin",
+        mirrors=(f"http://127.0.0.1:{mirror_port}/voices.bin",),
+    )
+    try:
+        saved = download_asset(
+            spec,
+            target_dir=tmp_path,
+            timeout=2.0,
+            retry_policy=RetryPolicy(max_attempts=1),
+            network_probe=NetworkProbe(connect=_connect),
+        )
+    finally:
+        mirror.shutdown()
+        mirror.server_close()
+
+    assert saved.read_bytes() == payload
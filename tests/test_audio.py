@@ -1,5 +1,6 @@
 import queue
 import threading
+import time
 
 import numpy as np
 
@@ -46,3 +47,41 @@ def test_audio_player_respects_stop_event() -> None:
     player.play_from_queue(audio_queue, stop_event=stop_event)
 
     assert stream.writes == []
+
+
+class _RealtimeStream(_FakeStream):
+    """Blocks in ``write`` for as long as the audio lasts, like a device with a full buffer."""
+
+    def __init__(self, sample_rate: int):
+        super().__init__()
+        self.sample_rate = sample_rate
+        self.aborted = False
+
+    def write(self, data):
+        super().write(data)
+        time.sleep(len(data) / self.sample_rate)
+
+    def abort(self):
+        self.aborted = True
+
+
+def test_audio_player_stops_mid_sentence_between_short_writes() -> None:
+    stream = _RealtimeStream(sample_rate=24000)
+    player = AudioPlayer(sample_rate=24000, stream_factory=lambda **_: stream)
+    audio_queue = queue.Queue()
+    audio_queue.put(np.zeros(24000 * 10, dtype=np.float32))
+    audio_queue.put(None)
+    stop_event = threading.Event()
+
+    worker = threading.Thread(target=player.play_from_queue, args=(audio_queue, stop_event), daemon=True)
+    worker.start()
+    time.sleep(0.2)
+    stopped_at = time.monotonic()
+    stop_event.set()
+    worker.join(timeout=2.0)
+
+    assert not worker.is_alive()
+    assert time.monotonic() - stopped_at < 0.5
+    assert stream.aborted is True
+    assert max(len(write) for write in stream.writes) == 1200
+    assert sum(len(write) for write in stream.writes) < 24000
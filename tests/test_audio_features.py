@@ -6,7 +6,7 @@ import time
 
 import numpy as np
 
-from kookie.audio import AudioPlayer
+from kookie.audio import AdaptiveBufferPolicy, AudioPlayer
 
 
 class _FakeStream:
@@ -87,3 +87,78 @@ def test_audio_player_waits_while_paused() -> None:
     pause_event.clear()
     worker.join(timeout=1.0)
     assert len(stream.writes) == 1
+
+
+def test_audio_player_reports_each_underrun_once() -> None:
+    stream = _FakeStream()
+    player = AudioPlayer(sample_rate=24_000, stream_factory=lambda **_: stream)
+    audio_queue = queue.Queue()
+    underruns: list[int] = []
+
+    def _feed() -> None:
+        audio_queue.put(np.zeros(4, dtype=np.float32))
+        time.sleep(0.35)
+        audio_queue.put(np.zeros(4, dtype=np.float32))
+        time.sleep(0.25)
+        audio_queue.put(None)
+
+    feeder = threading.Thread(target=_feed)
+    feeder.start()
+    player.play_from_queue(audio_queue, stop_event=threading.Event(), on_underrun=lambda: underruns.append(1))
+    feeder.join()
+
+    assert len(stream.writes) == 2
+    assert len(underruns) == 2
+
+
+def test_adaptive_buffer_policy_targets_synthesis_deficit_and_grows_on_underrun() -> None:
+    policy = AdaptiveBufferPolicy(max_seconds=8.0, horizon_seconds=30.0, underrun_growth_seconds=0.5)
+    assert policy.target_seconds() == 0.0
+
+    policy.record_synthesis(audio_seconds=2.0, wall_seconds=1.0)
+    assert policy.target_seconds(10.0) == 0.0
+
+    slow = AdaptiveBufferPolicy(max_seconds=8.0, horizon_seconds=30.0, underrun_growth_seconds=0.5)
+    slow.record_synthesis(audio_seconds=0.8, wall_seconds=1.0)
+    assert abs(slow.target_seconds(10.0) - 2.0) < 1e-9
+    assert abs(slow.target_seconds() - 6.0) < 1e-9
+    slow.record_underrun()
+    assert abs(slow.target_seconds(10.0) - 2.5) < 1e-9
+    assert abs(slow.target_seconds(1_000.0) - 6.5) < 1e-9
+
+    slow.record_synthesis(audio_seconds=0.1, wall_seconds=1.0)
+    assert slow.target_seconds() == 8.0
+
+
+def test_audio_player_prebuffers_before_first_write_and_tracks_underruns() -> None:
+    stream = _FakeStream()
+    player = AudioPlayer(sample_rate=100, stream_factory=lambda **_: stream)
+    audio_queue = queue.Queue()
+    timeline: list[tuple[float, int]] = []
+    started = time.monotonic()
+
+    def _feed() -> None:
+        for _ in range(3):
+            audio_queue.put(np.zeros(10, dtype=np.float32))
+            time.sleep(0.05)
+        time.sleep(0.3)
+        audio_queue.put(np.zeros(10, dtype=np.float32))
+        audio_queue.put(None)
+
+    feeder = threading.Thread(target=_feed)
+    feeder.start()
+    player.play_from_queue(
+        audio_queue,
+        stop_event=threading.Event(),
+        on_progress=lambda samples: timeline.append((time.monotonic() - started, samples)),
+        prebuffer_samples=lambda: 30,
+    )
+    feeder.join()
+
+    assert len(stream.writes) == 4
+    # Playback waited until three chunks (30 samples) were buffered.
+    assert timeline[0][0] >= 0.09
+    stats = player.underruns.snapshot()
+    assert stats["count"] == 1
+    assert stats["starved_seconds"] > 0
+    assert len(stats["recent"]) == 1
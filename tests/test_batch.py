@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from kookie import batch
+from kookie.app import create_app
+from kookie.audio import NullAudioPlayer
+from kookie.batch import collect_sources, run_batch
+from kookie.config import AppConfig
+from kookie.document import DocumentModel
+from kookie.pdf_import import PdfImportResult
+
+
+def _runtime(tmp_path: Path):
+    return create_app(AppConfig(backend_mode="mock", asset_dir=tmp_path / "assets"), ensure_download=False)
+
+
+def test_collect_sources_expands_directories_and_globs(tmp_path: Path) -> None:
+    (tmp_path / "docs" / "nested").mkdir(parents=True)
+    (tmp_path / "docs" / "a.txt").write_text("A.", encoding="utf-8")
+    (tmp_path / "docs" / "nested" / "b.pdf").write_bytes(b"%PDF")
+    (tmp_path / "docs" / "ignored.md").write_text("no", encoding="utf-8")
+    (tmp_path / "c.txt").write_text("C.", encoding="utf-8")
+
+    sources = collect_sources([str(tmp_path / "docs"), str(tmp_path / "*.txt"), str(tmp_path / "docs" / "a.txt")])
+
+    assert sources == [
+        tmp_path / "docs" / "a.txt",
+        tmp_path / "docs" / "nested" / "b.pdf",
+        tmp_path / "c.txt",
+    ]
+
+
+def test_run_batch_converts_text_and_pdf_and_skips_up_to_date_outputs(tmp_path: Path) -> None:
+    text_source = tmp_path / "notes.txt"
+    text_source.write_text("First sentence. Second sentence.", encoding="utf-8")
+    pdf_source = tmp_path / "paper.pdf"
+    pdf_source.write_bytes(b"%PDF")
+    out_dir = tmp_path / "out"
+
+    def _pdf_loader(path: Path) -> PdfImportResult:
+        document = DocumentModel.from_pages([(1, "Page one."), (2, "Page two.")])
+        return PdfImportResult(text=document.buffer, pages_loaded=[1, 2], document=document)
+
+    runtime = _runtime(tmp_path)
+    try:
+        summary = run_batch(
+            [text_source, pdf_source],
+            runtime=runtime,
+            format="wav",
+            output_dir=out_dir,
+            workers=2,
+            pdf_loader=_pdf_loader,
+        )
+        assert [item.status for item in summary.items] == ["converted", "converted"]
+        assert (out_dir / "notes.wav").exists()
+        assert (out_dir / "paper.wav").exists()
+        report = summary.to_dict()
+        assert report["converted"] == 2
+        assert report["audio_seconds"] > 0
+        json.dumps(report)
+
+        rerun = run_batch(
+            [text_source, pdf_source],
+            runtime=runtime,
+            format="wav",
+            output_dir=out_dir,
+            pdf_loader=_pdf_loader,
+        )
+        assert [item.status for item in rerun.items] == ["skipped", "skipped"]
+
+        stamp = (out_dir / "notes.wav").stat().st_mtime + 10
+        os.utime(text_source, (stamp, stamp))
+        refreshed = run_batch([text_source], runtime=runtime, format="wav", output_dir=out_dir)
+        assert refreshed.items[0].status == "converted"
+    finally:
+        runtime.shutdown()
+
+
+def test_run_batch_mirrors_subdirectories_and_reports_collisions(tmp_path: Path) -> None:
+    (tmp_path / "src" / "a").mkdir(parents=True)
+    (tmp_path / "src" / "b").mkdir(parents=True)
+    first = tmp_path / "src" / "a" / "intro.txt"
+    second = tmp_path / "src" / "b" / "intro.txt"
+    clash = tmp_path / "src" / "b" / "intro.pdf"
+    for source in (first, second):
+        source.write_text("Hello there.", encoding="utf-8")
+    clash.write_bytes(b"%PDF")
+    out_dir = tmp_path / "out"
+
+    runtime = _runtime(tmp_path)
+    try:
+        summary = run_batch([first, second, clash], runtime=runtime, format="wav", output_dir=out_dir)
+    finally:
+        runtime.shutdown()
+
+    assert [item.status for item in summary.items] == ["converted", "converted", "failed"]
+    assert "collides with" in summary.items[2].error
+    assert (out_dir / "a" / "intro.wav").exists()
+    assert (out_dir / "b" / "intro.wav").exists()
+
+
+def test_run_batch_leaves_no_partial_output_when_a_conversion_fails(tmp_path: Path, monkeypatch) -> None:
+    source = tmp_path / "notes.txt"
+    source.write_text("Hello there.", encoding="utf-8")
+
+    def _interrupted(*, output_path: Path, **kwargs) -> Path:
+        output_path.write_bytes(b"half")
+        raise RuntimeError("killed")
+
+    monkeypatch.setattr(batch, "save_speech_to_audio", _interrupted)
+    runtime = _runtime(tmp_path)
+    try:
+        summary = run_batch([source], runtime=runtime, format="wav")
+    finally:
+        runtime.shutdown()
+
+    assert summary.items[0].status == "failed"
+    assert sorted(item.name for item in tmp_path.iterdir()) == ["assets", "notes.txt"]
+
+
+def test_batch_main_writes_summary_and_reports_failures(tmp_path: Path, monkeypatch) -> None:
+    good = tmp_path / "good.txt"
+    good.write_text("Hello there.", encoding="utf-8")
+    empty = tmp_path / "empty.txt"
+    empty.write_text("   ", encoding="utf-8")
+    summary_path = tmp_path / "summary.json"
+    monkeypatch.setattr(
+        batch,
+        "load_config",
+        lambda: AppConfig(backend_mode="mock", asset_dir=tmp_path / "assets"),
+    )
+
+    runtimes = []
+
+    def _create_app(*args, **kwargs):
+        runtimes.append(create_app(*args, **kwargs))
+        return runtimes[-1]
+
+    monkeypatch.setattr(batch, "create_app", _create_app)
+
+    exit_code = batch.main([str(tmp_path / "*.txt"), "--format", "wav", "--summary", str(summary_path)])
+
+    assert isinstance(runtimes[0].controller.audio_player, NullAudioPlayer)
+    report = json.loads(summary_path.read_text(encoding="utf-8"))
+    assert exit_code == 1
+    assert report["converted"] == 1
+    assert report["failed"] == 1
+    assert (tmp_path / "good.wav").exists()
@@ -29,6 +29,7 @@ language = "es"
     assert cfg.default_voice == "af_nicole"
     assert cfg.telemetry_enabled is True
     assert cfg.language == "es"
+    assert cfg.network_probe_endpoints == ()
 
 
 def test_env_overrides_toml_values(monkeypatch, tmp_path: Path) -> None:
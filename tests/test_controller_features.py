@@ -5,6 +5,7 @@ import time
 import numpy as np
 
 from kookie.controller import PlaybackController, PlaybackState
+from kookie.monitoring import MetricsStore
 
 
 class _BackendSlow:
@@ -81,3 +82,252 @@ def test_playback_controller_volume_seek_and_progress() -> None:
     progress = controller.progress
     assert progress["played_samples"] >= 0
     assert progress["synthesized_samples"] >= progress["played_samples"]
+
+
+def test_playback_controller_streams_text_fed_after_start() -> None:
+    player = _AudioPlayer()
+    written: list[int] = []
+    controller = PlaybackController(backend=_BackendSlow(), audio_player=player)
+    controller._on_audio_progress = written.append  # type: ignore[method-assign]
+
+    assert controller.start_stream() is True
+    assert controller.is_streaming is True
+    assert controller.start("blocked") is False
+
+    assert controller.feed_text("Page one. Still page one.") is True
+    deadline = time.time() + 2.0
+    while time.time() < deadline and len(written) < 2:
+        time.sleep(0.01)
+    assert len(written) == 2
+
+    assert controller.feed_text("Page two.") is True
+    controller.finish_stream()
+    assert controller.feed_text("too late") is False
+    controller.wait_until_idle(timeout=2.0)
+
+    assert len(written) == 3
+    assert controller.state is PlaybackState.IDLE
+
+
+def test_playback_controller_records_latency_metrics() -> None:
+    metrics = MetricsStore()
+    controller = PlaybackController(backend=_BackendSlow(), audio_player=_AudioPlayer(), metrics=metrics)
+
+    assert controller.start("one. two. three.") is True
+    controller.wait_until_idle(timeout=2.0)
+
+    histograms = metrics.histograms()
+    assert histograms["time_to_first_audio_seconds"].count == 1
+    assert histograms["sentence_inference_seconds"].count == 3
+    assert histograms["synthesis_realtime_factor"].count == 1
+    assert "audio_queue_depth" in metrics.gauges()
+
+
+def test_sentence_inference_time_excludes_waits_on_the_sentence_feed() -> None:
+    metrics = MetricsStore()
+    controller = PlaybackController(backend=_BackendSlow(), audio_player=_AudioPlayer(), metrics=metrics)
+
+    assert controller.start_stream() is True
+    for page in ("Page one.", "Page two.", "Page three."):
+        assert controller.feed_text(page) is True
+        time.sleep(0.3)
+    controller.finish_stream()
+    controller.wait_until_idle(timeout=2.0)
+
+    histogram = metrics.histograms()["sentence_inference_seconds"]
+    assert histogram.count == 3
+    # Each sentence takes ~0.02 s in the backend; the 0.3 s gaps between pages are feed waits, not inference.
+    assert histogram.total < 0.3
+
+
+def test_playback_controller_maps_playback_position_to_sentence_spans() -> None:
+    text = "First one. Second two. Third."
+    spoken: list[tuple[int, int, int]] = []
+
+    class _RecordingPlayer(_AudioPlayer):
+        def play_from_queue(self, audio_queue, stop_event, pause_event=None, on_progress=None, **_ignored):
+            def _progress(samples: int) -> None:
+                current = controller.spoken_sentence
+                assert current is not None
+                spoken.append((current.index, current.text_start, current.text_end))
+                on_progress(samples)
+
+            super().play_from_queue(audio_queue, stop_event, pause_event=pause_event, on_progress=_progress)
+
+    controller = PlaybackController(backend=_BackendSlow(), audio_player=_RecordingPlayer())
+    assert controller.spoken_sentence is None
+    assert controller.start(text, text_offset=100) is True
+    controller.wait_until_idle(timeout=2.0)
+
+    assert [(index, text[start - 100 : end - 100]) for index, start, end in spoken] == [
+        (0, "First one."),
+        (1, "Second two."),
+        (2, "Third."),
+    ]
+
+
+def test_playback_controller_stop_cancels_in_flight_inference() -> None:
+    import threading
+
+    class _CancellableBackend:
+        def __init__(self):
+            self.cancelled: list[object] = []
+            self.started = threading.Event()
+
+        def synthesize_sentences(self, sentences, voice, speed=1.0, cancel_event=None):
+            del voice, speed
+            for _sentence in sentences:
+                self.started.set()
+                # Stands in for an inference call that only returns once terminated.
+                assert cancel_event is not None and cancel_event.wait(2.0)
+                return
+                yield
+
+        def cancel(self, cancel_event):
+            self.cancelled.append(cancel_event)
+
+    backend = _CancellableBackend()
+    controller = PlaybackController(backend=backend, audio_player=_AudioPlayer())
+    assert controller.start("A long sentence that takes a while.") is True
+    assert backend.started.wait(2.0)
+
+    started = time.monotonic()
+    assert controller.stop() is True
+    controller.wait_until_idle(timeout=2.0)
+
+    assert time.monotonic() - started < 1.0
+    assert controller.state is PlaybackState.IDLE
+    assert len(backend.cancelled) == 1 and backend.cancelled[0].is_set()
+
+
+class _RecordingBackend:
+    def __init__(self):
+        self.synthesized: list[str] = []
+
+    def synthesize_sentences(self, sentences, voice, speed=1.0):
+        del voice, speed
+        for sentence in sentences:
+            self.synthesized.append(sentence)
+            yield np.full(4, float(len(sentence)), dtype=np.float32)
+
+
+class _CollectingPlayer:
+    def __init__(self):
+        self.chunks: list[float] = []
+
+    def play_from_queue(self, audio_queue, stop_event):
+        while not stop_event.is_set():
+            chunk = audio_queue.get(timeout=1.0)
+            if chunk is None:
+                return
+            self.chunks.append(float(chunk[0]))
+
+
+def test_playback_controller_restart_reuses_audio_of_unchanged_sentences() -> None:
+    backend = _RecordingBackend()
+    player = _CollectingPlayer()
+    metrics = MetricsStore()
+    controller = PlaybackController(
+        backend=backend,
+        audio_player=player,
+        chunker=lambda text: text.split("|"),
+        metrics=metrics,
+    )
+
+    assert controller.start("a|bb|ccc|dddd") is True
+    controller.wait_until_idle(timeout=2.0)
+    player.chunks.clear()
+    backend.synthesized.clear()
+
+    assert controller.restart("a|bb|xxxxxxx|dddd") is True
+    controller.wait_until_idle(timeout=2.0)
+
+    assert backend.synthesized == ["xxxxxxx"]
+    assert player.chunks == [1.0, 2.0, 7.0, 4.0]
+    assert metrics.snapshot()["sentences_reused"] == 3
+    spans = [controller._timeline.entry(index) for index in range(len(controller._timeline))]
+    assert [(entry.text_start, entry.text_end) for entry in spans] == [(0, 1), (2, 4), (5, 12), (13, 17)]
+
+
+class _LingeringPlayer(_CollectingPlayer):
+    """Holds its first session until stopped, then takes ``linger`` seconds to let go, like a draining device."""
+
+    def __init__(self, linger: float):
+        super().__init__()
+        self.linger = linger
+        self.sessions = 0
+
+    def play_from_queue(self, audio_queue, stop_event):
+        self.sessions += 1
+        if self.sessions > 1:
+            return super().play_from_queue(audio_queue, stop_event)
+        stop_event.wait(timeout=2.0)
+        time.sleep(self.linger)
+
+
+def test_playback_controller_restart_mid_session_queues_behind_it_and_synthesizes_only_the_edit() -> None:
+    backend = _RecordingBackend()
+    player = _LingeringPlayer(linger=0.3)
+    controller = PlaybackController(backend=backend, audio_player=player, chunker=lambda text: text.split("|"))
+
+    assert controller.start("a|bb|ccc|dddd") is True
+    deadline = time.monotonic() + 2.0
+    while time.monotonic() < deadline and controller.progress["synthesized_samples"] < 16:
+        time.sleep(0.005)
+    backend.synthesized.clear()
+
+    started = time.monotonic()
+    assert controller.restart("a|bb|xxxxxxx|dddd") is True
+    assert time.monotonic() - started < 0.2
+    assert controller.start("other") is False
+    controller.wait_until_idle(timeout=2.0)
+
+    assert player.sessions == 2
+    assert backend.synthesized == ["xxxxxxx"]
+    assert not {"a", "bb", "dddd"} & set(backend.synthesized)
+    assert player.chunks == [1.0, 2.0, 7.0, 4.0]
+    assert controller.state is PlaybackState.IDLE
+
+
+def test_playback_controller_stop_cancels_a_queued_restart() -> None:
+    backend = _RecordingBackend()
+    player = _LingeringPlayer(linger=0.1)
+    events: list[tuple[str, PlaybackState]] = []
+    controller = PlaybackController(
+        backend=backend,
+        audio_player=player,
+        chunker=lambda text: text.split("|"),
+        on_event=lambda event: events.append((event.kind, event.state)),
+    )
+
+    assert controller.start("a|bb") is True
+    assert controller.restart("a|cc") is True
+    assert controller.stop() is True
+    controller.wait_until_idle(timeout=2.0)
+
+    # The idle event is emitted just after the state flips, so give it a moment to arrive.
+    deadline = time.monotonic() + 1.0
+    while time.monotonic() < deadline and events[-1] != ("state", PlaybackState.IDLE):
+        time.sleep(0.005)
+    assert player.sessions == 1
+    assert controller.state is PlaybackState.IDLE
+    assert events[-1] == ("state", PlaybackState.IDLE)
+
+
+def test_playback_controller_reuse_cache_respects_voice_and_size_limit() -> None:
+    backend = _RecordingBackend()
+    controller = PlaybackController(
+        backend=backend,
+        audio_player=_CollectingPlayer(),
+        chunker=lambda text: text.split("|"),
+        reuse_cache_seconds=8 / 24_000,
+    )
+
+    assert controller.start("a|bb|ccc") is True
+    controller.wait_until_idle(timeout=2.0)
+    assert controller.restart("a|bb|ccc") is True
+    controller.wait_until_idle(timeout=2.0)
+    assert controller.restart("a|bb|ccc", voice="af_nicole") is True
+    controller.wait_until_idle(timeout=2.0)
+
+    assert backend.synthesized == ["a", "bb", "ccc", "ccc", "a", "bb", "ccc"]
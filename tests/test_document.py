@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pytest
+
+from kookie.document import DocumentModel
+
+
+def _document() -> DocumentModel:
+    return DocumentModel.from_pages(
+        [
+            (2, "Intro one. Intro two."),
+            (3, "Middle page."),
+            (5, "Last one. Last two. Last three."),
+        ]
+    )
+
+
+def test_document_model_indexes_pages_in_shared_buffer() -> None:
+    document = _document()
+
+    assert document.buffer == "Intro one. Intro two.\n\nMiddle page.\n\nLast one. Last two. Last three."
+    assert document.page_count == 3
+    assert document.page_text(3) == "Middle page."
+    start, end = document.page_span(5)
+    assert document.buffer[start:end] == "Last one. Last two. Last three."
+    assert document.page_at_offset(start) == 5
+    assert document.page_at_offset(start - 1) == 3
+
+
+def test_document_model_maps_pages_to_sentence_ranges() -> None:
+    document = _document()
+
+    assert document.sentence_range(2) == range(0, 2)
+    assert document.sentence_range(5) == range(3, 6)
+    assert document.sentences_from_page(3) == ["Middle page.", "Last one.", "Last two.", "Last three."]
+    assert document.sentences_for_pages(2, 3) == ["Intro one.", "Intro two.", "Middle page."]
+    assert document.text_for_pages(3, 5) == "Middle page.\n\nLast one. Last two. Last three."
+    assert document.page_for_sentence(4) == 5
+
+
+def test_document_model_rejects_unknown_pages_and_reversed_ranges() -> None:
+    document = _document()
+
+    assert document.has_page(4) is False
+    with pytest.raises(ValueError, match="Page 4 is not loaded"):
+        document.page_text(4)
+    with pytest.raises(ValueError, match="document order"):
+        document.sentences_for_pages(5, 2)
+
+
+def test_document_model_groups_sentences_by_page() -> None:
+    document = _document()
+
+    assert document.page_sentences() == [
+        ["Intro one.", "Intro two."],
+        ["Middle page."],
+        ["Last one.", "Last two.", "Last three."],
+    ]
+    assert document.page_sentences(3, 5) == [["Middle page."], ["Last one.", "Last two.", "Last three."]]
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from kookie.events import EventDispatcher
+
+
+def test_event_dispatcher_delivers_on_its_own_thread_in_order() -> None:
+    delivered: list[tuple[int, str]] = []
+    dispatcher = EventDispatcher(lambda event: delivered.append((event, threading.current_thread().name)))
+
+    for value in range(5):
+        dispatcher.emit(value)
+
+    assert dispatcher.flush(timeout=2.0)
+    assert [value for value, _ in delivered] == [0, 1, 2, 3, 4]
+    assert {name for _, name in delivered} == {"kookie-events"}
+    dispatcher.close()
+
+
+def test_event_dispatcher_emit_does_not_wait_for_a_slow_handler() -> None:
+    release = threading.Event()
+    delivered: list[str] = []
+
+    def _handler(event: str) -> None:
+        release.wait(2.0)
+        delivered.append(event)
+
+    dispatcher = EventDispatcher(_handler)
+    started = time.monotonic()
+    for event in ("a", "b", "c"):
+        dispatcher.emit(event)
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert elapsed < 0.5
+    assert dispatcher.flush(timeout=2.0)
+    assert delivered == ["a", "b", "c"]
+    dispatcher.close()
+
+
+def test_event_dispatcher_coalesces_repeats_and_bounds_the_queue() -> None:
+    release = threading.Event()
+    delivered: list[tuple[str, int]] = []
+
+    def _handler(event: tuple[str, int]) -> None:
+        release.wait(2.0)
+        delivered.append(event)
+
+    dispatcher = EventDispatcher(
+        _handler,
+        coalesce_key=lambda event: None if event[0] == "error" else event[0],
+        max_pending=3,
+    )
+    dispatcher.emit(("busy", 0))
+    while not dispatcher._delivering:
+        time.sleep(0.001)
+    for index in range(1, 4):
+        dispatcher.emit(("progress", index))
+    dispatcher.emit(("state", 4))
+    dispatcher.emit(("error", 5))
+    dispatcher.emit(("error", 6))
+    release.set()
+
+    assert dispatcher.flush(timeout=2.0)
+    assert delivered == [("busy", 0), ("state", 4), ("error", 5), ("error", 6)]
+    assert dispatcher.dropped == 1
+    dispatcher.close()
+
+
+def test_event_dispatcher_never_drops_keyless_or_undroppable_events() -> None:
+    release = threading.Event()
+    delivered: list[tuple[str, int]] = []
+
+    def _handler(event: tuple[str, int]) -> None:
+        release.wait(2.0)
+        delivered.append(event)
+
+    dispatcher = EventDispatcher(
+        _handler,
+        coalesce_key=lambda event: None if event[0] == "error" else event[0],
+        droppable=lambda event: event[0] == "progress",
+        max_pending=2,
+    )
+    dispatcher.emit(("busy", 0))
+    while not dispatcher._delivering:
+        time.sleep(0.001)
+    dispatcher.emit(("state", 1))
+    dispatcher.emit(("error", 2))
+    dispatcher.emit(("error", 3))
+    dispatcher.emit(("progress", 4))
+    dispatcher.emit(("idle", 5))
+    release.set()
+
+    assert dispatcher.flush(timeout=2.0)
+    assert delivered == [("busy", 0), ("state", 1), ("error", 2), ("error", 3), ("idle", 5)]
+    assert dispatcher.dropped == 1
+    dispatcher.close()
+
+
+def test_event_dispatcher_survives_handler_errors_and_ignores_events_after_close() -> None:
+    delivered: list[int] = []
+
+    def _handler(event: int) -> None:
+        if event == 1:
+            raise RuntimeError("boom")
+        delivered.append(event)
+
+    dispatcher = EventDispatcher(_handler)
+    for value in range(3):
+        dispatcher.emit(value)
+    dispatcher.close()
+    dispatcher.emit(3)
+
+    assert delivered == [0, 2]
@@ -182,3 +182,193 @@ def test_save_speech_to_audio_supports_wav_export(tmp_path: Path) -> None:
     assert saved_path == output_path
     assert output_path.exists()
     assert output_path.read_bytes().startswith(b"RIFF")
+
+
+class _SegmentBackend:
+    def synthesize_sentences(self, sentences, voice):
+        for sentence in sentences:
+            yield np.full(len(sentence), 0.1, dtype=np.float32)
+
+
+def test_partition_sentences_groups_by_estimated_duration() -> None:
+    from kookie.export import partition_sentences
+
+    segments = partition_sentences(["a" * 10, "b" * 10, "c" * 10], segment_minutes=1 / 60, chars_per_second=20)
+
+    assert segments == [["a" * 10, "b" * 10], ["c" * 10]]
+    with pytest.raises(ValueError):
+        partition_sentences(["a"], segment_minutes=0)
+
+
+def test_partition_pages_breaks_segments_between_pages() -> None:
+    from kookie.export import partition_pages
+
+    pages = [["a" * 5, "b" * 5], ["c" * 5], ["d" * 10, "e" * 10, "f" * 10], ["g" * 5]]
+    segments = partition_pages(pages, segment_minutes=1 / 60, chars_per_second=20)
+
+    assert segments == [["a" * 5, "b" * 5, "c" * 5], ["d" * 10, "e" * 10], ["f" * 10], ["g" * 5]]
+
+
+def test_save_speech_segmented_joins_wav_segments_without_reencoding(tmp_path: Path) -> None:
+    import wave
+
+    from kookie.export import save_speech_segmented
+
+    output_path = tmp_path / "book.wav"
+    saved = save_speech_segmented(
+        backend=_SegmentBackend(),
+        segments=[["one", "two"], ["three"], ["four"]],
+        voice="af_sarah",
+        sample_rate=24_000,
+        output_path=output_path,
+        format="wav",
+        max_workers=3,
+    )
+
+    assert saved == output_path
+    with wave.open(str(output_path), "rb") as wav_file:
+        assert wav_file.getnframes() == len("onetwothreefour")
+        assert wav_file.getframerate() == 24_000
+    assert sorted(item.name for item in tmp_path.iterdir()) == ["book.wav"]
+
+
+def test_save_speech_segmented_caps_workers_at_backend_sessions(tmp_path: Path) -> None:
+    import threading
+    import time
+
+    from kookie.export import save_speech_segmented
+
+    class _TrackingBackend(_SegmentBackend):
+        max_concurrent_sessions = 2
+
+        def __init__(self) -> None:
+            self.active = 0
+            self.peak = 0
+            self.lock = threading.Lock()
+
+        def synthesize_sentences(self, sentences, voice):
+            with self.lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(0.02)
+            yield from super().synthesize_sentences(sentences, voice)
+            with self.lock:
+                self.active -= 1
+
+    backend = _TrackingBackend()
+    save_speech_segmented(
+        backend=backend,
+        segments=[["one"], ["two"], ["three"], ["four"], ["five"]],
+        voice="af_sarah",
+        sample_rate=24_000,
+        output_path=tmp_path / "book.wav",
+        format="wav",
+        max_workers=8,
+    )
+
+    assert 1 <= backend.peak <= 2
+
+
+def test_save_speech_segmented_concatenates_mp3_segments_with_concat_demuxer(tmp_path: Path, monkeypatch) -> None:
+    from kookie.export import save_speech_segmented
+
+    monkeypatch.setenv("KOOKIE_FFMPEG_PATH", "/opt/ffmpeg")
+    encoded: list[Path] = []
+    captured: dict[str, object] = {}
+
+    def _encoder(audio: np.ndarray, sample_rate: int, path: Path) -> None:
+        encoded.append(path)
+        path.write_bytes(b"mp3")
+
+    class _Completed:
+        returncode = 0
+        stderr = b""
+
+    def _runner(command, **kwargs):
+        captured["command"] = command
+        captured["list"] = Path(command[command.index("-i") + 1]).read_text(encoding="utf-8")
+        Path(command[-1]).write_bytes(b"joined")
+        return _Completed()
+
+    output_path = tmp_path / "book.mp3"
+    save_speech_segmented(
+        backend=_SegmentBackend(),
+        segments=[["one"], ["two"]],
+        voice="af_sarah",
+        sample_rate=24_000,
+        output_path=output_path,
+        encoder=_encoder,
+        runner=_runner,
+    )
+
+    command = captured["command"]
+    assert command[:7] == ["/opt/ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i"]
+    assert command[-3:] == ["-c", "copy", str(output_path)]
+    assert captured["list"].splitlines() == [f"file '{path.resolve()}'" for path in sorted(encoded)]
+    assert output_path.read_bytes() == b"joined"
+
+
+def test_save_speech_to_targets_synthesizes_once_for_all_outputs(tmp_path: Path, monkeypatch) -> None:
+    import wave
+
+    from kookie.export import ExportTarget, save_speech_to_targets
+
+    monkeypatch.setenv("KOOKIE_FFMPEG_PATH", "/opt/ffmpeg")
+    backend = _Backend()
+    captured: dict[str, object] = {}
+
+    class _Completed:
+        returncode = 0
+        stderr = b""
+
+    def _runner(command, **kwargs):
+        captured["command"] = command
+        captured["payload"] = kwargs["input"]
+        return _Completed()
+
+    targets = [
+        ExportTarget(output_path=tmp_path / "high.mp3", quality=0),
+        ExportTarget(output_path=tmp_path / "low.mp3", quality=7),
+        ExportTarget(output_path=tmp_path / "master.wav", format="wav"),
+    ]
+    outputs = save_speech_to_targets(
+        backend=backend,
+        text="one. two.",
+        voice="af_sarah",
+        sample_rate=24_000,
+        targets=targets,
+        runner=_runner,
+    )
+
+    assert outputs == [target.output_path for target in targets]
+    assert len(backend.calls) == 1
+    command = captured["command"]
+    assert command.count("-i") == 1
+    assert command[-8:] == [
+        "-vn",
+        "-q:a",
+        "0",
+        str(tmp_path / "high.mp3"),
+        "-vn",
+        "-q:a",
+        "7",
+        str(tmp_path / "low.mp3"),
+    ]
+    assert len(captured["payload"]) == 4 * 4
+    with wave.open(str(tmp_path / "master.wav"), "rb") as wav_file:
+        assert wav_file.getnframes() == 4
+
+
+def test_save_speech_to_targets_rejects_unknown_formats_before_synthesis(tmp_path: Path) -> None:
+    from kookie.export import ExportTarget, save_speech_to_targets
+
+    backend = _Backend()
+    with pytest.raises(ValueError, match="Unsupported export format: ogg"):
+        save_speech_to_targets(
+            backend=backend,
+            text="one.",
+            voice="af_sarah",
+            sample_rate=24_000,
+            targets=[ExportTarget(output_path=tmp_path / "x.ogg", format="ogg")],
+        )
+    assert backend.calls == []
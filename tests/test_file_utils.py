@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import os
+import stat
+
+import pytest
+
+from kookie import file_utils
+from kookie.file_utils import apply_default_permissions
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="procfs umask")
+def test_process_umask_is_read_without_changing_it(monkeypatch) -> None:
+    mask = os.umask(0o022)
+    os.umask(mask)
+
+    def _forbidden(_mask: int) -> int:
+        raise AssertionError("os.umask must not be called while threads may be writing files")
+
+    monkeypatch.setattr(file_utils.os, "umask", _forbidden)
+
+    assert file_utils._process_umask() == mask
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_apply_default_permissions_widens_a_private_temp_file(tmp_path) -> None:
+    path = tmp_path / "state.json"
+    path.write_text("{}", encoding="utf-8")
+    os.chmod(path, 0o600)
+    mask = os.umask(0o022)
+    os.umask(mask)
+
+    apply_default_permissions(path)
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~mask
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from kookie.export import save_speech_to_audio
+from kookie.jobs import ExportJobQueue, ExportJobState
+
+
+class _Backend:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+
+    def synthesize_sentences(self, sentences, voice):
+        for _sentence in sentences:
+            time.sleep(self.delay)
+            yield np.full(10, 0.1, dtype=np.float32)
+
+
+def _export_work(backend, output_path: Path):
+    def _work(context):
+        return save_speech_to_audio(
+            backend=backend,
+            text="one. two. three.",
+            voice="af_sarah",
+            sample_rate=24_000,
+            output_path=output_path,
+            format="wav",
+            progress_callback=context.report_progress,
+            cancel_event=context.cancel_event,
+        )
+
+    return _work
+
+
+def test_export_job_queue_reports_sample_progress(tmp_path: Path) -> None:
+    queue = ExportJobQueue(max_concurrency=2)
+    output_path = tmp_path / "out.wav"
+
+    job_id = queue.submit(_export_work(_Backend(), output_path), output_path=output_path)
+    job = queue.wait(job_id, timeout=2.0)
+
+    assert job is not None
+    assert job.state is ExportJobState.COMPLETED
+    assert job.result_path == output_path
+    assert job.synthesized_samples == 30
+    assert job.encoded_samples == 30
+    assert queue.pending_count == 0
+
+
+def test_export_job_queue_caps_concurrency_and_cancels_running_jobs(tmp_path: Path) -> None:
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def _blocking_work(context):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        release.wait(timeout=2.0)
+        with lock:
+            active -= 1
+        return tmp_path / context.job_id
+
+    queue = ExportJobQueue(max_concurrency=1)
+    first = queue.submit(_blocking_work, output_path=tmp_path / "a")
+    second = queue.submit(_blocking_work, output_path=tmp_path / "b")
+    time.sleep(0.05)
+    assert queue.get(second).state is ExportJobState.QUEUED
+    release.set()
+    queue.wait(first, timeout=2.0)
+    queue.wait(second, timeout=2.0)
+    assert peak == 1
+
+    slow_id = queue.submit(_export_work(_Backend(delay=0.05), tmp_path / "slow.wav"), output_path=tmp_path / "slow.wav")
+    deadline = time.time() + 2.0
+    while time.time() < deadline and queue.get(slow_id).state is not ExportJobState.RUNNING:
+        time.sleep(0.01)
+    assert queue.cancel(slow_id) is True
+    job = queue.wait(slow_id, timeout=2.0)
+
+    assert job.state is ExportJobState.CANCELLED
+    assert not (tmp_path / "slow.wav").exists()
+    assert queue.cancel(slow_id) is False
+    queue.shutdown()
+
+
+def test_export_job_queue_keeps_a_bounded_history_of_finished_jobs(tmp_path: Path) -> None:
+    queue = ExportJobQueue(max_concurrency=1, max_history=2)
+
+    job_ids = [queue.submit(lambda context, idx=idx: tmp_path / f"{idx}.wav", output_path=tmp_path) for idx in range(5)]
+    for job_id in job_ids:
+        queue.wait(job_id, timeout=2.0)
+
+    assert [job.job_id for job in queue.jobs()] == job_ids[-2:]
+    assert queue.get(job_ids[0]) is None
+    assert queue._futures == {}
+    assert queue._cancel_events == {}
+
+
+def test_export_job_queue_counts_only_jobs_waiting_to_start(tmp_path: Path) -> None:
+    release = threading.Event()
+    queue = ExportJobQueue(max_concurrency=2)
+
+    def _blocking_work(context):
+        release.wait(timeout=2.0)
+        return tmp_path / "out.wav"
+
+    queue.submit(_blocking_work, output_path=tmp_path)
+    assert queue.waiting_count == 0
+    queue.submit(_blocking_work, output_path=tmp_path)
+    assert queue.waiting_count == 0
+    queue.submit(_blocking_work, output_path=tmp_path)
+    assert queue.waiting_count == 1
+
+    release.set()
+    queue.shutdown(cancel_pending=False)
@@ -24,3 +24,99 @@ def test_kokoro_backend_validate_voice_rejects_unknown_voice() -> None:
 
     with pytest.raises(ValueError, match="Unknown voice"):
         backend.validate_voice("invalid_voice")
+
+
+def test_kokoro_backend_cancel_terminates_only_the_matching_inference() -> None:
+    import queue
+    import threading
+    import time
+
+    from kookie.backends.kokoro import _install_cancellable_session
+
+    class _Session:
+        def run(self, output_names, input_feed, run_options=None):
+            deadline = time.monotonic() + 2.0
+            while not run_options.terminate:
+                if time.monotonic() > deadline:
+                    raise AssertionError("inference was never terminated")
+                time.sleep(0.001)
+            raise RuntimeError("Exiting due to terminate flag")
+
+    class _Engine:
+        voices = {"af_sarah": {}}
+
+        def __init__(self):
+            self.sess = _Session()
+
+        def create(self, text, **_kwargs):
+            return self.sess.run(None, {"text": text}), 24_000
+
+    backend = object.__new__(KokoroSpeechBackend)
+    backend._engine = _Engine()
+    backend._voice_cache = None
+    backend._pool = queue.Queue()
+    backend._pool.put((backend._engine, _install_cancellable_session(backend._engine)))
+    backend._run_options_factory = lambda: SimpleNamespace(terminate=False)
+    backend._inflight = {}
+    backend._inflight_lock = threading.Lock()
+
+    playback_stop = threading.Event()
+    other_stop = threading.Event()
+    outcome: dict[str, object] = {}
+
+    def _synthesize() -> None:
+        try:
+            outcome["chunks"] = list(
+                backend.synthesize_sentences(["First.", "Second."], "af_sarah", cancel_event=playback_stop)
+            )
+        except Exception as exc:  # pragma: no cover - surfaced by the assertion below
+            outcome["error"] = exc
+
+    worker = threading.Thread(target=_synthesize)
+    worker.start()
+    while not backend._inflight:
+        time.sleep(0.001)
+
+    assert backend.cancel(other_stop) == 0
+    playback_stop.set()
+    assert backend.cancel(playback_stop) == 1
+    worker.join(timeout=1.0)
+
+    assert not worker.is_alive()
+    assert outcome == {"chunks": []}
+    assert backend._inflight == {}
+
+
+def test_kokoro_backend_runs_concurrent_callers_on_separate_sessions(monkeypatch) -> None:
+    import threading
+
+    import numpy as np
+
+    barrier = threading.Barrier(2, timeout=2.0)
+    used: list[int] = []
+
+    class _Engine:
+        voices = {"af_sarah": {}}
+
+        def create(self, text, **_kwargs):
+            used.append(id(self))
+            barrier.wait()
+            return np.zeros(4, dtype=np.float32), 24_000
+
+    monkeypatch.setattr(KokoroSpeechBackend, "_configure_espeak_env", lambda self: None)
+    monkeypatch.setattr(KokoroSpeechBackend, "_create_engine", lambda self: _Engine())
+    backend = KokoroSpeechBackend("model.onnx", "voices.bin", sessions=2)
+    assert backend.max_concurrent_sessions == 2
+
+    results: list[int] = []
+    workers = [
+        threading.Thread(target=lambda: results.append(len(list(backend.synthesize_sentences(["Hi."], "af_sarah")))))
+        for _ in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=3.0)
+
+    assert results == [1, 1]
+    assert len(set(used)) == 2
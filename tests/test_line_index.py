@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from kookie.line_index import LineIndex
+from kookie.ui import _document_wrap_width, _uses_virtual_view
+
+
+def test_line_index_maps_offsets_and_positions() -> None:
+    index = LineIndex("alpha\nbeta\n\ngamma")
+
+    assert len(index) == 4
+    assert index.lines(0, 10) == ["alpha", "beta", "", "gamma"]
+    assert index.line_for_offset(0) == 0
+    assert index.line_for_offset(5) == 0
+    assert index.line_for_offset(6) == 1
+    assert index.offset_to_position(8) == (1, 2)
+    assert index.position_to_offset(1, 2) == 8
+    assert index.position_to_offset(1, 99) == index.line_end(1) == 10
+    assert index.position_to_offset(99, 0) == index.line_start(3) == 12
+    assert index.line_for_offset(10_000) == 3
+
+
+def test_line_index_wraps_at_word_boundaries() -> None:
+    text = "the quick brown fox jumps\nsupercalifragilistic"
+    index = LineIndex(text, wrap_width=10)
+
+    assert index.lines(0, len(index)) == ["the quick ", "brown fox ", "jumps", "supercalif", "ragilistic"]
+    line, column = index.offset_to_position(text.index("fox"))
+    assert (line, column) == (1, 6)
+    assert index.position_to_offset(line, column) == text.index("fox")
+    assert index.rewrap(10) is index
+    assert len(index.rewrap(0)) == 2
+
+
+def test_line_index_visible_lines_follow_scroll_position() -> None:
+    index = LineIndex("\n".join(f"line {number}" for number in range(1_000)))
+
+    assert index.visible_lines(0, 100, 20) == range(0, 6)
+    assert index.visible_lines(400, 100, 20, overscan=2) == range(18, 28)
+    assert index.visible_lines(1_000_000, 100, 20) == range(0)
+    assert index.visible_lines(0, 0, 20) == range(0)
+    assert index.scroll_top_for_offset(index.line_start(250), 20) == 5_000
+    assert index.content_height(20) == 20_000
+
+
+def test_line_index_handles_empty_and_trailing_newline() -> None:
+    assert LineIndex("").lines(0, 5) == [""]
+    index = LineIndex("one\n")
+    assert index.lines(0, 5) == ["one", ""]
+    assert index.offset_to_position(4) == (1, 0)
+
+
+def test_line_index_append_matches_a_full_rebuild() -> None:
+    pages = ["the quick brown fox", " jumps over\n\nthe lazy", " dog and keeps running far away\n", "end"]
+    for wrap_width in (0, 10):
+        index = LineIndex(pages[0], wrap_width=wrap_width)
+        for page in pages[1:]:
+            index.append(page)
+        rebuilt = LineIndex("".join(pages), wrap_width=wrap_width)
+
+        assert index.text == rebuilt.text
+        assert index.lines(0, len(index)) == rebuilt.lines(0, len(rebuilt))
+
+
+def test_virtual_view_helpers() -> None:
+    assert _uses_virtual_view("x" * 11, threshold=10) is True
+    assert _uses_virtual_view("x" * 10, threshold=10) is False
+    assert _uses_virtual_view("x" * 1_000, threshold=0) is False
+    assert _document_wrap_width(550, font_size=20, word_wrap=True) == 50
+    assert _document_wrap_width(550, font_size=20, word_wrap=False) == 0
+    assert _document_wrap_width(10, font_size=20, word_wrap=True) == 20
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from kookie.logging_utils import configure_logging, make_crash_hook
+from kookie.logging_utils import configure_logging, make_crash_hook, shutdown_logging
 
 
 def test_configure_logging_creates_log_file(tmp_path: Path) -> None:
@@ -10,11 +10,40 @@ def test_configure_logging_creates_log_file(tmp_path: Path) -> None:
     logger = configure_logging(log_path=log_path)
 
     logger.info("hello")
+    shutdown_logging()
 
     assert log_path.exists()
     assert "hello" in log_path.read_text(encoding="utf-8")
 
 
+def test_configure_logging_rotates_into_gzipped_archives_off_the_calling_thread(tmp_path: Path, monkeypatch) -> None:
+    import gzip
+    import threading
+    from logging.handlers import RotatingFileHandler
+
+    emitting_threads: set[str] = set()
+    original_emit = RotatingFileHandler.emit
+
+    def _emit(self, record):
+        emitting_threads.add(threading.current_thread().name)
+        original_emit(self, record)
+
+    monkeypatch.setattr(RotatingFileHandler, "emit", _emit)
+    log_path = tmp_path / "rotating.log"
+    logger = configure_logging(log_path=log_path, name="kookie.test.rotation", max_bytes=200, backup_count=2)
+
+    for index in range(40):
+        logger.info("line %02d %s", index, "x" * 40)
+    shutdown_logging("kookie.test.rotation")
+
+    archives = sorted(tmp_path.glob("rotating.log.*.gz"))
+    assert [path.name for path in archives] == ["rotating.log.1.gz", "rotating.log.2.gz"]
+    assert "line 39" in log_path.read_text(encoding="utf-8")
+    assert "line" in gzip.decompress(archives[0].read_bytes()).decode("utf-8")
+    assert emitting_threads and threading.current_thread().name not in emitting_threads
+    assert not logger.handlers
+
+
 def test_make_crash_hook_writes_crash_report(tmp_path: Path) -> None:
     crash_dir = tmp_path / "crash"
     hook = make_crash_hook(crash_dir=crash_dir)
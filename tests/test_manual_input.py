@@ -23,3 +23,24 @@ def test_play_requires_text_area_input(tmp_path: Path) -> None:
 
     assert runtime.play() is False
     assert runtime.status_message == "Enter text in the text area."
+
+
+def test_play_from_offset_reads_from_the_cursor(tmp_path: Path, monkeypatch) -> None:
+    runtime = create_app(
+        AppConfig(backend_mode="mock", asset_dir=tmp_path),
+        ensure_download=False,
+        audio_player=_AudioPlayer(),
+    )
+    runtime.set_text("First sentence. Second sentence.")
+    started: dict[str, object] = {}
+    monkeypatch.setattr(
+        runtime.controller,
+        "start",
+        lambda text, voice, **kwargs: started.update(text=text, voice=voice, **kwargs) or True,
+    )
+
+    assert runtime.play_from_offset(16) is True
+    assert started["text"] == "Second sentence."
+    assert started["text_offset"] == 16
+    assert runtime.play_from_offset(len(runtime.text)) is False
+    assert runtime.status_message == "Nothing to play after the cursor."
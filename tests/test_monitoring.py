@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from kookie.monitoring import HealthStatus, MetricsStore
+import json
+import threading
+import time
+from http.client import HTTPConnection
+from http.server import ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+from kookie.monitoring import HealthStatus, MetricsStore, SynthesisService, start_health_server
 
 
 def test_metrics_store_tracks_counters() -> None:
@@ -27,3 +36,209 @@ def test_health_status_serializes_runtime_summary() -> None:
     assert payload["backend"] == "mock"
     assert payload["assets_ready"] is True
     assert payload["details"]["voice"] == "available"
+
+
+class _SlowBackend:
+    def __init__(self, release: threading.Event | None = None) -> None:
+        self.release = release
+
+    def synthesize_sentences(self, sentences, voice, speed=1.0):
+        for _sentence in sentences:
+            if self.release is not None:
+                self.release.wait(timeout=2.0)
+            yield np.full(4, 0.5, dtype=np.float32)
+
+
+def _start(service: SynthesisService) -> ThreadingHTTPServer:
+    return start_health_server(
+        host="127.0.0.1",
+        port=0,
+        health_provider=lambda: HealthStatus(status="ok", backend="mock", assets_ready=True),
+        metrics_store=MetricsStore(),
+        synthesis_service=service,
+    )
+
+
+def _post(connection: HTTPConnection, payload: dict[str, object]):
+    connection.request("POST", "/synthesize", body=json.dumps(payload), headers={"Content-Type": "application/json"})
+    return connection.getresponse()
+
+
+def test_synthesize_streams_chunked_audio_over_keepalive_connection() -> None:
+    server = _start(SynthesisService(_SlowBackend(), sample_rate=24_000))
+    connection = HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+    try:
+        response = _post(connection, {"text": "One. Two.", "format": "pcm"})
+        body = response.read()
+        assert response.status == 200
+        assert response.getheader("Transfer-Encoding") == "chunked"
+        assert response.getheader("X-Kookie-Sample-Rate") == "24000"
+        assert body == (np.full(8, 0.5 * 32767.0).astype("<i2")).tobytes()
+
+        response = _post(connection, {"text": "Again."})
+        wav = response.read()
+        assert response.status == 200
+        assert wav[:4] == b"RIFF" and wav[8:12] == b"WAVE"
+        assert len(wav) == 44 + 8
+
+        connection.request("GET", "/health")
+        assert json.loads(connection.getresponse().read())["status"] == "ok"
+
+        assert _post(connection, {"text": "   "}).status == 400
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_synthesize_rejects_requests_beyond_queue_capacity() -> None:
+    release = threading.Event()
+    service = SynthesisService(_SlowBackend(release), sample_rate=24_000, max_concurrent=1, max_queued=0)
+    server = _start(service)
+    port = server.server_address[1]
+    statuses: list[int] = []
+
+    def _first_request() -> None:
+        connection = HTTPConnection("127.0.0.1", port, timeout=5)
+        response = _post(connection, {"text": "Hold the slot."})
+        response.read()
+        statuses.append(response.status)
+        connection.close()
+
+    worker = threading.Thread(target=_first_request)
+    try:
+        worker.start()
+        deadline = time.time() + 2.0
+        while time.time() < deadline and service._slots.acquire(blocking=False):
+            service._slots.release()
+            time.sleep(0.01)
+
+        connection = HTTPConnection("127.0.0.1", port, timeout=5)
+        rejected = _post(connection, {"text": "Too many."})
+        rejected.read()
+        connection.close()
+        assert rejected.status == 503
+        assert rejected.getheader("Retry-After") == "1"
+    finally:
+        release.set()
+        worker.join(timeout=2.0)
+        server.shutdown()
+        server.server_close()
+    assert statuses == [200]
+
+
+class _StrictVoiceBackend(_SlowBackend):
+    def validate_voice(self, voice: str) -> None:
+        if voice != "af_sarah":
+            raise ValueError(f"Unknown voice: {voice}")
+
+    def synthesize_sentences(self, sentences, voice, speed=1.0):
+        if "boom" in sentences[0]:
+            raise RuntimeError("backend exploded")
+        yield from super().synthesize_sentences(sentences, voice, speed=speed)
+
+
+def _raw_post(port: int, body: bytes, headers: dict[str, str]):
+    connection = HTTPConnection("127.0.0.1", port, timeout=5)
+    connection.putrequest("POST", "/synthesize", skip_accept_encoding=True)
+    for name, value in headers.items():
+        connection.putheader(name, value)
+    connection.endheaders(body)
+    response = connection.getresponse()
+    payload = json.loads(response.read())
+    connection.close()
+    return response.status, payload
+
+
+def test_synthesize_validates_body_length_voice_and_backend_errors_before_streaming() -> None:
+    server = _start(SynthesisService(_StrictVoiceBackend(), sample_rate=24_000))
+    port = server.server_address[1]
+    body = json.dumps({"text": "Hello."}).encode("utf-8")
+    try:
+        assert _raw_post(port, body, {})[0] == 411
+        assert _raw_post(port, body, {"Content-Length": "lots"})[0] == 400
+        assert _raw_post(port, body, {"Content-Length": str(10 * 1024 * 1024)})[0] == 413
+
+        connection = HTTPConnection("127.0.0.1", port, timeout=5)
+        unknown = _post(connection, {"text": "Hello.", "voice": "zz_nobody"})
+        assert unknown.status == 400
+        assert "Unknown voice" in json.loads(unknown.read())["error"]
+        bad_speed = _post(connection, {"text": "Hello.", "speed": None})
+        assert bad_speed.status == 400
+        bad_speed.read()
+        failed = _post(connection, {"text": "boom."})
+        assert failed.status == 500
+        assert json.loads(failed.read())["error"] == "backend exploded"
+        assert _post(connection, {"text": "Hello.", "format": "pcm"}).status == 200
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_metrics_store_renders_prometheus_histograms_and_gauges() -> None:
+    metrics = MetricsStore()
+    metrics.increment("play_started")
+    metrics.set_gauge("audio_queue_depth", 3)
+    metrics.observe("time_to_first_audio_seconds", 0.02)
+    metrics.observe("time_to_first_audio_seconds", 0.3)
+    metrics.observe("time_to_first_audio_seconds", 42.0)
+
+    histogram = metrics.histograms()["time_to_first_audio_seconds"]
+    assert histogram.count == 3
+    text = metrics.to_prometheus()
+
+    assert "# TYPE kookie_play_started_total counter\nkookie_play_started_total 1\n" in text
+    assert "kookie_audio_queue_depth 3.0\n" in text
+    assert "# TYPE kookie_time_to_first_audio_seconds histogram" in text
+    assert 'kookie_time_to_first_audio_seconds_bucket{le="0.025"} 1\n' in text
+    assert 'kookie_time_to_first_audio_seconds_bucket{le="0.5"} 2\n' in text
+    assert 'kookie_time_to_first_audio_seconds_bucket{le="+Inf"} 3\n' in text
+    assert "kookie_time_to_first_audio_seconds_count 3\n" in text
+
+
+def test_metrics_endpoint_negotiates_prometheus_format() -> None:
+    metrics = MetricsStore()
+    metrics.increment("pdf_loaded")
+    server = start_health_server(
+        host="127.0.0.1",
+        port=0,
+        health_provider=lambda: HealthStatus(status="ok", backend="mock", assets_ready=True),
+        metrics_store=metrics,
+    )
+    connection = HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+    try:
+        connection.request("GET", "/metrics")
+        assert json.loads(connection.getresponse().read()) == {"pdf_loaded": 1}
+
+        connection.request("GET", "/metrics?format=prometheus")
+        response = connection.getresponse()
+        assert response.getheader("Content-Type").startswith("text/plain")
+        assert "kookie_pdf_loaded_total 1" in response.read().decode("utf-8")
+
+        connection.request("GET", "/metrics", headers={"Accept": "text/plain"})
+        assert b"# TYPE kookie_pdf_loaded_total counter" in connection.getresponse().read()
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_synthesis_service_parses_and_validates_requests() -> None:
+    service = SynthesisService(_StrictVoiceBackend(), sample_rate=24_000)
+
+    request = service.parse_request(json.dumps({"text": "One. Two.", "speed": 5, "format": "PCM"}).encode("utf-8"))
+    assert request.sentences == ["One.", "Two."]
+    assert request.voice == "af_sarah"
+    assert request.speed == 2.0
+    assert request.format == "pcm"
+    for body, message in (
+        (b"not json", "valid JSON"),
+        (b"[]", "JSON object"),
+        (b'{"text": "Hi.", "format": "ogg"}', "Unsupported format"),
+        (b'{"text": "Hi.", "speed": true}', "speed"),
+        (b'{"text": "Hi.", "voice": "zz_nobody"}', "Unknown voice"),
+        (b'{"text": "  "}', "No text"),
+    ):
+        with pytest.raises(ValueError, match=message):
+            service.parse_request(body)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from kookie.config import AppConfig
+from kookie.network import NetworkProbe, network_probe_for
+
+
+class _Connector:
+    def __init__(self, reachable: set[tuple[str, int]]):
+        self.reachable = reachable
+        self.calls: list[tuple[str, int]] = []
+
+    def __call__(self, endpoint: tuple[str, int], timeout: float):
+        self.calls.append(endpoint)
+        if endpoint not in self.reachable:
+            raise OSError("unreachable")
+        return self
+
+
+def test_network_probe_is_online_when_any_endpoint_connects() -> None:
+    connector = _Connector({("mirror.local", 8080)})
+    probe = NetworkProbe(["github.com:443", "mirror.local:8080", "[::1]"], connect=connector)
+
+    assert probe.is_online() is True
+    assert sorted(connector.calls) == [("::1", 443), ("github.com", 443), ("mirror.local", 8080)]
+
+
+def test_network_probe_answers_without_waiting_for_slow_endpoints() -> None:
+    release = threading.Event()
+
+    def _connect(endpoint: tuple[str, int], timeout: float):
+        if endpoint == ("slow.local", 443):
+            release.wait(5.0)
+            raise OSError("timed out")
+        return object()
+
+    probe = NetworkProbe(["slow.local:443", "fast.local:443"], connect=_connect)
+    started = time.monotonic()
+    try:
+        assert probe.is_online() is True
+        assert time.monotonic() - started < 2.0
+    finally:
+        release.set()
+
+
+def test_network_probe_caches_result_until_ttl_or_invalidate() -> None:
+    now = [0.0]
+    connector = _Connector(set())
+    probe = NetworkProbe(["github.com:443"], ttl_seconds=30.0, connect=connector, clock=lambda: now[0])
+
+    assert probe.is_online() is False
+    now[0] = 29.0
+    assert probe.is_online() is False
+    assert len(connector.calls) == 1
+
+    connector.reachable.add(("github.com", 443))
+    probe.invalidate()
+    assert probe.is_online() is True
+    now[0] = 70.0
+    assert probe.is_online() is True
+    assert len(connector.calls) == 3
+
+
+def test_network_probe_without_endpoints_is_always_online() -> None:
+    connector = _Connector(set())
+
+    assert NetworkProbe([], connect=connector).is_online() is True
+    assert connector.calls == []
+
+
+def test_network_probe_without_endpoints_probes_the_hosts_being_contacted(monkeypatch) -> None:
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "http_proxy", "https_proxy", "NO_PROXY", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    connector = _Connector({("lan-cache.local", 8080)})
+    probe = NetworkProbe(connect=connector)
+
+    assert probe.is_online(["http://lan-cache.local:8080/model.onnx", "https://github.com/model.onnx"]) is True
+    assert sorted(connector.calls) == [("github.com", 443), ("lan-cache.local", 8080)]
+    assert probe.is_online(["https://github.com/model.onnx"]) is False
+    assert probe.is_online(["file:///srv/cache/model.onnx"]) is True
+
+
+def test_network_probe_checks_the_proxy_a_request_would_use(monkeypatch) -> None:
+    for name in ("HTTP_PROXY", "http_proxy", "NO_PROXY", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("https_proxy", "http://proxy.corp:3128")
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.corp:3128")
+    connector = _Connector({("proxy.corp", 3128)})
+
+    assert NetworkProbe(connect=connector).is_online(["https://github.com/model.onnx"]) is True
+    assert connector.calls == [("proxy.corp", 3128)]
+
+
+def test_network_probe_for_shares_one_probe_per_settings() -> None:
+    config = AppConfig(network_probe_endpoints=("example.test:443",))
+
+    assert network_probe_for(config) is network_probe_for(AppConfig(network_probe_endpoints=("example.test:443",)))
+    assert network_probe_for(AppConfig(network_probe_enabled=False)) is None
@@ -92,3 +92,19 @@ def test_extract_pdf_content_emits_progress(monkeypatch) -> None:
     )
 
     assert events[-1] == (3, 3)
+
+
+def test_extract_pdf_content_builds_page_document(monkeypatch) -> None:
+    class _PyMuPDF:
+        @staticmethod
+        def open(path: str):
+            return _Document(["First. Page.", "", "Third page."])
+
+    monkeypatch.setattr("kookie.pdf_import.importlib.import_module", lambda _: _PyMuPDF())
+
+    result = extract_pdf_content("/tmp/sample.pdf")
+
+    assert result.document is not None
+    assert result.document.buffer == result.text
+    assert result.document.page_numbers == (1, 3)
+    assert result.document.sentences_from_page(3) == ["Third page."]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from kookie.retry import RetryPolicy, retry_call
+from kookie.retry import RetryPolicy, retry_call, retry_within_budget
 
 
 def test_retry_call_succeeds_after_transient_failures() -> None:
@@ -43,3 +43,80 @@ def test_retry_call_raises_after_max_attempts() -> None:
         raise AssertionError("expected retry_call to re-raise after max attempts")
 
     assert attempts["count"] == 3
+
+
+def test_retry_call_stops_on_errors_rejected_by_should_retry() -> None:
+    attempts = {"count": 0}
+    sleeps: list[float] = []
+
+    def _target() -> str:
+        attempts["count"] += 1
+        raise ValueError("permanent")
+
+    try:
+        retry_call(_target, sleeper=sleeps.append, should_retry=lambda exc: not isinstance(exc, ValueError))
+    except ValueError:
+        pass
+    else:  # pragma: no cover - guard
+        raise AssertionError("expected ValueError")
+
+    assert attempts["count"] == 1
+    assert sleeps == []
+
+
+def test_retry_call_stops_when_next_wait_would_exceed_deadline() -> None:
+    attempts = {"count": 0}
+    now = [0.0]
+    sleeps: list[float] = []
+
+    def _target() -> str:
+        attempts["count"] += 1
+        now[0] += 1.0
+        raise RuntimeError("slow failure")
+
+    def _sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    try:
+        retry_call(
+            _target,
+            policy=RetryPolicy(max_attempts=10, base_delay=1.0, factor=2.0, jitter=0.0, deadline_seconds=6.0),
+            sleeper=_sleep,
+            clock=lambda: now[0],
+        )
+    except RuntimeError:
+        pass
+    else:  # pragma: no cover - guard
+        raise AssertionError("expected RuntimeError")
+
+    assert attempts["count"] == 3
+    assert sleeps == [1.0, 2.0]
+
+
+def test_retry_within_budget_hands_each_attempt_the_remaining_budget() -> None:
+    now = [0.0]
+    budgets: list[float | None] = []
+
+    def _target(remaining: float | None) -> str:
+        budgets.append(remaining)
+        now[0] += 1.5
+        raise RuntimeError("slow failure")
+
+    def _sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    try:
+        retry_within_budget(
+            _target,
+            policy=RetryPolicy(max_attempts=10, base_delay=0.5, factor=1.0, jitter=0.0, deadline_seconds=5.0),
+            sleeper=_sleep,
+            clock=lambda: now[0],
+        )
+    except RuntimeError:
+        pass
+    else:  # pragma: no cover - guard
+        raise AssertionError("expected RuntimeError")
+
+    assert budgets == [5.0, 3.0, 1.0]
+    assert retry_within_budget(lambda remaining: remaining) is None
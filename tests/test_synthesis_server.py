@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+
+import numpy as np
+
+from kookie.synthesis_server import AsyncSynthesisServer
+
+
+class _CountingBackend:
+    def __init__(self, samples: int = 4, gate: threading.Event | None = None) -> None:
+        self.samples = samples
+        self.gate = gate
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def synthesize_sentences(self, sentences, voice, speed=1.0):
+        for sentence in sentences:
+            with self._lock:
+                self.calls.append(sentence)
+            if self.gate is not None:
+                self.gate.wait(timeout=2.0)
+            yield np.full(self.samples, 0.25, dtype=np.float32)
+
+
+async def _request(port: int, payload: dict[str, object]) -> tuple[int, bytes]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode("utf-8")
+    writer.write(
+        b"POST /synthesize HTTP/1.1\r\nHost: test\r\nConnection: close\r\n"
+        + f"Content-Length: {len(body)}\r\n\r\n".encode("ascii")
+        + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, rest = response.partition(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    if b"transfer-encoding: chunked" not in head.lower():
+        return status, rest
+    audio = bytearray()
+    while True:
+        size_line, _, rest = rest.partition(b"\r\n")
+        size = int(size_line, 16)
+        if size == 0:
+            return status, bytes(audio)
+        audio.extend(rest[:size])
+        rest = rest[size + 2 :]
+
+
+def test_identical_inflight_requests_share_one_inference() -> None:
+    gate = threading.Event()
+    backend = _CountingBackend(gate=gate)
+
+    async def _scenario() -> list[tuple[int, bytes]]:
+        server = AsyncSynthesisServer(backend, sample_rate=24_000, max_workers=2)
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            requests = [
+                asyncio.ensure_future(_request(port, {"text": "Same sentence. Another one.", "format": "pcm"}))
+                for _ in range(4)
+            ]
+            await asyncio.sleep(0.2)
+            gate.set()
+            return await asyncio.gather(*requests)
+        finally:
+            await server.close()
+
+    responses = asyncio.run(_scenario())
+
+    expected = np.full(8, 0.25 * 32767.0).astype("<i2").tobytes()
+    assert responses == [(200, expected)] * 4
+    assert sorted(backend.calls) == ["Another one.", "Same sentence."]
+
+
+def test_slow_reader_pauses_synthesis_and_bad_requests_are_rejected() -> None:
+    backend = _CountingBackend(samples=1_000_000)
+    sentences = " ".join(f"Sentence number {idx}." for idx in range(30))
+
+    async def _scenario() -> tuple[int, int]:
+        server = AsyncSynthesisServer(backend, sample_rate=24_000, max_workers=2)
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            status, _ = await _request(port, {"text": "   "})
+            assert status == 400
+            for bad_speed in (None, [1.0], "fast"):
+                rejected, _ = await _request(port, {"text": "Hello.", "speed": bad_speed})
+                assert rejected == 400
+
+            _reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=1024)
+            body = json.dumps({"text": sentences, "format": "pcm"}).encode("utf-8")
+            writer.write(f"POST /synthesize HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+            await writer.drain()
+            await asyncio.sleep(1.0)
+            produced = len(backend.calls)
+            writer.close()
+            return status, produced
+        finally:
+            await server.close()
+
+    status, produced = asyncio.run(_scenario())
+
+    assert status == 400
+    assert 0 < produced < 30
+
+
+def test_main_leaves_the_port_to_the_async_server(tmp_path, monkeypatch) -> None:
+    from kookie import synthesis_server
+    from kookie.config import AppConfig
+
+    created: list[dict[str, object]] = []
+    real_create_app = synthesis_server.create_app
+
+    def _create_app(config, **kwargs):
+        created.append(kwargs)
+        return real_create_app(config, **kwargs)
+
+    async def _serve_once(self, host, port):
+        raise KeyboardInterrupt
+
+    config = AppConfig(backend_mode="mock", asset_dir=tmp_path, health_check_enabled=True, health_check_port=0)
+    monkeypatch.setattr(synthesis_server, "load_config", lambda: config)
+    monkeypatch.setattr(synthesis_server, "create_app", _create_app)
+    monkeypatch.setattr(AsyncSynthesisServer, "start", _serve_once)
+
+    assert synthesis_server.main([]) == 0
+    assert created[0]["serve_http"] is False
+    assert created[0]["headless"] is True
+
+
+def test_http10_clients_get_a_closed_connection_unless_they_ask_for_keep_alive() -> None:
+    backend = _CountingBackend()
+
+    async def _exchange(port: int, connection_header: str) -> tuple[bytes, bytes]:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        body = json.dumps({"text": "Hello.", "format": "pcm"}).encode("utf-8")
+        writer.write(
+            f"POST /synthesize HTTP/1.0\r\n{connection_header}Content-Length: {len(body)}\r\n\r\n".encode("ascii")
+            + body
+        )
+        await writer.drain()
+        head = await reader.readuntil(b"\r\n\r\n")
+        try:
+            rest = await asyncio.wait_for(reader.read(), timeout=0.5)
+        except TimeoutError:
+            rest = b"<open>"
+        writer.close()
+        return head, rest
+
+    async def _scenario() -> tuple[tuple[bytes, bytes], tuple[bytes, bytes]]:
+        server = AsyncSynthesisServer(backend, sample_rate=24_000)
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            return await _exchange(port, ""), await _exchange(port, "Connection: keep-alive\r\n")
+        finally:
+            await server.close()
+
+    (plain_head, plain_rest), (kept_head, kept_rest) = asyncio.run(_scenario())
+
+    assert b"connection: close" in plain_head.lower()
+    assert plain_rest.endswith(b"0\r\n\r\n")
+    assert b"connection: close" not in kept_head.lower()
+    assert kept_rest == b"<open>"
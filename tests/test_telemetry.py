@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gzip
 import json
 from pathlib import Path
 
@@ -11,6 +12,7 @@ def test_local_telemetry_writes_events_when_enabled(tmp_path: Path) -> None:
     telemetry = LocalTelemetry(enabled=True, output_path=path)
 
     telemetry.record("play_started", {"voice": "af_sarah"})
+    assert telemetry.flush() is True
 
     payload = json.loads(path.read_text(encoding="utf-8").strip())
     assert payload["event"] == "play_started"
@@ -24,3 +26,37 @@ def test_local_telemetry_is_noop_when_disabled(tmp_path: Path) -> None:
     telemetry.record("play_started", {"voice": "af_sarah"})
 
     assert not path.exists()
+
+
+def test_local_telemetry_batches_and_rotates_with_gzip(tmp_path: Path) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    telemetry = LocalTelemetry(enabled=True, output_path=path, max_bytes=2_000, backup_count=2, compress_rotated=True)
+
+    for batch in range(4):
+        for idx in range(batch * 50, (batch + 1) * 50):
+            telemetry.record("tick", {"idx": idx})
+        assert telemetry.flush() is True
+    telemetry.close()
+
+    rotated = sorted(tmp_path.glob("telemetry.jsonl.*"))
+    assert [item.name for item in rotated] == ["telemetry.jsonl.1.gz", "telemetry.jsonl.2.gz"]
+    newest_rotated = [json.loads(line) for line in gzip.decompress(rotated[0].read_bytes()).splitlines()]
+    current = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()] if path.exists() else []
+    indices = [item["data"]["idx"] for item in newest_rotated + current]
+    assert indices == sorted(indices)
+    assert indices[-1] == 199
+    assert telemetry.dropped == 0
+
+    telemetry.record("after_close")
+    assert telemetry.flush() is True
+
+
+def test_local_telemetry_drops_events_when_queue_is_full(tmp_path: Path, monkeypatch) -> None:
+    # Without a writer thread nothing drains the queue.
+    monkeypatch.setattr(LocalTelemetry, "_start_writer", lambda self: None)
+    telemetry = LocalTelemetry(enabled=True, output_path=tmp_path / "telemetry.jsonl", queue_size=1)
+
+    telemetry.record("one")
+    telemetry.record("two")
+
+    assert telemetry.dropped == 1
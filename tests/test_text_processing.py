@@ -1,6 +1,6 @@
 import re
 
-from kookie.text_processing import normalize_text, split_sentences
+from kookie.text_processing import NormalizedOffsetMap, normalize_text, normalized_offsets, split_sentences
 
 
 def test_normalize_text_collapses_whitespace_and_control_chars() -> None:
@@ -8,6 +8,32 @@ def test_normalize_text_collapses_whitespace_and_control_chars() -> None:
     assert normalize_text(raw) == "Hello world from PDF copy"
 
 
+def test_normalized_offsets_map_each_normalized_char_back_to_the_raw_text() -> None:
+    raw = "  Hello\t\tworld\n\nfrom\u0000 PDF\u200b copy   "
+    normalized = normalize_text(raw)
+    offsets = normalized_offsets(raw)
+
+    assert len(offsets) == len(normalized) + 1
+    for idx, char in enumerate(normalized):
+        assert raw[offsets[idx]] == char or char == " "
+    assert raw[offsets[normalized.index("world")] : offsets[normalized.index("world") + 4] + 1] == "world"
+    assert offsets[-1] == raw.rindex("y") + 1
+
+
+def test_normalized_offset_map_converts_both_ways() -> None:
+    raw = "Chapter one\n\n  Second   line."
+    normalized = normalize_text(raw)
+    mapping = NormalizedOffsetMap(raw)
+
+    start = normalized.index("Second")
+    assert mapping.raw_span(start, start + len("Second")) == (raw.index("Second"), raw.index("Second") + 6)
+    assert mapping.raw_span(start, start) is None
+    assert mapping.normalized_offset(raw.index("Second")) == start
+    # A raw offset inside a collapsed whitespace run lands on the next normalized character.
+    assert normalized[mapping.normalized_offset(raw.index("\n") + 1) :].startswith("Second")
+    assert mapping.normalized_offset(len(raw) + 5) == len(normalized)
+
+
 def test_split_sentences_preserves_order_and_punctuation() -> None:
     text = "Hello world! This is a test. Final question?"
     assert split_sentences(text, max_chars=120) == [
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from kookie.timeline import SentenceTimeline, locate_sentences
+
+
+def test_sentence_timeline_bisects_sample_positions() -> None:
+    timeline = SentenceTimeline()
+    assert timeline.at(0) is None
+
+    timeline.append(100, 0, 10)
+    timeline.append(50, 11, 20)
+    timeline.append(25, 21, 30)
+
+    assert len(timeline) == 3
+    assert timeline.total_samples == 175
+    assert timeline.index_at(0) == 0
+    assert timeline.index_at(99) == 0
+    assert timeline.index_at(100) == 1
+    assert timeline.index_at(174) == 2
+    assert timeline.index_at(10_000) == 2
+    middle = timeline.at(120)
+    assert middle is not None
+    assert (middle.start_sample, middle.end_sample, middle.text_start, middle.text_end) == (100, 150, 11, 20)
+
+    timeline.clear()
+    assert len(timeline) == 0
+
+
+def test_locate_sentences_searches_forward_and_applies_offset() -> None:
+    text = "Go. Stop. Go. Unknown"
+    located = list(locate_sentences(["Go.", "Stop.", "Go.", "Missing."], text, text_offset=5))
+
+    assert located == [
+        ("Go.", (5, 8)),
+        ("Stop.", (9, 14)),
+        ("Go.", (15, 18)),
+        ("Missing.", (18, 18)),
+    ]
+    assert list(locate_sentences(["Go."], None)) == [("Go.", (0, 0))]
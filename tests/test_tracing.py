@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from kookie.controller import PlaybackController
+from kookie.tracing import Tracer, tracer
+
+
+def test_disabled_tracer_records_nothing() -> None:
+    local = Tracer(enabled=False)
+
+    with local.span("noop") as active:
+        active.set(ignored=True)
+
+    assert local.records() == []
+    assert local.span("a") is local.span("b")
+
+
+def test_tracer_ring_buffer_keeps_latest_spans_and_exports_chrome_json(tmp_path: Path) -> None:
+    local = Tracer(enabled=True, capacity=3)
+    for idx in range(5):
+        with local.span("work", "test", index=idx):
+            pass
+    try:
+        with local.span("boom"):
+            raise RuntimeError("fail")
+    except RuntimeError:
+        pass
+
+    records = local.records()
+    assert [record.args.get("index") for record in records] == [3, 4, None]
+    assert records[-1].args["error"] == "RuntimeError"
+
+    output = local.export_chrome_trace(tmp_path / "trace.json")
+    payload = json.loads(output.read_text(encoding="utf-8"))
+    complete = [event for event in payload["traceEvents"] if event["ph"] == "X"]
+    assert [event["name"] for event in complete] == ["work", "work", "boom"]
+    assert all(event["dur"] >= 0 for event in complete)
+    assert any(event["ph"] == "M" and event["name"] == "thread_name" for event in payload["traceEvents"])
+
+
+class _Backend:
+    def synthesize_sentences(self, sentences, voice):
+        for _sentence in sentences:
+            yield np.full(8, 0.1, dtype=np.float32)
+
+
+class _AudioPlayer:
+    def play_from_queue(self, audio_queue, stop_event):
+        while audio_queue.get(timeout=1.0) is not None:
+            pass
+
+
+def test_controller_emits_pipeline_spans_when_tracing_enabled() -> None:
+    tracer.configure(enabled=True)
+    tracer.clear()
+    try:
+        controller = PlaybackController(backend=_Backend(), audio_player=_AudioPlayer())
+        assert controller.start("one. two.") is True
+        controller.wait_until_idle(timeout=2.0)
+        names = [record.name for record in tracer.records()]
+    finally:
+        tracer.configure(enabled=False)
+        tracer.clear()
+
+    assert names.count("normalize") == 1
+    assert names.count("chunk") == 1
+    assert names.count("synthesize_sentence") == 3
+    assert names.count("audio_queue_put") == 2
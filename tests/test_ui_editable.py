@@ -1,5 +1,6 @@
 from kookie.editor_prefs import EditorPreferences
-from kookie.ui import _text_input_config
+from kookie.text_processing import NormalizedOffsetMap
+from kookie.ui import _highlight_rows, _raw_highlight, _text_input_config
 
 
 def test_text_input_config_is_editable() -> None:
@@ -16,3 +17,25 @@ def test_text_input_config_is_editable() -> None:
     assert cfg["background_normal"] == ""
     assert cfg["background_active"] == ""
     assert "background_disabled_active" not in cfg
+
+
+def test_raw_highlight_maps_normalized_spans_onto_raw_editor_text() -> None:
+    raw = "  First line.\n\n   Second   sentence here.\n"
+
+    offsets = NormalizedOffsetMap(raw)
+
+    start = "First line. Second sentence here.".index("Second")
+    span = _raw_highlight(offsets, (start, start + len("Second sentence here.")))
+
+    assert span is not None
+    assert raw[span[0] : span[1]] == "Second   sentence here."
+    assert _raw_highlight(offsets, None) is None
+    assert _raw_highlight(offsets, (0, 500)) is None
+
+
+def test_highlight_rows_cover_the_span_across_display_lines() -> None:
+    lines = ["First line.", "", "Second sentence", "here."]
+
+    assert _highlight_rows(lines, (6, 0), (4, 2)) == [(0, 6, 11), (2, 0, 4)]
+    assert _highlight_rows(lines, (7, 2), (5, 3)) == [(2, 7, 15), (3, 0, 5)]
+    assert _highlight_rows(lines, (3, 0), (3, 0)) == []
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
+import stat
 
-from kookie.update_checker import UpdateInfo, check_for_update
+from kookie.update_checker import UpdateCheck, UpdateInfo, check_for_update, run_update_check
 
 
 class _Response:
@@ -53,3 +55,59 @@ def test_check_for_update_returns_none_when_not_newer() -> None:
     )
 
     assert info is None
+
+
+def test_check_for_update_skips_request_while_offline() -> None:
+    from kookie.network import NetworkProbe
+
+    def _fetcher(*_args, **_kwargs):
+        raise AssertionError("should not fetch while offline")
+
+    def _unreachable(*_args, **_kwargs):
+        raise OSError("no route")
+
+    probe = NetworkProbe(["github.com:443"], connect=_unreachable)
+
+    info = check_for_update(current_version="0.1.0", repo="ematta/kookie", fetcher=_fetcher, network_probe=probe)
+    result = run_update_check(current_version="0.1.0", repo="ematta/kookie", fetcher=_fetcher, network_probe=probe)
+
+    assert info is None
+    assert result == UpdateCheck(skipped=True)
+
+
+def test_check_for_update_revalidates_cached_release_with_etag(tmp_path) -> None:
+    from email.message import Message
+    from urllib.error import HTTPError
+
+    payload = {
+        "tag_name": "v0.3.0",
+        "html_url": "https://github.com/ematta/kookie/releases/tag/v0.3.0",
+        "name": "0.3.0",
+        "prerelease": False,
+        "body": "long release notes",
+    }
+    sent_etags: list[str | None] = []
+
+    class _TaggedResponse(_Response):
+        headers = {"ETag": '"abc"'}
+
+    def _fetcher(request, **_kwargs):
+        sent_etags.append(request.get_header("If-none-match"))
+        if sent_etags[-1] == '"abc"':
+            raise HTTPError(request.full_url, 304, "Not Modified", Message(), None)
+        return _TaggedResponse(payload)
+
+    cache_path = tmp_path / "update_check.json"
+    first = check_for_update(current_version="0.1.0", repo="ematta/kookie", fetcher=_fetcher, cache_path=cache_path)
+    second = check_for_update(current_version="0.1.0", repo="ematta/kookie", fetcher=_fetcher, cache_path=cache_path)
+
+    assert sent_etags == [None, '"abc"']
+    assert first == second
+    assert second is not None and second.version == "0.3.0"
+    cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    assert cached["etag"] == '"abc"'
+    if os.name == "posix":
+        mask = os.umask(0o022)
+        os.umask(mask)
+        assert stat.S_IMODE(cache_path.stat().st_mode) == 0o666 & ~mask
+    assert "body" not in cached["release"]